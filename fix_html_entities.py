@@ -3,76 +3,72 @@
 Fix ALL HTML entities in existing Jekyll posts and JSON data
 """
 
-import re
-import html
+import argparse
 import json
+import re
+import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent / 'scripts'))
+from changed_posts import add_selection_arguments, select_posts
+from post_pool import post_result, process_posts, summarize, write_summary
+from text_normalize import decode_entities
+
+ENTITY = re.compile(r'&[a-zA-Z0-9#]+;')
+
 def comprehensive_entity_fix(text):
     """Apply the same comprehensive entity fixing as the scraper"""
     if not text:
         return text
 
-    # Decode standard HTML entities
-    text = html.unescape(text)
-
-    # Fix bracketed entities
-    text = re.sub(r'\[&#8230;\]', '...', text)
-    text = re.sub(r'\[&hellip;\]', '...', text)
-
-    # Fix numeric entities
-    text = re.sub(r'&#8230;', '...', text)
-    text = re.sub(r'&#8217;', "'", text)
-    text = re.sub(r'&#8216;', "'", text)
-    text = re.sub(r'&#8220;', '"', text)
-    text = re.sub(r'&#8221;', '"', text)
-    text = re.sub(r'&#8211;', '–', text)
-    text = re.sub(r'&#8212;', '—', text)
-    text = re.sub(r'&#38;', '&', text)
-    text = re.sub(r'&#39;', "'", text)
-    text = re.sub(r'&#34;', '"', text)
-    text = re.sub(r'&#60;', '<', text)
-    text = re.sub(r'&#62;', '>', text)
-
-    # Fix named entities
-    text = re.sub(r'&hellip;', '...', text)
-    text = re.sub(r'&rsquo;', "'", text)
-    text = re.sub(r'&lsquo;', "'", text)
-    text = re.sub(r'&rdquo;', '"', text)
-    text = re.sub(r'&ldquo;', '"', text)
-    text = re.sub(r'&ndash;', '–', text)
-    text = re.sub(r'&mdash;', '—', text)
-    text = re.sub(r'&amp;', '&', text)
-    text = re.sub(r'&quot;', '"', text)
-    text = re.sub(r'&apos;', "'", text)
-    text = re.sub(r'&lt;', '<', text)
-    text = re.sub(r'&gt;', '>', text)
-
-    # Clean up any remaining malformed entities
-    text = re.sub(r'&[a-zA-Z0-9#]+;?', ' ', text)
-    text = re.sub(r'\s+', ' ', text).strip()
-
-    return text
-
-def fix_markdown_posts():
-    """Fix HTML entities in Jekyll posts"""
-    posts_dir = Path('_posts')
-    fixed_count = 0
+    # Decode standard and leftover entities in one scan, then clean up whitespace
+    return decode_entities(text)
 
-    for post_file in posts_dir.glob('*.md'):
+def fix_post_file(post_file):
+    """Fix one post and return its result record"""
+    try:
         with open(post_file, 'r', encoding='utf-8') as f:
             content = f.read()
 
         original_content = content
         fixed_content = comprehensive_entity_fix(content)
 
-        if fixed_content != original_content:
-            with open(post_file, 'w', encoding='utf-8') as f:
-                f.write(fixed_content)
-            print(f"✅ Fixed: {post_file.name}")
-            fixed_count += 1
+        if fixed_content == original_content:
+            return post_result(post_file)
 
-    return fixed_count
+        with open(post_file, 'w', encoding='utf-8') as f:
+            f.write(fixed_content)
+
+        entities = len(ENTITY.findall(original_content))
+        fixes = [f"Decoded {entities} entities"] if entities else ["Normalized whitespace"]
+        return post_result(post_file, changed=True, fixes=fixes)
+
+    except Exception as e:
+        return post_result(post_file, error=str(e))
+
+def fix_markdown_posts(workers=1, chunk_size=None, summary_file=None, since=None, files=None):
+    """Fix HTML entities in Jekyll posts (all of them, or just the changed ones)"""
+    posts_dir = Path('_posts')
+
+    try:
+        post_files = select_posts(posts_dir, since, files)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 0
+
+    results = []
+    for result in process_posts(fix_post_file, post_files, workers, chunk_size):
+        if result['error']:
+            print(f"❌ Error fixing {result['file']}: {result['error']}")
+        elif result['changed']:
+            print(f"✅ Fixed: {result['file']}")
+        results.append(result)
+
+    if summary_file:
+        write_summary(results, summary_file, "HTML Entity Fix Summary")
+        print(f"📝 Summary written to {summary_file}")
+
+    return summarize(results)['changed']
 
 def fix_json_data():
     """Fix HTML entities in JSON data files"""
@@ -109,9 +105,19 @@ def fix_json_data():
     return fixed_count
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Fix HTML entities in posts and JSON data')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Worker processes for the posts (0 = one per CPU core)')
+    parser.add_argument('--chunk-size', type=int, default=None,
+                        help='Posts handed to a worker at a time (default: spread evenly)')
+    parser.add_argument('--summary', default=None,
+                        help='Also write a per-post report here')
+    add_selection_arguments(parser)
+    args = parser.parse_args()
+
     print("🧹 Starting comprehensive HTML entity cleanup...")
 
-    md_fixed = fix_markdown_posts()
+    md_fixed = fix_markdown_posts(args.workers, args.chunk_size, args.summary, args.since, args.files)
     json_fixed = fix_json_data()
 
     print(f"\n🎯 Cleanup complete!")
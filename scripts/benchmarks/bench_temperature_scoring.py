@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: NumPy temperature scoring vs the per-celebrity Python loops
+Run from the repository root: python scripts/benchmarks/bench_temperature_scoring.py
+"""
+
+import argparse
+import random
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from temperature_calculator import TemperatureCalculator
+from temperature_vectorized import HAS_NUMPY
+
+def synthetic_buckets(celebrities, posts, days, seed=0):
+    """Daily mention buckets for `posts` random posts naming 1-3 of `celebrities`"""
+    rng = random.Random(seed)
+    today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    counts = defaultdict(lambda: [0, 0])
+
+    for _ in range(posts):
+        day = rng.randrange(days)
+        for celebrity in rng.sample(range(celebrities), rng.randint(1, 3)):
+            bucket = counts[(f'celebrity_{celebrity}', day)]
+            bucket[0] += rng.randint(1, 4)
+            bucket[1] += 1
+
+    celebrity_mentions = defaultdict(list)
+    for (celebrity_id, day), (mentions, hits) in sorted(counts.items()):
+        celebrity_mentions[celebrity_id].append({
+            'date': today - timedelta(days=day),
+            'mentions': mentions,
+            'hits': hits,
+        })
+    return dict(celebrity_mentions)
+
+def bench(func, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+def report(name, python_time, numpy_time, max_diff):
+    print(f"📊 {name}: max difference {max_diff:g}")
+    print(f"   python: {python_time * 1000:9.1f} ms")
+    print(f"   numpy:  {numpy_time * 1000:9.1f} ms")
+    print(f"   speedup: {python_time / numpy_time:.1f}x")
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark temperature scoring backends')
+    parser.add_argument('--celebrities', type=int, default=10000, help='Number of celebrities')
+    parser.add_argument('--posts', type=int, default=100000, help='Number of posts')
+    parser.add_argument('--repeat', type=int, default=3, help='Best-of repetitions')
+    args = parser.parse_args()
+
+    if not HAS_NUMPY:
+        print("⚠️ NumPy is not installed; nothing to compare")
+        return
+
+    celebrity_mentions = synthetic_buckets(args.celebrities, args.posts, days=30)
+    print(f"🎭 {len(celebrity_mentions)} celebrities, {args.posts} posts, "
+          f"{sum(len(b) for b in celebrity_mentions.values())} daily buckets")
+
+    python_calc = TemperatureCalculator(use_numpy=False)
+    numpy_calc = TemperatureCalculator(use_numpy=True)
+
+    python_time, python_temps = bench(lambda: python_calc.calculate_all_temperatures(celebrity_mentions), args.repeat)
+    numpy_time, numpy_temps = bench(lambda: numpy_calc.calculate_all_temperatures(celebrity_mentions), args.repeat)
+    max_diff = max(abs(python_temps[c] - numpy_temps[c]) for c in python_temps)
+    report('temperatures', python_time, numpy_time, max_diff)
+
+    all_temps = list(python_temps.values())
+    python_time, python_statuses = bench(lambda: python_calc.get_temperature_statuses(all_temps), 1)
+    numpy_time, numpy_statuses = bench(lambda: numpy_calc.get_temperature_statuses(all_temps), args.repeat)
+    mismatches = sum(1 for a, b in zip(python_statuses, numpy_statuses) if a != b)
+    report('percentile statuses', python_time, numpy_time, mismatches)
+
+if __name__ == '__main__':
+    main()
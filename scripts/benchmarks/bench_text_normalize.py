@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: single-pass entity decoder vs the old chain of re.sub calls
+Run from the repository root: python scripts/benchmarks/bench_text_normalize.py
+"""
+
+import argparse
+import html
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from text_normalize import decode_entities
+
+def legacy_entity_fix(text):
+    """The cleanup chain clean_text / comprehensive_entity_fix used before text_normalize"""
+    text = html.unescape(text)
+
+    text = re.sub(r'\[&#8230;\]', '...', text)
+    text = re.sub(r'\[&hellip;\]', '...', text)
+
+    text = re.sub(r'&#8230;', '...', text)
+    text = re.sub(r'&#8217;', "'", text)
+    text = re.sub(r'&#8216;', "'", text)
+    text = re.sub(r'&#8220;', '"', text)
+    text = re.sub(r'&#8221;', '"', text)
+    text = re.sub(r'&#8211;', '–', text)
+    text = re.sub(r'&#8212;', '—', text)
+    text = re.sub(r'&#38;', '&', text)
+    text = re.sub(r'&#39;', "'", text)
+    text = re.sub(r'&#34;', '"', text)
+    text = re.sub(r'&#60;', '<', text)
+    text = re.sub(r'&#62;', '>', text)
+
+    text = re.sub(r'&hellip;', '...', text)
+    text = re.sub(r'&rsquo;', "'", text)
+    text = re.sub(r'&lsquo;', "'", text)
+    text = re.sub(r'&rdquo;', '"', text)
+    text = re.sub(r'&ldquo;', '"', text)
+    text = re.sub(r'&ndash;', '–', text)
+    text = re.sub(r'&mdash;', '—', text)
+    text = re.sub(r'&amp;', '&', text)
+    text = re.sub(r'&quot;', '"', text)
+    text = re.sub(r'&apos;', "'", text)
+    text = re.sub(r'&lt;', '<', text)
+    text = re.sub(r'&gt;', '>', text)
+
+    text = re.sub(r'&[a-zA-Z0-9#]+;?', ' ', text)
+    text = re.sub(r'\s+', ' ', text).strip()
+
+    return text
+
+def load_corpus():
+    """Post files plus RSS-style snippets with double-escaped entities"""
+    posts = [p.read_text(encoding='utf-8') for p in sorted(Path('_posts').glob('*.md'))]
+
+    snippets = [
+        "Taylor Swift &amp;#8217;s new album [&#8230;] fans &amp;amp; critics",
+        "Kim&#8217;s &#38;quot;statement&#38;quot; &hellip; read more &raquo;",
+        "Drake &amp;lt;3 &amp;hellip; &#8220;quote&#8221; &nbsp; &bogus",
+        "Plain headline with no entities at all, just   extra   spaces",
+    ] * 500
+
+    return posts, snippets
+
+def bench(func, texts, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for text in texts:
+            func(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark HTML entity cleanup')
+    parser.add_argument('--repeat', type=int, default=5, help='Best-of repetitions')
+    args = parser.parse_args()
+
+    posts, snippets = load_corpus()
+
+    for name, texts in [('posts', posts), ('rss snippets', snippets)]:
+        if not texts:
+            print(f"⚠️ No {name} to benchmark")
+            continue
+
+        mismatches = sum(1 for t in texts if legacy_entity_fix(t) != decode_entities(t))
+        size_mb = sum(len(t.encode('utf-8')) for t in texts) / 1e6
+
+        legacy_time = bench(legacy_entity_fix, texts, args.repeat)
+        single_time = bench(decode_entities, texts, args.repeat)
+
+        print(f"📊 {name}: {len(texts)} strings, {size_mb:.2f} MB, {mismatches} mismatches")
+        print(f"   legacy re.sub chain: {legacy_time * 1000:8.1f} ms ({size_mb / legacy_time:6.1f} MB/s)")
+        print(f"   single pass:         {single_time * 1000:8.1f} ms ({size_mb / single_time:6.1f} MB/s)")
+        print(f"   speedup: {legacy_time / single_time:.1f}x")
+
+if __name__ == '__main__':
+    main()
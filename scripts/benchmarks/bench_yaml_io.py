@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: pure-Python PyYAML vs the libyaml path in yaml_io, on the real
+_data files and every post's front matter
+Run from the repository root: python scripts/benchmarks/bench_yaml_io.py
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import yaml
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import yaml_io
+from post_reader import scan_front_matter
+
+def load_corpus():
+    """Raw _data documents and raw post front matter blocks that parse"""
+    data_files = []
+    for path in sorted(Path('_data').glob('*.yml')):
+        text = path.read_text(encoding='utf-8')
+        try:
+            yaml.safe_load(text)
+        except yaml.YAMLError:
+            continue
+        data_files.append(text)
+
+    front_matters = []
+    for path in sorted(Path('_posts').glob('*.md')):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                raw, _ = scan_front_matter(f)
+            if isinstance(yaml.safe_load(raw), dict):
+                front_matters.append(raw)
+        except (ValueError, yaml.YAMLError):
+            continue
+
+    return data_files, front_matters
+
+def bench(func, items, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for item in items:
+            func(item)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def report(label, legacy_time, fast_time):
+    print(f"   {label}")
+    print(f"      pure Python: {legacy_time * 1000:8.1f} ms")
+    print(f"      yaml_io:     {fast_time * 1000:8.1f} ms ({legacy_time / fast_time:.1f}x)")
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark YAML loading and dumping')
+    parser.add_argument('--repeat', type=int, default=3, help='Best-of repetitions')
+    args = parser.parse_args()
+
+    print(f"⚙️ libyaml available: {yaml_io.HAS_LIBYAML}")
+    data_files, front_matters = load_corpus()
+
+    for name, texts in [('_data files', data_files), ('post front matter', front_matters)]:
+        if not texts:
+            print(f"⚠️ No {name} to benchmark")
+            continue
+
+        documents = [yaml.safe_load(t) for t in texts]
+        mismatches = sum(1 for t, d in zip(texts, documents) if yaml_io.load(t) != d)
+        size_mb = sum(len(t.encode('utf-8')) for t in texts) / 1e6
+        print(f"📊 {name}: {len(texts)} documents, {size_mb:.2f} MB, {mismatches} load mismatches")
+
+        report('load', bench(yaml.safe_load, texts, args.repeat), bench(yaml_io.load, texts, args.repeat))
+
+        if name == '_data files':
+            legacy_dump = lambda d: yaml.dump(d, default_flow_style=False, sort_keys=True)
+            report('dump', bench(legacy_dump, documents, args.repeat),
+                   bench(yaml_io.dump, documents, args.repeat))
+        else:
+            legacy_dump = lambda d: yaml.dump(d, default_flow_style=False)
+            unchanged = sum(1 for t, d in zip(texts, documents)
+                            if yaml_io.dump_front_matter(d) == t.lstrip('\n'))
+            report('dump (old tag_cleanup layout vs scraper layout)',
+                   bench(legacy_dump, documents, args.repeat),
+                   bench(yaml_io.dump_front_matter, documents, args.repeat))
+            print(f"   🔁 {unchanged}/{len(texts)} front matter blocks re-dump byte-identical")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Bluesky Post Payload
+Builds the text, link facets and canonical URL for a post's Bluesky share.
+The scraper queues the result with each post it writes (and the post index
+keeps one per post), so the poster only reads a ready-made payload.
+"""
+
+import hashlib
+import re
+
+SITE_URL = "https://thegossroom.com"
+MAX_POST_LENGTH = 300
+URL_PATTERN = re.compile(r'https?://[^\s]+')
+
+def generate_post_url(filename):
+    """Generate Jekyll post URL from filename - /YYYY/MM/DD/post-name/ format"""
+
+    if not filename.endswith('.md'):
+        return SITE_URL
+
+    name_without_ext = filename[:-3]  # Remove .md
+
+    if len(name_without_ext) < 10:
+        return SITE_URL
+
+    date_part = name_without_ext[:10]  # 2025-08-02
+    slug_part = name_without_ext[11:]  # post-name
+
+    try:
+        year, month, day = date_part.split('-')
+
+        # 🎯 FIX: Clean slug properly
+        clean_slug = slug_part.rstrip('-').rstrip('_')
+        clean_slug = re.sub(r'-+', '-', clean_slug)
+        clean_slug = clean_slug.strip('-')
+
+        if not clean_slug:
+            clean_slug = "post"
+
+        return f"{SITE_URL}/{year}/{month}/{day}/{clean_slug}/"
+    except ValueError:
+        return SITE_URL
+
+def create_facets_for_urls(text):
+    """Create facets for clickable URLs in Bluesky posts
+
+    Byte offsets are accumulated in one left-to-right pass, each stretch of
+    text encoded once, rather than re-encoding the prefix for every URL.
+    """
+    facets = []
+    byte_offset = 0
+    char_offset = 0
+
+    for match in URL_PATTERN.finditer(text):
+        byte_start = byte_offset + len(text[char_offset:match.start()].encode('utf-8'))
+        byte_end = byte_start + len(match.group().encode('utf-8'))
+        byte_offset, char_offset = byte_end, match.end()
+
+        facets.append({
+            "index": {
+                "byteStart": byte_start,
+                "byteEnd": byte_end
+            },
+            "features": [{
+                "$type": "app.bsky.richtext.facet#link",
+                "uri": match.group()
+            }]
+        })
+
+    return facets
+
+def drama_label(drama_score):
+    if drama_score >= 40:
+        return "🔥🔥🔥 EXPLOSIVE"
+    if drama_score >= 25:
+        return "🔥🔥 HOT DRAMA"
+    if drama_score >= 15:
+        return "🔥 HEATING UP"
+    if drama_score >= 10:
+        return "🎭 DRAMA ALERT"
+    return "📰 BREAKING"
+
+def hashtags_for(tags):
+    """Hashtag-friendly versions of the article's tags (alphanumerics only, 3+ chars)"""
+    hashtags = []
+    for tag in tags or []:
+        clean_tag = ''.join(c for c in str(tag) if c.isalnum())
+        if len(clean_tag) > 2:  # Only use meaningful tags
+            hashtags.append(f"#{clean_tag}")
+    return hashtags
+
+def fit_hashtags(hashtags, remaining_chars):
+    """The hashtag line for the space left: all of them if they fit, else the leading run that does"""
+    total = 0
+    fitting = None
+    for i, hashtag in enumerate(hashtags):
+        total += len(hashtag) + 1  # +1 for space
+        if fitting is None and total > remaining_chars:
+            fitting = i
+
+    if total - 1 <= remaining_chars:
+        return " ".join(hashtags)
+    return " ".join(hashtags[:fitting])
+
+def create_post_text(gossip):
+    """Create engaging Bluesky post text with dynamic tags from the article"""
+    celebrity = gossip['primary_celebrity'].replace('_', ' ').title() if gossip['primary_celebrity'] else "Celebrity"
+
+    # Build post text
+    post_text = f"{drama_label(gossip['drama_score'])}\n\n"
+
+    if celebrity != "Celebrity":
+        post_text += f"🎯 {celebrity}\n"
+
+    post_text += f"📊 Drama Score: {gossip['drama_score']}\n\n"
+
+    # Add title (truncated if needed)
+    title = gossip['title'][:100] + "..." if len(gossip['title']) > 100 else gossip['title']
+    post_text += f"📰 {title}\n\n"
+
+    # Add direct post URL
+    post_text += f"{gossip['post_url']}\n\n"
+
+    # DYNAMIC TAGS: Use article's actual tags, as many as fit in the limit
+    hashtags = hashtags_for(gossip.get('tags'))
+    if hashtags:
+        post_text += fit_hashtags(hashtags, MAX_POST_LENGTH - len(post_text))
+
+    # Ensure we're under 300 characters
+    return post_text[:MAX_POST_LENGTH]
+
+def content_sha1(raw):
+    """Hash of a post file's bytes, as stored in the post index"""
+    return hashlib.sha1(raw).hexdigest()
+
+def build_payload(filename, front_matter):
+    """{'title', 'post_url', 'text', 'facets'} for a post, from its filename and front matter"""
+    drama_score = front_matter.get('drama_score', 0)
+    tags = front_matter.get('tags') or []
+    post_url = generate_post_url(filename)
+
+    title = str(front_matter.get('title') or '')
+    text = create_post_text({
+        'title': title,
+        'drama_score': drama_score if isinstance(drama_score, (int, float)) else 0,
+        'primary_celebrity': str(front_matter.get('primary_celebrity') or ''),
+        'tags': tags if isinstance(tags, list) else [tags],
+        'post_url': post_url,
+    })
+
+    return {'title': title, 'post_url': post_url, 'text': text, 'facets': create_facets_for_urls(text)}
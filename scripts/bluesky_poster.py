@@ -4,24 +4,82 @@ High-Frequency Bluesky Gossip Poster - Posts twice per hour
 Prioritizes: 1) Hottest drama score, 2) Newest posts
 """
 
+import argparse
 import requests
-import yaml
-import json
 import os
-import re
-from datetime import datetime, timedelta
+import time
+from datetime import datetime
 from pathlib import Path
 
+from bluesky_payload import content_sha1, create_facets_for_urls
+from bluesky_session import SESSION_FILENAME, SessionCache, token_is_fresh
+from post_index import PostIndex, open_post_index
+from post_queue import CandidateQueue
+from posted_store import PostedStore
+
+# Lowest drama score worth posting (accepts lower scores for high-frequency posting)
+MIN_DRAMA_SCORE = 5
+
+class TokenBucket:
+    """Paces batch posts: `capacity` may go out back to back, then `rate` per second"""
+
+    def __init__(self, rate, capacity=1):
+        self.rate = rate
+        self.capacity = max(capacity, 1)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def acquire(self):
+        """Take one token, sleeping until one is available"""
+        while True:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            time.sleep((1 - self.tokens) / self.rate)
+
+def positive_float(value):
+    """argparse type for rates: a float greater than zero"""
+    number = float(value)
+    if not number > 0:
+        raise argparse.ArgumentTypeError(f"must be greater than 0, got {value}")
+    return number
+
 class HighFrequencyGossipPoster:
     def __init__(self):
-        self.base_url = "https://bsky.social/xrpc"
+        # Overridable so the poster can be pointed at scripts/bluesky_stub_server.py
+        self.base_url = os.getenv('BLUESKY_BASE_URL', "https://bsky.social/xrpc")
         self.handle = os.getenv('BLUESKY_HANDLE')
         self.password = os.getenv('BLUESKY_PASSWORD')
         self.session = None
         self.base_path = Path.cwd()
 
+        # One keep-alive connection pool for login, refresh and every post
+        self.http = requests.Session()
+
+        # Tokens from the last login; never commit this file
+        self.session_cache = SessionCache(os.getenv('BLUESKY_SESSION_FILE')
+                                          or self.base_path / 'data' / SESSION_FILENAME)
+        self.posted_items = None
+        self.candidate_queue = None
+
     def authenticate(self):
-        """Authenticate with Bluesky API"""
+        """Reuse the cached session, else refresh it, else log in with the password"""
+        cached = self.session_cache.load(self.handle)
+        if cached:
+            if token_is_fresh(cached['accessJwt']):
+                self.session = cached
+                print("✅ Reusing cached Bluesky session")
+                return True
+            if self.refresh_session(cached):
+                return True
+
+        return self.login()
+
+    def login(self):
+        """Create a new session with the handle and app password"""
         if not self.handle or not self.password:
             print("❌ Bluesky credentials not configured")
             return False
@@ -32,11 +90,12 @@ class HighFrequencyGossipPoster:
         }
 
         try:
-            response = requests.post(f"{self.base_url}/com.atproto.server.createSession", 
+            response = self.http.post(f"{self.base_url}/com.atproto.server.createSession", 
                                    json=auth_data, timeout=30)
 
             if response.status_code == 200:
                 self.session = response.json()
+                self.session_cache.save(self.session)
                 print("✅ Bluesky authentication successful")
                 return True
             else:
@@ -46,221 +105,125 @@ class HighFrequencyGossipPoster:
             print(f"❌ Bluesky auth error: {e}")
             return False
 
-    def load_posted_tracking(self):
-        """Load list of already posted items"""
-        posted_file = self.base_path / '_data' / 'bluesky_posted.yml'
-        if posted_file.exists():
-            try:
-                with open(posted_file, 'r') as f:
-                    return yaml.safe_load(f) or []
-            except:
-                return []
-        return []
-
-    def save_posted_tracking(self, posted_items):
-        """Save updated posted tracking"""
-        posted_file = self.base_path / '_data' / 'bluesky_posted.yml'
-        posted_file.parent.mkdir(exist_ok=True)
-
-        # Keep only last 300 items for high-frequency posting
-        posted_items = posted_items[-300:]
-
-        with open(posted_file, 'w') as f:
-            yaml.dump(posted_items, f, default_flow_style=False)
-
-    def generate_post_url(self, filename):
-        """Generate Jekyll post URL from filename - /YYYY/MM/DD/post-name/ format"""
-
-        if not filename.endswith('.md'):
-            return "https://thegossroom.com"
-
-        name_without_ext = filename[:-3]  # Remove .md
+    def refresh_session(self, session):
+        """Trade the refresh token for a new token pair"""
+        try:
+            response = self.http.post(f"{self.base_url}/com.atproto.server.refreshSession",
+                                    headers={"Authorization": f"Bearer {session['refreshJwt']}"},
+                                    timeout=30)
+        except Exception as e:
+            print(f"⚠️ Bluesky session refresh error: {e}")
+            return False
 
-        if len(name_without_ext) < 10:
-            return "https://thegossroom.com"
+        if response.status_code != 200:
+            print(f"⚠️ Bluesky session refresh failed: {response.status_code}")
+            self.session_cache.clear()
+            return False
 
-        date_part = name_without_ext[:10]  # 2025-08-02
-        slug_part = name_without_ext[11:]  # post-name
+        self.session = response.json()
+        self.session_cache.save(self.session)
+        print("🔄 Refreshed Bluesky session")
+        return True
 
+    def token_rejected(self, response):
+        """Whether the server turned the request down because of the access token"""
+        if response.status_code == 401:
+            return True
+        if response.status_code != 400:
+            return False
         try:
-            year, month, day = date_part.split('-')
-
-            # 🎯 FIX: Clean slug properly
-            clean_slug = slug_part.rstrip('-').rstrip('_')
-            clean_slug = re.sub(r'-+', '-', clean_slug)
-            clean_slug = clean_slug.strip('-')
-
-            if not clean_slug:
-                clean_slug = "post"
-
-            return f"https://thegossroom.com/{year}/{month}/{day}/{clean_slug}/"
-        except:
-            return "https://thegossroom.com"
-
-    def create_facets_for_urls(self, text):
-        """Create facets for clickable URLs in Bluesky posts"""
-        url_pattern = r'https?://[^\s]+'
-        urls = list(re.finditer(url_pattern, text))
-
-        facets = []
-        for match in urls:
-            facets.append({
-                "index": {
-                    "byteStart": len(text[:match.start()].encode('utf-8')),
-                    "byteEnd": len(text[:match.end()].encode('utf-8'))
-                },
-                "features": [{
-                    "$type": "app.bsky.richtext.facet#link",
-                    "uri": match.group()
-                }]
-            })
-
-        return facets
+            return response.json().get('error') in ('ExpiredToken', 'InvalidToken')
+        except ValueError:
+            return False
+
+    def load_posted_tracking(self):
+        """Set-like store of already posted items (migrates the old _data YAML lists)"""
+        return PostedStore(self.base_path / 'data', self.base_path / '_data')
+
+    def load_candidate_queue(self, posted_items):
+        """Open the candidate queue, seeding it from the post index if it has no file yet"""
+        queue = CandidateQueue(self.base_path / 'data')
+        if not queue.exists():
+            with open_post_index(self.base_path) as post_index:
+                seeded = queue.seed(post_index, posted_items, min_score=MIN_DRAMA_SCORE)
+            # Written even when empty, so later runs (and the scraper) use the file instead of re-seeding
+            queue.save()
+            print(f"📥 Seeded candidate queue with {seeded} recent posts")
+        return queue
 
     def find_best_gossip(self):
-        """Find best unposted gossip: HOTTEST first, then NEWEST"""
-        posted_items = self.load_posted_tracking()
+        """Find best unposted gossip: HOTTEST first, then NEWEST, from the last 72 hours
+
+        Called repeatedly in batch mode; each call returns the next item.
+        """
         posts_dir = self.base_path / '_posts'
 
         if not posts_dir.exists():
             print("📁 No _posts directory found")
             return None
 
-        candidates = []
+        if self.posted_items is None:
+            self.posted_items = self.load_posted_tracking()
+        posted_items = self.posted_items
 
-        # Check posts from last 72 hours for high-frequency posting
-        cutoff_time = datetime.now() - timedelta(hours=72)
+        # Popped entries stay popped only once the queue is saved (after a successful post)
+        if self.candidate_queue is None:
+            self.candidate_queue = self.load_candidate_queue(posted_items)
 
-        for post_file in posts_dir.glob('*.md'):
-            if post_file.name in posted_items:
-                continue
+        while True:
+            entry = self.candidate_queue.pop(min_score=MIN_DRAMA_SCORE)
+            if entry is None:
+                print("📭 No eligible gossip found")
+                return None
 
-            try:
-                with open(post_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-
-                if content.startswith('---'):
-                    # Parse front matter
-                    parts = content.split('---', 2)
-                    if len(parts) >= 2:
-                        front_matter = yaml.safe_load(parts[1])
-
-                        drama_score = front_matter.get('drama_score', 0)
-                        post_date = front_matter.get('date')
-
-                        # Lower threshold for high-frequency posting
-                        if drama_score >= 5:  # Accept lower drama scores
-                            # Parse date for sorting
-                            try:
-                                if isinstance(post_date, str):
-                                    post_datetime = datetime.fromisoformat(post_date.replace('Z', '+00:00'))
-                                else:
-                                    post_datetime = post_date or datetime.now()
-                            except:
-                                post_datetime = datetime.now()
-
-                            candidates.append({
-                                'file': post_file.name,
-                                'title': front_matter.get('title', ''),
-                                'drama_score': drama_score,
-                                'post_date': post_datetime,
-                                'primary_celebrity': front_matter.get('primary_celebrity', ''),
-                                'source_url': front_matter.get('source_url', ''),
-                                'tags': front_matter.get('tags', []),
-                                'excerpt': front_matter.get('excerpt', ''),
-                                'post_url': self.generate_post_url(post_file.name)
-                            })
-
-            except Exception as e:
-                print(f"⚠️ Error parsing {post_file.name}: {e}")
+            if entry['file'] in posted_items:
                 continue
 
-        if not candidates:
-            print("📭 No eligible gossip found")
-            return None
-
-        # SORT BY: 1) Drama Score (DESC), 2) Date (DESC - newest first)
-        candidates.sort(key=lambda x: (-x['drama_score'], -x['post_date'].timestamp()))
+            payload = self.queued_payload(posts_dir / entry['file'], entry['payload'])
+            if payload:
+                break
+
+        best_gossip = {
+            'file': entry['file'],
+            'title': payload.get('title', ''),
+            'drama_score': entry['drama_score'],
+            'post_date': entry['post_date'],
+            'post_url': payload['post_url'],
+            'payload': payload
+        }
 
-        best_gossip = candidates[0]
         print(f"🎯 Selected: Score {best_gossip['drama_score']}, Date {best_gossip['post_date'].strftime('%Y-%m-%d %H:%M')}")
         print(f"🔗 Direct link: {best_gossip['post_url']}")
 
         return best_gossip
 
-    def create_bluesky_post(self, gossip):
-        """Create engaging Bluesky post text with dynamic tags from the article"""
-        celebrity = gossip['primary_celebrity'].replace('_', ' ').title() if gossip['primary_celebrity'] else "Celebrity"
-
-        # Drama level indicators
-        if gossip['drama_score'] >= 40:
-            drama_emoji = "🔥🔥🔥 EXPLOSIVE"
-        elif gossip['drama_score'] >= 25:
-            drama_emoji = "🔥🔥 HOT DRAMA"
-        elif gossip['drama_score'] >= 15:
-            drama_emoji = "🔥 HEATING UP"
-        elif gossip['drama_score'] >= 10:
-            drama_emoji = "🎭 DRAMA ALERT"
-        else:
-            drama_emoji = "📰 BREAKING"
-
-        # Build post text
-        post_text = f"{drama_emoji}\n\n"
-
-        if celebrity != "Celebrity":
-            post_text += f"🎯 {celebrity}\n"
-
-        post_text += f"📊 Drama Score: {gossip['drama_score']}\n\n"
-
-        # Add title (truncated if needed)
-        title = gossip['title'][:100] + "..." if len(gossip['title']) > 100 else gossip['title']
-        post_text += f"📰 {title}\n\n"
-
-        # Add direct post URL
-        post_text += f"{gossip['post_url']}\n\n"
-
-        # DYNAMIC TAGS: Use article's actual tags
-        if gossip.get('tags') and len(gossip['tags']) > 0:
-            hashtags = []
-            for tag in gossip['tags']:
-                # Clean up tag: remove spaces, special chars, make hashtag-friendly
-                clean_tag = tag.replace(' ', '').replace('-', '').replace('_', '')
-                clean_tag = ''.join(c for c in clean_tag if c.isalnum())
-                if clean_tag and len(clean_tag) > 2:  # Only use meaningful tags
-                    hashtags.append(f"#{clean_tag}")
-
-            # Add hashtags if we have any, respecting 300 char limit
-            if hashtags:
-                hashtag_text = " ".join(hashtags)
-                # Check if adding hashtags would exceed 300 chars
-                if len(post_text + hashtag_text) <= 300:
-                    post_text += hashtag_text
-                else:
-                    # Add as many hashtags as fit
-                    remaining_chars = 300 - len(post_text)
-                    current_length = 0
-                    used_hashtags = []
-
-                    for hashtag in hashtags:
-                        if current_length + len(hashtag) + 1 <= remaining_chars:  # +1 for space
-                            used_hashtags.append(hashtag)
-                            current_length += len(hashtag) + 1
-                        else:
-                            break
-
-                    if used_hashtags:
-                        post_text += " ".join(used_hashtags)
-
-        # Ensure we're under 300 characters
-        return post_text[:300]
-
-    def post_to_bluesky(self, text):
+    def queued_payload(self, post_path, payload):
+        """The payload queued with a post if the file is unchanged since, else one rebuilt from the file
+
+        Returns None when the post is gone or can't be parsed.
+        """
+        try:
+            sha1 = content_sha1(post_path.read_bytes())
+        except OSError:
+            return None
+        if payload and payload.get('sha1') == sha1:
+            return payload
+
+        # Queued without a payload, or edited since: re-index just this post
+        with PostIndex(self.base_path) as post_index:
+            post = post_index.post(post_path.name)
+        if not post or not post['bluesky_payload']:
+            return None
+        return dict(post['bluesky_payload'], sha1=post['sha1'])
+
+    def post_to_bluesky(self, text, facets=None):
         """Post content to Bluesky with clickable links using facets"""
         if not self.session:
             return False
 
-        # Create facets for clickable URLs
-        facets = self.create_facets_for_urls(text)
+        # Create facets for clickable URLs (the stored payload already has them)
+        if facets is None:
+            facets = create_facets_for_urls(text)
 
         post_data = {
             "repo": self.session["did"],
@@ -276,14 +239,13 @@ class HighFrequencyGossipPoster:
         if facets:
             post_data["record"]["facets"] = facets
 
-        headers = {
-            "Authorization": f"Bearer {self.session['accessJwt']}",
-            "Content-Type": "application/json"
-        }
-
         try:
-            response = requests.post(f"{self.base_url}/com.atproto.repo.createRecord",
-                                   json=post_data, headers=headers, timeout=30)
+            response = self.create_record(post_data)
+
+            # A cached token the server no longer accepts: refresh (or log in again) once and retry
+            if self.token_rejected(response) and (self.refresh_session(self.session) or self.login()):
+                post_data["repo"] = self.session["did"]
+                response = self.create_record(post_data)
 
             if response.status_code == 200:
                 print("✅ Successfully posted to Bluesky with clickable links")
@@ -296,31 +258,71 @@ class HighFrequencyGossipPoster:
             print(f"❌ Bluesky post error: {e}")
             return False
 
-    def run(self):
-        """Main high-frequency posting process"""
-        print("🎭 Starting High-Frequency Bluesky Gossip Poster...")
+    def create_record(self, post_data):
+        headers = {
+            "Authorization": f"Bearer {self.session['accessJwt']}",
+            "Content-Type": "application/json"
+        }
+        return self.http.post(f"{self.base_url}/com.atproto.repo.createRecord",
+                              json=post_data, headers=headers, timeout=30)
 
-        if not self.authenticate():
-            return
+    def run(self, batch_size=1, per_minute=6, burst=1):
+        """Main high-frequency posting process
 
-        best_gossip = self.find_best_gossip()
-        if not best_gossip:
-            print("📭 No gossip to post (all recent posts already shared)")
-            return
+        Posts up to `batch_size` items, hottest first, paced to `per_minute`
+        after an initial `burst`. Each success is recorded before the next
+        post, so a batch that stops part way never re-posts on the next run.
+        """
+        print("🎭 Starting High-Frequency Bluesky Gossip Poster...")
 
-        print(f"🎯 Found gossip: {best_gossip['title'][:50]}... (Score: {best_gossip['drama_score']})")
+        if not self.authenticate():
+            return 0
 
-        post_text = self.create_bluesky_post(best_gossip)
+        bucket = TokenBucket(per_minute / 60, burst)
+        posted_count = 0
 
-        if self.post_to_bluesky(post_text):
-            # Mark as posted
-            posted_items = self.load_posted_tracking()
-            posted_items.append(best_gossip['file'])
-            self.save_posted_tracking(posted_items)
-            print(f"🎉 Posted to Bluesky: {best_gossip['title'][:50]}...")
-        else:
-            print("❌ Failed to post to Bluesky")
+        try:
+            while posted_count < batch_size:
+                best_gossip = self.find_best_gossip()
+                if not best_gossip:
+                    if not posted_count:
+                        print("📭 No gossip to post (all recent posts already shared)")
+                    break
+
+                print(f"🎯 Found gossip: {best_gossip['title'][:50]}... (Score: {best_gossip['drama_score']})")
+
+                payload = best_gossip['payload']
+
+                bucket.acquire()
+                if not self.post_to_bluesky(payload['text'], payload['facets']):
+                    # Put it back for the next run and stop; the server is likely refusing everything
+                    self.candidate_queue.push(best_gossip['file'], best_gossip['drama_score'],
+                                              best_gossip['post_date'], payload)
+                    self.candidate_queue.save()
+                    print("❌ Failed to post to Bluesky")
+                    break
+
+                # Mark as posted
+                self.posted_items.add(best_gossip['file'])
+                self.candidate_queue.save()
+                posted_count += 1
+                print(f"🎉 Posted to Bluesky: {best_gossip['title'][:50]}...")
+        finally:
+            self.http.close()
+
+        if batch_size > 1:
+            print(f"📦 Batch finished: {posted_count}/{batch_size} posted")
+        return posted_count
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='High-Frequency Bluesky Gossip Poster')
+    parser.add_argument('--batch', type=int, default=1,
+                       help='Post up to N items in one run (drains a backlog after downtime)')
+    parser.add_argument('--per-minute', type=positive_float, default=6,
+                       help='Batch pacing: sustained posts per minute')
+    parser.add_argument('--burst', type=int, default=1,
+                       help='Batch pacing: posts allowed back to back before pacing starts')
+    args = parser.parse_args()
+
     poster = HighFrequencyGossipPoster()
-    poster.run()
+    poster.run(batch_size=max(args.batch, 1), per_minute=args.per_minute, burst=args.burst)
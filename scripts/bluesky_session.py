@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Bluesky Session Cache
+Keeps the accessJwt/refreshJwt pair from the last login in a local state
+file so the poster can reuse or refresh it instead of logging in with the
+password on every run
+"""
+
+import base64
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+
+SESSION_FILENAME = '.bluesky_session.json'
+
+# Treat a token as expired this many seconds early, so it can't lapse mid-request
+EXPIRY_MARGIN = 120
+
+def jwt_expiry(token):
+    """The `exp` claim of a JWT (epoch seconds), or None if it can't be read
+
+    Only decodes the payload; the server is the one that verifies it.
+    """
+    try:
+        payload = token.split('.')[1]
+        payload += '=' * (-len(payload) % 4)
+        return int(json.loads(base64.urlsafe_b64decode(payload))['exp'])
+    except (AttributeError, IndexError, KeyError, TypeError, ValueError):
+        return None
+
+def token_is_fresh(token, now=None):
+    expiry = jwt_expiry(token)
+    return expiry is not None and expiry - EXPIRY_MARGIN > (now or time.time())
+
+class SessionCache:
+    """The saved createSession/refreshSession response for one handle"""
+
+    def __init__(self, path=None):
+        self.path = Path(path) if path else Path('data') / SESSION_FILENAME
+
+    def load(self, handle):
+        """Saved session for `handle`, or None"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                session = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(session, dict) or not session.get('accessJwt') or not session.get('refreshJwt'):
+            return None
+        if handle and session.get('handle') and session['handle'] != handle:
+            return None
+        return session
+
+    def save(self, session):
+        """Write the session atomically, readable only by this user"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=self.path.name, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(session, f)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def clear(self):
+        try:
+            self.path.unlink()
+        except OSError:
+            pass
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Bluesky Stub XRPC Server
+Offline stand-in for bsky.social implementing createSession, refreshSession
+and createRecord, so the poster's login / token reuse / refresh flow can be
+exercised without real credentials or network access.
+
+    python scripts/bluesky_stub_server.py --access-ttl 150 &
+    BLUESKY_BASE_URL=http://127.0.0.1:8787/xrpc BLUESKY_HANDLE=stub.test \\
+        BLUESKY_PASSWORD=anything python scripts/bluesky_poster.py
+
+GET /stats returns how many times each endpoint was called and how many
+connections were opened.
+"""
+
+import argparse
+import base64
+import json
+import secrets
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+def make_jwt(subject, scope, ttl):
+    """Unsigned-looking JWT with the claims the poster reads (only `exp` matters)"""
+    def encode(data):
+        return base64.urlsafe_b64encode(json.dumps(data).encode()).rstrip(b'=').decode()
+
+    now = int(time.time())
+    header = encode({'alg': 'HS256', 'typ': 'JWT'})
+    payload = encode({'sub': subject, 'scope': scope, 'iat': now, 'exp': now + ttl,
+                      'jti': secrets.token_hex(8)})
+    return f"{header}.{payload}.{secrets.token_hex(16)}"
+
+class StubState:
+    """Issued tokens and call counts, shared by the handler threads"""
+
+    def __init__(self, access_ttl, refresh_ttl, password=None):
+        self.access_ttl = access_ttl
+        self.refresh_ttl = refresh_ttl
+        self.password = password
+        self.lock = threading.Lock()
+        self.tokens = {}   # token -> (kind, handle, expiry)
+        self.calls = Counter()
+        self.records = []
+        self.connections = 0
+
+    def issue_session(self, handle):
+        did = f"did:plc:{base64.b32encode(handle.encode()).decode().lower().rstrip('=')[:24]}"
+        access = make_jwt(did, 'com.atproto.access', self.access_ttl)
+        refresh = make_jwt(did, 'com.atproto.refresh', self.refresh_ttl)
+        now = time.time()
+        self.tokens[access] = ('access', handle, now + self.access_ttl)
+        self.tokens[refresh] = ('refresh', handle, now + self.refresh_ttl)
+        return {'did': did, 'handle': handle, 'accessJwt': access, 'refreshJwt': refresh}
+
+    def check_token(self, token, kind):
+        """(handle, None) for a live token of this kind, else (None, error name)"""
+        issued = self.tokens.get(token)
+        if not issued or issued[0] != kind:
+            return None, 'InvalidToken'
+        if issued[2] <= time.time():
+            return None, 'ExpiredToken'
+        return issued[1], None
+
+class StubHandler(BaseHTTPRequestHandler):
+    # Keep-alive, so /stats shows whether the poster reuses its connection
+    protocol_version = 'HTTP/1.1'
+    state = None
+
+    def setup(self):
+        super().setup()
+        with self.state.lock:
+            self.state.connections += 1
+
+    def log_message(self, format, *args):
+        print(f"🧪 {self.address_string()} {format % args}")
+
+    def send_json(self, status, body):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def bearer(self):
+        auth = self.headers.get('Authorization', '')
+        return auth[len('Bearer '):] if auth.startswith('Bearer ') else ''
+
+    def read_json(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        try:
+            return json.loads(self.rfile.read(length) or b'{}')
+        except ValueError:
+            return {}
+
+    def do_GET(self):
+        if self.path == '/stats':
+            with self.state.lock:
+                self.send_json(200, {'calls': dict(self.state.calls), 'records': len(self.state.records),
+                                     'connections': self.state.connections})
+            return
+        self.send_json(404, {'error': 'MethodNotImplemented'})
+
+    def do_POST(self):
+        method = self.path.rsplit('/', 1)[-1]
+        state = self.state
+
+        with state.lock:
+            state.calls[method] += 1
+
+            if method == 'com.atproto.server.createSession':
+                body = self.read_json()
+                if not body.get('identifier') or not body.get('password') or (
+                        state.password and body['password'] != state.password):
+                    self.send_json(401, {'error': 'AuthenticationRequired', 'message': 'Invalid identifier or password'})
+                    return
+                self.send_json(200, state.issue_session(body['identifier']))
+
+            elif method == 'com.atproto.server.refreshSession':
+                token = self.bearer()
+                handle, error = state.check_token(token, 'refresh')
+                if error:
+                    self.send_json(400, {'error': error, 'message': 'Refresh token rejected'})
+                    return
+                # Refresh tokens are single use, as on the real server
+                del state.tokens[token]
+                self.send_json(200, state.issue_session(handle))
+
+            elif method == 'com.atproto.repo.createRecord':
+                handle, error = state.check_token(self.bearer(), 'access')
+                if error:
+                    self.send_json(400, {'error': error, 'message': 'Access token rejected'})
+                    return
+                body = self.read_json()
+                state.records.append(body)
+                text = body.get('record', {}).get('text', '')
+                print(f"🧪 Post from {handle}: {text[:60]!r}")
+                rkey = secrets.token_hex(6)
+                self.send_json(200, {'uri': f"at://{body.get('repo')}/app.bsky.feed.post/{rkey}",
+                                     'cid': secrets.token_hex(16)})
+
+            else:
+                self.send_json(404, {'error': 'MethodNotImplemented'})
+
+def main():
+    parser = argparse.ArgumentParser(description='Offline Bluesky XRPC stub')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8787)
+    parser.add_argument('--access-ttl', type=int, default=7200,
+                        help='Seconds an access token stays valid (the real server uses about 2 hours)')
+    parser.add_argument('--refresh-ttl', type=int, default=60 * 24 * 3600,
+                        help='Seconds a refresh token stays valid')
+    parser.add_argument('--password', default=None,
+                        help='Only accept this password (default: any non-empty one)')
+    args = parser.parse_args()
+
+    StubHandler.state = StubState(args.access_ttl, args.refresh_ttl, args.password)
+    server = ThreadingHTTPServer((args.host, args.port), StubHandler)
+    print(f"🧪 Bluesky stub listening on http://{args.host}:{args.port}/xrpc")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+if __name__ == '__main__':
+    main()
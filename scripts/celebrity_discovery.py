@@ -4,13 +4,18 @@ Celebrity Auto-Discovery System
 Automatically finds and adds new celebrities based on mention frequency and drama scores
 """
 
-import yaml
 import os
 from pathlib import Path
 from datetime import datetime, timedelta
 from collections import defaultdict
 import re
 
+from celebrity_index import load_celebrity_index
+from celebrity_store import CelebrityStore
+from post_index import open_post_index
+from post_reader import read_body
+import yaml_io
+
 class CelebrityDiscovery:
     def __init__(self):
         self.base_path = Path.cwd()
@@ -23,13 +28,11 @@ class CelebrityDiscovery:
         print("🔍 Scanning for new celebrity mentions...")
 
         # Load existing celebrities
-        celebrities_file = self.base_path / '_data' / 'celebrities.yml'
-        existing_celebrities = set()
+        celebrity_index = load_celebrity_index(self.base_path / '_data')
+        existing_celebrities = set(celebrity_index.celebrities.keys())
 
-        if celebrities_file.exists():
-            with open(celebrities_file, 'r') as f:
-                existing_data = yaml.safe_load(f) or {}
-                existing_celebrities = set(existing_data.keys())
+        # Matcher over known names and aliases, used to skip them while scanning
+        known_matcher = celebrity_index.matcher
 
         # Load tag management whitelist
         tag_mgmt_file = self.base_path / '_data' / 'tag_management.yml'
@@ -37,11 +40,11 @@ class CelebrityDiscovery:
 
         if tag_mgmt_file.exists():
             with open(tag_mgmt_file, 'r') as f:
-                tag_data = yaml.safe_load(f) or {}
+                tag_data = yaml_io.load(f) or {}
                 whitelist = set(tag_data.get('celebrity_whitelist', []))
 
         # Scan recent posts for potential celebrities
-        potential_celebrities = self.scan_recent_posts()
+        potential_celebrities = self.scan_recent_posts(known_matcher)
 
         # Filter and score potential celebrities
         new_discoveries = []
@@ -94,7 +97,7 @@ class CelebrityDiscovery:
         else:
             print("📭 No new celebrities discovered")
 
-    def scan_recent_posts(self):
+    def scan_recent_posts(self, known_matcher=None):
         """Scan recent posts for celebrity mentions"""
         posts_dir = self.base_path / '_posts'
         if not posts_dir.exists():
@@ -103,24 +106,21 @@ class CelebrityDiscovery:
         potential_celebrities = defaultdict(lambda: {'scores': [], 'dates': [], 'tags': []})
         cutoff_date = datetime.now() - timedelta(days=self.time_window)
 
-        for post_file in posts_dir.glob('*.md'):
-            try:
-                with open(post_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-
-                if not content.startswith('---'):
-                    continue
-
-                parts = content.split('---', 2)
-                if len(parts) < 3:
-                    continue
+        # Front matter comes from the post index; only posts in the window are opened
+        with open_post_index(self.base_path) as post_index:
+            recent_posts = post_index.posts_since(cutoff_date, use_front_matter_date=True)
 
-                front_matter = yaml.safe_load(parts[1])
+        for post in recent_posts:
+            try:
+                front_matter = post['front_matter']
                 post_date = datetime.strptime(str(front_matter.get('date', '1970-01-01'))[:10], '%Y-%m-%d')
 
                 if post_date < cutoff_date:
                     continue
 
+                # The index already has the front matter; skip past it for the body
+                body = read_body(post['path'])
+
                 drama_score = front_matter.get('drama_score', 0)
                 tags = front_matter.get('tags', [])
                 primary_celebrity = front_matter.get('primary_celebrity', '')
@@ -140,9 +140,15 @@ class CelebrityDiscovery:
 
                 # From title and content (basic name extraction)
                 title = front_matter.get('title', '')
-                content_text = parts[2]
+                content_text = body
+                text = title + ' ' + content_text
 
-                for name in self.extract_names_from_text(title + ' ' + content_text):
+                # Names (and aliases) of already-known celebrities, found in one pass
+                known_names = known_matcher.scan(text) if known_matcher else {}
+
+                for name in self.extract_names_from_text(text):
+                    if name.lower() in known_names:
+                        continue
                     celebrity_candidates.add(self.normalize_name(name))
 
                 # Record data for each candidate
@@ -216,13 +222,8 @@ class CelebrityDiscovery:
 
     def add_new_celebrities(self, new_discoveries):
         """Add new celebrities to the celebrities.yml file"""
-        celebrities_file = self.base_path / '_data' / 'celebrities.yml'
-
-        # Load existing data
-        existing_data = {}
-        if celebrities_file.exists():
-            with open(celebrities_file, 'r') as f:
-                existing_data = yaml.safe_load(f) or {}
+        store = CelebrityStore(self.base_path / '_data')
+        existing_data = store.celebrities
 
         # Add new discoveries
         for celeb in new_discoveries:
@@ -234,9 +235,8 @@ class CelebrityDiscovery:
                 'tags': celeb['tags']
             }
 
-        # Save updated data
-        with open(celebrities_file, 'w') as f:
-            yaml.dump(existing_data, f, default_flow_style=False, sort_keys=True)
+        # Only the new entries are merged into the file
+        store.save()
 
     def promote_new_celebrities(self):
         """Promote 'new' celebrities to regular status after 30 days"""
@@ -245,8 +245,8 @@ class CelebrityDiscovery:
         if not celebrities_file.exists():
             return
 
-        with open(celebrities_file, 'r') as f:
-            celebrities = yaml.safe_load(f) or {}
+        store = CelebrityStore(self.base_path / '_data')
+        celebrities = store.celebrities
 
         updated_count = 0
         promotion_cutoff = datetime.now() - timedelta(days=30)
@@ -265,8 +265,7 @@ class CelebrityDiscovery:
                         pass
 
         if updated_count > 0:
-            with open(celebrities_file, 'w') as f:
-                yaml.dump(celebrities, f, default_flow_style=False, sort_keys=True)
+            store.save()
             print(f"✅ Promoted {updated_count} celebrities to active status")
         else:
             print("📭 No celebrities ready for promotion")
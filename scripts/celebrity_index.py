@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Compiled Celebrity Index
+Caches the parsed celebrities.yml plus prebuilt name tables and matchers,
+rebuilding only when the YAML file changes
+"""
+
+import hashlib
+import os
+import pickle
+import tempfile
+from pathlib import Path
+
+from celebrity_matcher import build_celebrity_matcher, build_id_matcher, get_name_variations
+import yaml_io
+
+# Bump whenever the pickled structure changes so stale caches are rebuilt
+INDEX_VERSION = 1
+INDEX_FILENAME = '.celebrities.index.pickle'
+BRAND_CATEGORIES = ('fashion_brand', 'brand')
+
+class CelebrityIndex:
+    """Everything the scripts derive from celebrities.yml, ready to use"""
+
+    def __init__(self, celebrities, mtime_ns=0, size=0, sha1=None):
+        self.version = INDEX_VERSION
+        self.mtime_ns = mtime_ns
+        self.size = size
+        self.sha1 = sha1
+
+        # Full database exactly as parsed from YAML
+        self.celebrities = celebrities
+
+        entries = {k: v for k, v in celebrities.items()
+                   if k != '_temperature_metadata' and isinstance(v, dict)}
+
+        self.categories = {k: v.get('category', '') for k, v in entries.items()}
+        self.memorial = {k for k, v in entries.items() if v.get('memorial', False)}
+        self.people = [k for k in entries if self.categories[k] not in BRAND_CATEGORIES]
+        self.aliases = {k: get_name_variations(k) for k in entries if get_name_variations(k)}
+
+        people = {k: entries[k] for k in self.people}
+
+        # Searchable lowercase names for living people (scraper semantics)
+        names = set()
+        for key in self.people:
+            if key in self.memorial:
+                continue
+            names.add(key.replace('_', ' ').lower())
+            names.update(v.lower() for v in self.aliases.get(key, []))
+        self.names = sorted(names)
+
+        # Prebuilt automatons
+        self.matcher = build_celebrity_matcher(people)
+        self.id_matcher = build_id_matcher(celebrities)
+
+    def people_only(self):
+        """Celebrity entries minus brands and temperature metadata"""
+        return {k: self.celebrities[k] for k in self.people}
+
+def read_cached_index(index_file):
+    try:
+        with open(index_file, 'rb') as f:
+            index = pickle.load(f)
+        if getattr(index, 'version', None) == INDEX_VERSION:
+            return index
+    except Exception:
+        pass
+    return None
+
+def write_cached_index(index, index_file):
+    """Atomically replace the cached index (best effort)"""
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=index_file.parent, prefix=index_file.name, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(index, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, index_file)
+    except OSError as e:
+        print(f"⚠️ Could not write celebrity index cache: {e}")
+
+def load_celebrity_index(data_dir=None):
+    """Load the celebrity index, re-parsing celebrities.yml only if it changed
+
+    The cache is trusted when the YAML's mtime and size are unchanged. If
+    they differ (e.g. after a fresh git checkout) the file hash decides.
+    """
+    data_dir = Path(data_dir) if data_dir else Path.cwd() / '_data'
+    celebrities_file = data_dir / 'celebrities.yml'
+    index_file = data_dir / INDEX_FILENAME
+
+    if not celebrities_file.exists():
+        return CelebrityIndex({})
+
+    stat = celebrities_file.stat()
+    cached = read_cached_index(index_file)
+
+    if cached and cached.mtime_ns == stat.st_mtime_ns and cached.size == stat.st_size:
+        return cached
+
+    raw = celebrities_file.read_bytes()
+    sha1 = hashlib.sha1(raw).hexdigest()
+
+    if cached and cached.sha1 == sha1:
+        cached.mtime_ns = stat.st_mtime_ns
+        cached.size = stat.st_size
+        write_cached_index(cached, index_file)
+        return cached
+
+    celebrities = yaml_io.load(raw) or {}
+    index = CelebrityIndex(celebrities, stat.st_mtime_ns, stat.st_size, sha1)
+    write_cached_index(index, index_file)
+
+    return index
+
+def load_celebrities(data_dir=None):
+    """Drop-in replacement for yaml.safe_load(celebrities.yml)"""
+    return load_celebrity_index(data_dir).celebrities
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Celebrity Name Matcher
+Aho-Corasick automaton that finds every known celebrity name in a text in a single pass
+"""
+
+from collections import deque
+
+# Extra search terms for celebrities who are often mentioned by nickname or surname
+NAME_VARIATIONS = {
+    'taylor_swift': ['taylor swift', 'swift', 't-swift'],
+    'kanye_west': ['kanye west', 'kanye', 'ye'],
+    'kim_kardashian': ['kim kardashian', 'kardashian'],
+    'elon_musk': ['elon musk', 'musk'],
+    'justin_bieber': ['justin bieber', 'bieber'],
+    'drake': ['drake'],
+    'beyonce': ['beyoncé', 'beyonce'],
+    'ariana_grande': ['ariana grande', 'ariana'],
+    'bad_bunny': ['bad bunny'],
+    'pete_davidson': ['pete davidson'],
+    'jenna_ortega': ['jenna ortega'],
+    'sabrina_carpenter': ['sabrina carpenter'],
+    'olivia_rodrigo': ['olivia rodrigo'],
+    'pedro_pascal': ['pedro pascal'],
+    'austin_butler': ['austin butler'],
+    'anya_taylor_joy': ['anya taylor-joy', 'anya taylor joy'],
+}
+
+def get_name_variations(celebrity_key):
+    """Get nickname/surname variations for a celebrity key"""
+    return list(NAME_VARIATIONS.get(celebrity_key, []))
+
+def is_word_char(char):
+    """Match the definition of \\w used by the old regex patterns"""
+    return char.isalnum() or char == '_'
+
+class CelebrityMatcher:
+    """Multi-pattern matcher with regex-style word boundaries (\\bname\\b)
+
+    `patterns` maps each lowercase search name to the list of celebrity keys
+    credited when it matches. A key may appear more than once for a name, in
+    which case every match counts once per appearance.
+    """
+
+    def __init__(self, patterns, key_order=None):
+        self.owners = {name: list(keys) for name, keys in patterns.items() if name}
+        self.key_order = {key: i for i, key in enumerate(key_order or [])}
+        self.build_automaton()
+
+    def build_automaton(self):
+        """Build the goto/fail/output tables"""
+        goto = [{}]
+        output = [()]
+
+        for name in self.owners:
+            state = 0
+            for char in name:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][char] = next_state
+                    goto.append({})
+                    output.append(())
+                state = next_state
+            output[state] = output[state] + (name,)
+
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+
+        while queue:
+            state = queue.popleft()
+            for char, next_state in goto[state].items():
+                queue.append(next_state)
+
+                fallback = fail[state]
+                while fallback and char not in goto[fallback]:
+                    fallback = fail[fallback]
+                fail[next_state] = goto[fallback].get(char, 0) if state else 0
+
+                output[next_state] = output[next_state] + output[fail[next_state]]
+
+        self.goto = goto
+        self.fail = fail
+        self.output = output
+
+    def scan(self, text):
+        """Count word-bounded, non-overlapping matches of every name in one pass
+
+        Returns {name: count}, equivalent to running
+        len(re.findall(r'\\b' + re.escape(name) + r'\\b', text.lower())) per name.
+        """
+        text = text.lower()
+        goto, fail, output = self.goto, self.fail, self.output
+        text_length = len(text)
+
+        counts = {}
+        last_end = {}
+        state = 0
+
+        for i, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+
+            if not output[state]:
+                continue
+
+            end = i + 1
+            right_is_word = end < text_length and is_word_char(text[end])
+
+            for name in output[state]:
+                start = end - len(name)
+
+                # \b at both ends: word-ness must change across each edge
+                left_is_word = start > 0 and is_word_char(text[start - 1])
+                if left_is_word == is_word_char(name[0]):
+                    continue
+                if right_is_word == is_word_char(name[-1]):
+                    continue
+
+                # re.findall never reports overlapping matches of one pattern
+                if start < last_end.get(name, 0):
+                    continue
+
+                last_end[name] = end
+                counts[name] = counts.get(name, 0) + 1
+
+        return counts
+
+    def names_found(self, text):
+        """Sorted list of matched names"""
+        return sorted(self.scan(text))
+
+    def mentions(self, text):
+        """Total matches per celebrity key, in celebrity database order"""
+        totals = {}
+        for name, count in self.scan(text).items():
+            for key in self.owners[name]:
+                totals[key] = totals.get(key, 0) + count
+
+        fallback = len(self.key_order)
+        return dict(sorted(totals.items(), key=lambda item: self.key_order.get(item[0], fallback)))
+
+def build_celebrity_matcher(celebrities, min_length=4):
+    """Build the scraper's matcher: every living celebrity plus their name variations"""
+    patterns = {}
+
+    for celebrity_key, celebrity_data in celebrities.items():
+        if celebrity_data.get('memorial', False):
+            continue
+
+        main_name = celebrity_key.replace('_', ' ')
+        for name in [main_name] + get_name_variations(celebrity_key):
+            if len(name) < min_length:
+                continue
+            patterns.setdefault(name.lower(), []).append(celebrity_key)
+
+    return CelebrityMatcher(patterns, key_order=celebrities.keys())
+
+def resolve_celebrity_id(name, celebrities):
+    """Find the celebrity ID a free-text name refers to"""
+    name_lower = name.lower()
+
+    # Direct ID match
+    if name_lower.replace(' ', '_') in celebrities:
+        return name_lower.replace(' ', '_')
+
+    # Search through existing celebrities
+    for celebrity_id in celebrities:
+        if celebrity_id.replace('_', ' ').lower() == name_lower:
+            return celebrity_id
+
+    # Create new ID from name
+    return name_lower.replace(' ', '_')
+
+def build_id_matcher(celebrities, extra_names=()):
+    """Build the temperature matcher: every celebrity ID, spelled with and without underscores"""
+    celebrity_names = set()
+    for celebrity_id in celebrities:
+        celebrity_names.add(celebrity_id.replace('_', ' '))
+        celebrity_names.add(celebrity_id)
+    celebrity_names.update(extra_names)
+
+    # Each name credits the celebrity ID it resolves to
+    patterns = {}
+    for name in celebrity_names:
+        celebrity_id = resolve_celebrity_id(name, celebrities)
+        if celebrity_id:
+            patterns.setdefault(name.lower(), []).append(celebrity_id)
+
+    return CelebrityMatcher(patterns)
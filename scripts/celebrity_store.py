@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Celebrity Store
+Shared writer for celebrities.yml: remembers what each entry looked like when
+loaded, and on save merges only the fields this process changed into the
+file's current contents, under a file lock, via temp file + rename
+"""
+
+import copy
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+
+from celebrity_index import load_celebrity_index
+import yaml_io
+
+try:
+    import fcntl
+except ImportError:  # Not on Windows: writes stay atomic, just unlocked
+    fcntl = None
+
+LOCK_FILENAME = '.celebrities.yml.lock'
+MISSING = object()
+
+class CelebrityStore:
+    """celebrities.yml as loaded by this process, plus what it has changed since
+
+    Callers edit `celebrities` in place (or pass a replacement dict to save()).
+    Nothing is written until save(), and save() only writes when something
+    actually changed, so a job that touches the database several times still
+    rewrites the file once.
+    """
+
+    def __init__(self, data_dir=None):
+        self.data_dir = Path(data_dir) if data_dir else Path.cwd() / '_data'
+        self.celebrities_file = self.data_dir / 'celebrities.yml'
+        self.lock_file = self.data_dir / LOCK_FILENAME
+
+        self.index = load_celebrity_index(self.data_dir)
+        self.celebrities = self.index.celebrities
+        self.loaded = copy.deepcopy(self.celebrities)
+
+    @contextmanager
+    def locked(self):
+        """Exclusive advisory lock shared by every writer of celebrities.yml"""
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.lock_file, 'a') as lock:
+            if fcntl:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl:
+                    fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def dirty(self):
+        """Entry ids added, changed or removed since load (or the last save)"""
+        changed = {cid for cid, entry in self.celebrities.items()
+                   if self.loaded.get(cid, MISSING) != entry}
+        removed = set(self.loaded) - set(self.celebrities)
+        return changed | removed
+
+    def merge_into(self, current):
+        """Apply this process's changes to the file's current contents"""
+        for cid in self.dirty():
+            before = self.loaded.get(cid, MISSING)
+            after = self.celebrities.get(cid, MISSING)
+
+            if after is MISSING:
+                current.pop(cid, None)
+                continue
+
+            target = current.get(cid)
+            if not (isinstance(before, dict) and isinstance(after, dict) and isinstance(target, dict)):
+                current[cid] = copy.deepcopy(after)
+                continue
+
+            # Field by field, so another job's edits to other fields survive
+            for field, value in after.items():
+                if before.get(field, MISSING) != value:
+                    target[field] = copy.deepcopy(value)
+            for field in before:
+                if field not in after:
+                    target.pop(field, None)
+
+        return current
+
+    def save(self, celebrities=None, header=''):
+        """Write this process's changes; returns the number of entries written"""
+        if celebrities is not None:
+            self.celebrities = celebrities
+
+        dirty = self.dirty()
+        if not dirty:
+            return 0
+
+        with self.locked():
+            current = {}
+            if self.celebrities_file.exists():
+                with open(self.celebrities_file, 'r', encoding='utf-8') as f:
+                    current = yaml_io.load(f) or {}
+
+            write_atomically(self.celebrities_file, self.merge_into(current), header)
+
+        self.loaded = copy.deepcopy(self.celebrities)
+        return len(dirty)
+
+def write_atomically(path, data, header=''):
+    """Dump to a temp file next to `path`, then rename it over the original"""
+    mode = path.stat().st_mode & 0o777 if path.exists() else 0o644
+
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(header)
+            yaml_io.dump(data, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
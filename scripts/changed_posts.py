@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Change-Set Post Selection
+Resolves which posts a repair run should touch: everything, the posts git
+reports as changed since a ref, or an explicit file list
+"""
+
+import subprocess
+from pathlib import Path
+
+def git_lines(base_path, *args):
+    """Output lines of a git command run in base_path; ValueError if git fails"""
+    try:
+        result = subprocess.run(['git', '-C', str(base_path), *args],
+                                capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError) as e:
+        detail = getattr(e, 'stderr', None) or str(e)
+        raise ValueError(f"git {' '.join(args)} failed: {detail.strip()}")
+    return [line for line in result.stdout.splitlines() if line.strip()]
+
+def changed_files(since, posts_dir, base_path=None):
+    """Paths under posts_dir added, modified or renamed since `since`
+
+    Compares the ref against the working tree, so uncommitted edits count,
+    and adds untracked files so freshly scraped posts are picked up too.
+    """
+    base_path = Path(base_path) if base_path else Path.cwd()
+    pathspec = str(Path(posts_dir).resolve().relative_to(base_path.resolve()))
+
+    names = git_lines(base_path, 'diff', '--name-only', '--relative', '--diff-filter=ACMR',
+                      since, '--', pathspec)
+    names += git_lines(base_path, 'ls-files', '--others', '--exclude-standard', '--', pathspec)
+    return [base_path / name for name in names]
+
+def only_posts(paths, posts_dir):
+    """Existing *.md files directly in posts_dir, deduplicated and sorted"""
+    posts_dir = Path(posts_dir).resolve()
+    posts = set()
+    for path in paths:
+        path = Path(path).resolve()
+        if path.suffix == '.md' and path.parent == posts_dir and path.is_file():
+            posts.add(path)
+    return sorted(posts)
+
+def select_posts(posts_dir, since=None, files=None, base_path=None):
+    """Posts to process; every post unless `since` or `files` narrows it down
+
+    Files that are not posts (or no longer exist) are dropped, so a workflow
+    can pass its whole change list through.
+    """
+    if since:
+        return only_posts(changed_files(since, posts_dir, base_path), posts_dir)
+    if files is not None:
+        return only_posts(files, posts_dir)
+    return sorted(Path(posts_dir).glob('*.md'))
+
+def add_selection_arguments(parser):
+    """--since / --files / --all, shared by the repair scripts"""
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument('--since', metavar='REF',
+                       help='Only posts changed since this git ref (git diff --name-only)')
+    group.add_argument('--files', nargs='*', metavar='FILE',
+                       help='Only these files; anything outside _posts is ignored')
+    group.add_argument('--all', action='store_true',
+                       help='Rescan every post (the default)')
@@ -4,15 +4,19 @@ Drama Temperature Calculator
 Dynamically calculates relative drama scores based on current activity
 """
 
-import yaml
 import json
 import re
 from pathlib import Path
-from datetime import datetime, timedelta
+from datetime import datetime
 from collections import defaultdict, Counter
 import statistics
 import argparse
 
+from celebrity_store import CelebrityStore
+from post_corpus import PostCorpus
+from temperature_history import record_run
+from temperature_ranking import interpolated_percentile
+
 class DramaTemperatureCalculator:
     def __init__(self):
         self.base_path = Path.cwd()
@@ -25,42 +29,48 @@ class DramaTemperatureCalculator:
         self.lookback_days = 30  # How far back to analyze
         self.recency_weight = 2.0  # Weight recent activity higher
         self.velocity_weight = 1.5  # Weight trending activity
+        self.activity_data = {}
 
     def load_celebrities(self):
         """Load celebrity data"""
-        celebrities_file = self.data_dir / 'celebrities.yml'
-        if celebrities_file.exists():
-            with open(celebrities_file, 'r') as f:
-                self.celebrities = yaml.safe_load(f) or {}
-        else:
-            self.celebrities = {}
+        self.store = CelebrityStore(self.data_dir)
+        self.celebrities = self.store.celebrities
 
     def calculate_all_temperatures(self):
         """Calculate drama temperatures for all celebrities"""
         print("🌡️ Calculating dynamic drama temperatures...")
 
+        with PostCorpus(self.base_path, self.lookback_days) as corpus:
+            temperature_scores = self.score(corpus)
+
+        # Update celebrity data and report
+        self.apply_temperatures(temperature_scores)
+        self.save_celebrities()
+        self.record_history(temperature_scores)
+
+        print("✅ Drama temperatures updated!")
+
+    def score(self, corpus):
+        """Score every active celebrity from the shared post corpus"""
         # Analyze recent activity
-        activity_data = self.analyze_recent_activity()
+        self.activity_data = self.analyze_recent_activity(corpus)
 
         # Calculate raw scores
-        raw_scores = self.calculate_raw_scores(activity_data)
+        raw_scores = self.calculate_raw_scores(self.activity_data)
 
         # Convert to temperature scale
-        temperature_scores = self.convert_to_temperature_scale(raw_scores)
+        return self.convert_to_temperature_scale(raw_scores)
 
-        # Update celebrity data
+    def apply_temperatures(self, temperature_scores):
+        """Write temperatures into the celebrity database and generate the report"""
         self.update_celebrity_temperatures(temperature_scores)
+        self.generate_temperature_report(temperature_scores, self.activity_data)
 
-        # Generate temperature report
-        self.generate_temperature_report(temperature_scores, activity_data)
-
-        print("✅ Drama temperatures updated!")
-
-    def analyze_recent_activity(self):
+    def analyze_recent_activity(self, corpus):
         """Analyze recent posting activity for all celebrities"""
         print("📊 Analyzing recent activity...")
 
-        cutoff_date = datetime.now() - timedelta(days=self.lookback_days)
+        cutoff_date = corpus.cutoff_date
         activity_data = defaultdict(lambda: {
             'mentions': 0,
             'total_drama': 0,
@@ -73,10 +83,11 @@ class DramaTemperatureCalculator:
         # Analyze posts by week to calculate velocity
         weekly_mentions = defaultdict(lambda: defaultdict(int))
 
-        for post_file in self.posts_dir.glob('*.md'):
+        # Only posts inside the lookback window, shared with the other scorers
+        for post in corpus.recent_posts():
             try:
                 # Extract date from filename
-                date_match = re.match(r'(\d{4}-\d{2}-\d{2})', post_file.name)
+                date_match = re.match(r'(\d{4}-\d{2}-\d{2})', post['filename'])
                 if not date_match:
                     continue
 
@@ -84,59 +95,53 @@ class DramaTemperatureCalculator:
                 if post_date < cutoff_date:
                     continue
 
-                with open(post_file, 'r') as f:
-                    content = f.read()
-
-                if content.startswith('---'):
-                    parts = content.split('---', 2)
-                    if len(parts) >= 3:
-                        front_matter = yaml.safe_load(parts[1])
-
-                        drama_score = front_matter.get('drama_score', 0)
-                        primary_celebrity = front_matter.get('primary_celebrity')
-                        tags = front_matter.get('tags', [])
-
-                        # Calculate recency multiplier (more recent = higher weight)
-                        days_ago = (datetime.now() - post_date).days
-                        recency_multiplier = max(0.1, 1.0 - (days_ago / self.lookback_days))
-                        recency_multiplier = recency_multiplier ** (1/self.recency_weight)
-
-                        # Week number for velocity calculation
-                        week_num = post_date.isocalendar()[1]
-
-                        # Track primary celebrity
-                        if primary_celebrity and primary_celebrity in self.celebrities:
-                            weighted_drama = drama_score * recency_multiplier
-                            activity_data[primary_celebrity]['mentions'] += 1
-                            activity_data[primary_celebrity]['total_drama'] += weighted_drama
-                            activity_data[primary_celebrity]['recent_posts'].append({
-                                'date': post_date,
-                                'drama': drama_score,
-                                'weighted_drama': weighted_drama
-                            })
-                            activity_data[primary_celebrity]['peak_drama'] = max(
-                                activity_data[primary_celebrity]['peak_drama'], 
-                                drama_score
-                            )
-
-                            weekly_mentions[primary_celebrity][week_num] += 1
-
-                        # Track mentioned celebrities in tags
-                        for tag in tags:
-                            if tag in self.celebrities and tag != primary_celebrity:
-                                weighted_drama = drama_score * recency_multiplier * 0.5  # Secondary mention
-                                activity_data[tag]['mentions'] += 0.5  # Partial mention
-                                activity_data[tag]['total_drama'] += weighted_drama
-                                activity_data[tag]['recent_posts'].append({
-                                    'date': post_date,
-                                    'drama': drama_score * 0.5,
-                                    'weighted_drama': weighted_drama
-                                })
-
-                                weekly_mentions[tag][week_num] += 0.5
+                front_matter = post['front_matter']
+
+                drama_score = front_matter.get('drama_score', 0)
+                primary_celebrity = front_matter.get('primary_celebrity')
+                tags = front_matter.get('tags', [])
+
+                # Calculate recency multiplier (more recent = higher weight)
+                days_ago = (datetime.now() - post_date).days
+                recency_multiplier = max(0.1, 1.0 - (days_ago / self.lookback_days))
+                recency_multiplier = recency_multiplier ** (1/self.recency_weight)
+
+                # Week number for velocity calculation
+                week_num = post_date.isocalendar()[1]
+
+                # Track primary celebrity
+                if primary_celebrity and primary_celebrity in self.celebrities:
+                    weighted_drama = drama_score * recency_multiplier
+                    activity_data[primary_celebrity]['mentions'] += 1
+                    activity_data[primary_celebrity]['total_drama'] += weighted_drama
+                    activity_data[primary_celebrity]['recent_posts'].append({
+                        'date': post_date,
+                        'drama': drama_score,
+                        'weighted_drama': weighted_drama
+                    })
+                    activity_data[primary_celebrity]['peak_drama'] = max(
+                        activity_data[primary_celebrity]['peak_drama'], 
+                        drama_score
+                    )
+
+                    weekly_mentions[primary_celebrity][week_num] += 1
+
+                # Track mentioned celebrities in tags
+                for tag in tags:
+                    if tag in self.celebrities and tag != primary_celebrity:
+                        weighted_drama = drama_score * recency_multiplier * 0.5  # Secondary mention
+                        activity_data[tag]['mentions'] += 0.5  # Partial mention
+                        activity_data[tag]['total_drama'] += weighted_drama
+                        activity_data[tag]['recent_posts'].append({
+                            'date': post_date,
+                            'drama': drama_score * 0.5,
+                            'weighted_drama': weighted_drama
+                        })
+
+                        weekly_mentions[tag][week_num] += 0.5
 
             except Exception as e:
-                print(f"❌ Error processing {post_file}: {e}")
+                print(f"❌ Error processing {post['path']}: {e}")
 
         # Calculate velocity (trending up/down)
         for celebrity, weeks in weekly_mentions.items():
@@ -166,7 +171,7 @@ class DramaTemperatureCalculator:
                         gap = (post_dates[i] - post_dates[i-1]).days
                         gaps.append(gap)
 
-                    if gaps:
+                    if len(gaps) > 1:
                         consistency = 1.0 / (1.0 + statistics.stdev(gaps) / 7)  # Normalize by week
                         activity_data[celebrity]['consistency'] = consistency
 
@@ -225,24 +230,15 @@ class DramaTemperatureCalculator:
         if not scores:
             return {celebrity: 0 for celebrity in raw_scores}
 
-        # Calculate percentiles
+        # Calculate percentiles (one sort for all five thresholds)
         scores.sort()
 
-        def get_percentile_value(percentile):
-            if len(scores) == 1:
-                return scores[0]
-            index = (percentile / 100) * (len(scores) - 1)
-            lower_index = int(index)
-            upper_index = min(lower_index + 1, len(scores) - 1)
-            weight = index - lower_index
-            return scores[lower_index] * (1 - weight) + scores[upper_index] * weight
-
         # Define temperature thresholds based on percentiles
-        p95 = get_percentile_value(95)  # 100° (Explosive)
-        p85 = get_percentile_value(85)  # 70° (Hot)
-        p70 = get_percentile_value(70)  # 50° (Rising)
-        p50 = get_percentile_value(50)  # 30° (Mild)
-        p25 = get_percentile_value(25)  # 10° (Cooling)
+        p95 = interpolated_percentile(scores, 95)  # 100° (Explosive)
+        p85 = interpolated_percentile(scores, 85)  # 70° (Hot)
+        p70 = interpolated_percentile(scores, 70)  # 50° (Rising)
+        p50 = interpolated_percentile(scores, 50)  # 30° (Mild)
+        p25 = interpolated_percentile(scores, 25)  # 10° (Cooling)
 
         temperature_scores = {}
 
@@ -311,8 +307,6 @@ class DramaTemperatureCalculator:
                 self.celebrities[celebrity]['temperature_change'] = -data.get('drama_score', 0)
                 updated_count += 1
 
-        # Save updated data
-        self.save_celebrities()
         print(f"✅ Updated {updated_count} celebrity temperatures")
 
     def generate_temperature_report(self, temperature_scores, activity_data):
@@ -367,13 +361,18 @@ class DramaTemperatureCalculator:
             print(f"   {celebrity.replace('_', ' ').title()}: {temp}°")
         print("=" * 40)
 
+    def record_history(self, temperature_scores):
+        """Append this run to the temperature history"""
+        mentions = {celebrity: data['mentions'] for celebrity, data in self.activity_data.items()}
+        record_run(self.data_dir, temperature_scores, mentions)
+
     def save_celebrities(self):
         """Save updated celebrity data"""
-        with open(self.data_dir / 'celebrities.yml', 'w') as f:
-            f.write("# Celebrity Drama Tracking Database\n")
-            f.write("# Auto-updated by discovery scripts and manual additions\n")
-            f.write("# Drama scores are relative temperatures (0-100°)\n\n")
-            yaml.dump(self.celebrities, f, default_flow_style=False)
+        self.store.save(self.celebrities, header=(
+            "# Celebrity Drama Tracking Database\n"
+            "# Auto-updated by discovery scripts and manual additions\n"
+            "# Drama scores are relative temperatures (0-100°)\n\n"
+        ))
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description='Drama Temperature Calculator')
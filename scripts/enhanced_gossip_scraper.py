@@ -6,7 +6,6 @@ FIXED VERSION - Restores Jekyll post creation functionality + HTML Entity Protec
 
 import feedparser
 import requests
-import yaml
 import json
 import re
 from datetime import datetime, timedelta
@@ -15,8 +14,19 @@ from pathlib import Path
 import time
 import logging
 import hashlib
-from difflib import SequenceMatcher
-import html
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlparse
+
+from bluesky_payload import build_payload, content_sha1
+from celebrity_matcher import get_name_variations
+from celebrity_store import CelebrityStore
+from near_duplicates import NearDuplicateIndex, normalize_title, similarity_above
+from post_index import open_post_index, parse_front_matter
+from post_queue import CandidateQueue
+from processed_store import ProcessedArticleStore
+from text_normalize import decode_entities
 
 # Setup dual logging - console and debug file
 logging.basicConfig(level=logging.INFO)
@@ -31,15 +41,35 @@ debug_handler.setFormatter(debug_formatter)
 debug_logger.addHandler(debug_handler)
 
 class GossipScraper:
-    def __init__(self):
+    def __init__(self, max_workers=6, host_delay=0.5, serial=False, use_feed_cache=True,
+                 dedup_days=2, dedup_threshold=0.8):
         self.base_path = Path('.')
         self.celebrities = self.load_celebrities()
         self.celebrity_names = self.extract_celebrity_names()
+        self.celebrity_matcher = self.celebrity_index.matcher
         self.processed_articles = self.load_processed_articles()
+        self.use_feed_cache = use_feed_cache
+        self.feed_cache = self.load_feed_cache() if use_feed_cache else {}
+        self.pending_feed_cache = {}
+        self.bytes_saved = {}
         self.new_posts = []
         self.celebrity_mentions = defaultdict(int)
         self.potential_new_celebrities = Counter()
 
+        # Cross-run duplicate detection against recently published stories
+        self.dedup_days = dedup_days
+        self.dedup_threshold = dedup_threshold
+        self.recent_titles = self.load_recent_titles()
+        self.cross_run_duplicates = 0
+
+        # Fetch settings - feeds are downloaded concurrently unless serial mode is requested
+        self.max_workers = max(1, max_workers)
+        self.host_delay = host_delay  # Minimum seconds between requests to the same host
+        self.serial = serial
+        self.host_lock = threading.Lock()
+        self.host_next_request = {}
+        self.feed_timings = {}
+
         self.excluded_words = {
             'on the', 'of the', 'in the', 'to the', 'for the', 'with the',
             'and the', 'at the', 'by the', 'from the', 'who plays',
@@ -107,134 +137,128 @@ class GossipScraper:
         Path('data').mkdir(exist_ok=True)
 
     def load_celebrities(self):
-        try:
-            with open(self.base_path / '_data' / 'celebrities.yml', 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
-                if data is None:
-                    return {}
-
-                if '_temperature_metadata' in data:
-                    del data['_temperature_metadata']
-
-                # Filter out brands
-                people_only = {}
-                for key, value in data.items():
-                    category = value.get('category', '')
-                    if category not in ['fashion_brand', 'brand']:
-                        people_only[key] = value
-
-                logger.info(f"Loaded {len(people_only)} people from celebrities.yml")
-                return people_only
-        except FileNotFoundError:
+        # Compiled index: only re-parses the YAML when it has changed
+        self.celebrity_store = CelebrityStore(self.base_path / '_data')
+        self.celebrity_index = self.celebrity_store.index
+
+        if not self.celebrity_store.celebrities_file.exists():
             logger.error("celebrities.yml not found!")
             return {}
 
-    def extract_celebrity_names(self):
-        names = []
+        # Filter out brands and temperature metadata
+        people_only = self.celebrity_index.people_only()
 
-        for celebrity_key, celebrity_data in self.celebrities.items():
-            if celebrity_data.get('memorial', False):
-                continue
+        logger.info(f"Loaded {len(people_only)} people from celebrities.yml")
+        return people_only
 
-            main_name = celebrity_key.replace('_', ' ')
-            names.append(main_name.lower())
-
-            variations = self.get_name_variations(celebrity_key, main_name)
-            names.extend([v.lower() for v in variations])
-
-        unique_names = sorted(list(set(names)))
+    def extract_celebrity_names(self):
+        # Main names plus variations for living people, prebuilt by the index
+        unique_names = list(self.celebrity_index.names)
         logger.info(f"Generated {len(unique_names)} searchable celebrity names")
         return unique_names
 
     def get_name_variations(self, celebrity_key, main_name):
-        variations = []
-
-        name_mappings = {
-            'taylor_swift': ['taylor swift', 'swift', 't-swift'],
-            'kanye_west': ['kanye west', 'kanye', 'ye'],
-            'kim_kardashian': ['kim kardashian', 'kardashian'],
-            'elon_musk': ['elon musk', 'musk'],
-            'justin_bieber': ['justin bieber', 'bieber'],
-            'drake': ['drake'],
-            'beyonce': ['beyoncé', 'beyonce'],
-            'ariana_grande': ['ariana grande', 'ariana'],
-            'bad_bunny': ['bad bunny'],
-            'pete_davidson': ['pete davidson'],
-            'jenna_ortega': ['jenna ortega'],
-            'sabrina_carpenter': ['sabrina carpenter'],
-            'olivia_rodrigo': ['olivia rodrigo'],
-            'pedro_pascal': ['pedro pascal'],
-            'austin_butler': ['austin butler'],
-            'anya_taylor_joy': ['anya taylor-joy', 'anya taylor joy'],
-        }
+        return get_name_variations(celebrity_key)
 
-        if celebrity_key in name_mappings:
-            variations.extend(name_mappings[celebrity_key])
+    def load_processed_articles(self):
+        """Processed article IDs from the last 7 days (append-only log in data/)"""
+        self.ensure_data_directory()
+        processed = ProcessedArticleStore(Path('data'), ttl_days=7)
+        logger.info(f"Loaded {len(processed)} recent processed articles")
+        return processed
 
-        return variations
+    def load_recent_titles(self):
+        """Index titles published in the last `dedup_days` days, from _posts and processed articles"""
+        recent_titles = NearDuplicateIndex(threshold=self.dedup_threshold)
+        if self.dedup_days <= 0:
+            return recent_titles
 
-    def load_processed_articles(self):
+        cutoff = datetime.now() - timedelta(days=self.dedup_days)
+
+        try:
+            with open_post_index(self.base_path) as post_index:
+                for post in post_index.posts_since(cutoff):
+                    if post['title']:
+                        recent_titles.add({'match': post['filename'], 'title': post['title']}, post['title'])
+        except Exception as e:
+            logger.warning(f"⚠️ Could not read post index for duplicate detection: {e}")
+
+        cutoff_iso = cutoff.isoformat()
+        for article in self.processed_articles.values():
+            title = article.get('title')
+            if title and article.get('processed_date', '') >= cutoff_iso:
+                recent_titles.add({'match': article.get('link', ''), 'title': title}, title,
+                                  article.get('excerpt'))
+
+        logger.info(f"Indexed {len(recent_titles)} recent titles for duplicate detection ({self.dedup_days} days)")
+        return recent_titles
+
+    def find_recent_duplicate(self, title, content):
+        """Earlier story this article repeats, as (match, similarity), or None"""
+        if not len(self.recent_titles):
+            return None
+        return self.recent_titles.find_similar(title, content[:200])
+
+    def load_feed_cache(self):
+        """Load per-feed ETag / Last-Modified / body hash from the last run"""
         self.ensure_data_directory()
         try:
-            with open('data/processed_articles.json', 'r') as f:
-                data = json.load(f)
-                cutoff = (datetime.now() - timedelta(days=7)).isoformat()
-                cleaned = {k: v for k, v in data.items() 
-                          if v.get('processed_date', '9999') > cutoff}
-                logger.info(f"Loaded {len(cleaned)} recent processed articles")
-                return cleaned
-        except FileNotFoundError:
+            with open('data/feed_cache.json', 'r') as f:
+                cache = json.load(f)
+                logger.info(f"Loaded HTTP cache for {len(cache)} feeds")
+                return cache
+        except (FileNotFoundError, json.JSONDecodeError):
             return {}
 
+    def save_feed_cache(self):
+        if not self.use_feed_cache:
+            return
+        self.ensure_data_directory()
+        with open('data/feed_cache.json', 'w') as f:
+            json.dump(self.feed_cache, f, indent=2, sort_keys=True)
+
     def normalize_title(self, title):
         """Normalize title for similarity comparison"""
-        title = re.sub(r'[!?.:;,\'""]', '', title.lower())
-        title = re.sub(r'\s+', ' ', title).strip()
-
-        filler_words = ['the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by']
-        words = title.split()
-        filtered_words = [w for w in words if w not in filler_words]
-
-        return ' '.join(filtered_words)
+        return normalize_title(title)
 
     def titles_are_similar(self, title1, title2, threshold=0.8):
         """Check if two titles are similar enough to be considered duplicates"""
         norm1 = self.normalize_title(title1)
         norm2 = self.normalize_title(title2)
 
-        similarity = SequenceMatcher(None, norm1, norm2).ratio()
-        return similarity >= threshold
+        return similarity_above(norm1, norm2, threshold) is not None
 
     def advanced_deduplication(self, posts):
         """Remove duplicate posts based on title similarity"""
         unique_posts = []
-        seen_titles = []
         duplicates_removed = 0
 
+        # Only titles sharing an LSH bucket get the exact similarity check
+        seen_titles = NearDuplicateIndex(threshold=0.8)
+
         posts_sorted = sorted(posts, key=lambda x: x['drama_score'], reverse=True)
 
         for post in posts_sorted:
             current_title = post['title']
-            is_duplicate = False
+            match = seen_titles.find_similar(current_title)
 
-            for seen_title in seen_titles:
-                if self.titles_are_similar(current_title, seen_title):
-                    is_duplicate = True
-                    duplicates_removed += 1
-                    logger.debug(f"Duplicate found: '{current_title[:50]}...' similar to '{seen_title[:50]}...'")
-                    break
+            if match:
+                seen_title, similarity = match
+                duplicates_removed += 1
+                logger.debug(f"Duplicate found: '{current_title[:50]}...' similar to '{seen_title[:50]}...'")
+                continue
 
-            if not is_duplicate:
-                unique_posts.append(post)
-                seen_titles.append(current_title)
+            unique_posts.append(post)
+            seen_titles.add(current_title, current_title)
 
-        logger.info(f"🔄 Deduplication: {len(posts)} → {len(unique_posts)} posts ({duplicates_removed} duplicates removed)")
+        logger.info(f"🔄 Deduplication: {len(posts)} → {len(unique_posts)} posts ({duplicates_removed} duplicates removed, {seen_titles.comparisons} comparisons)")
         return unique_posts
 
     def save_processed_articles(self):
-        self.ensure_data_directory()
-        with open('data/processed_articles.json', 'w') as f:
-            json.dump(self.processed_articles, f, indent=2)
+        """Append this run's article IDs to the processed log"""
+        new_articles = len(self.processed_articles.pending)
+        self.processed_articles.flush()
+        logger.info(f"💾 Recorded {new_articles} processed articles")
 
     def clean_text(self, text):
         """🎯 ENHANCED: Comprehensive HTML entity cleaning"""
@@ -245,86 +269,21 @@ class GossipScraper:
         text = re.sub(r'<[^>]+>', '', text)
 
         # 🎯 COMPREHENSIVE HTML ENTITY CLEANUP
-
-        # Step 1: Decode standard HTML entities
-        text = html.unescape(text)
-
-        # Step 2: Fix bracketed entities that html.unescape might miss
-        text = re.sub(r'\[&#8230;\]', '...', text)     # [&#8230;] → ...
-        text = re.sub(r'\[&hellip;\]', '...', text)    # [&hellip;] → ...
-
-        # Step 3: Fix remaining numeric entities
-        text = re.sub(r'&#8230;', '...', text)         # &#8230; → ...
-        text = re.sub(r'&#8217;', "'", text)           # &#8217; → ' (right single quote)
-        text = re.sub(r'&#8216;', "'", text)           # &#8216; → ' (left single quote)  
-        text = re.sub(r'&#8220;', '"', text)           # &#8220; → " (left double quote)
-        text = re.sub(r'&#8221;', '"', text)           # &#8221; → " (right double quote)
-        text = re.sub(r'&#8211;', '–', text)           # &#8211; → – (en dash)
-        text = re.sub(r'&#8212;', '—', text)           # &#8212; → — (em dash)
-        text = re.sub(r'&#38;', '&', text)             # &#38; → & (ampersand)
-        text = re.sub(r'&#39;', "'", text)             # &#39; → ' (apostrophe)
-        text = re.sub(r'&#34;', '"', text)             # &#34; → " (quote)
-        text = re.sub(r'&#60;', '<', text)             # &#60; → <
-        text = re.sub(r'&#62;', '>', text)             # &#62; → >
-
-        # Step 4: Fix named entities that might slip through
-        text = re.sub(r'&hellip;', '...', text)        # &hellip; → ...
-        text = re.sub(r'&rsquo;', "'", text)           # &rsquo; → '
-        text = re.sub(r'&lsquo;', "'", text)           # &lsquo; → '
-        text = re.sub(r'&rdquo;', '"', text)           # &rdquo; → "
-        text = re.sub(r'&ldquo;', '"', text)           # &ldquo; → "
-        text = re.sub(r'&ndash;', '–', text)           # &ndash; → –
-        text = re.sub(r'&mdash;', '—', text)           # &mdash; → —
-        text = re.sub(r'&amp;', '&', text)             # &amp; → &
-        text = re.sub(r'&quot;', '"', text)            # &quot; → "
-        text = re.sub(r'&apos;', "'", text)            # &apos; → '
-        text = re.sub(r'&lt;', '<', text)              # &lt; → <
-        text = re.sub(r'&gt;', '>', text)              # &gt; → >
-
-        # Step 5: Clean up any remaining malformed entities
-        text = re.sub(r'&[a-zA-Z0-9#]+;?', ' ', text)  # Remove any remaining entities
-
-        # Step 6: Clean up whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
-
-        return text
+        # Decode standard entities, fix leftovers in a single scan, collapse whitespace
+        return decode_entities(text)
 
     def contains_celebrity(self, title, content):
-        full_text = f"{title} {content}".lower()
-        found_celebrities = []
-
-        for celebrity_name in self.celebrity_names:
-            if len(celebrity_name) < 4:
-                continue
-            pattern = r'\b' + re.escape(celebrity_name) + r'\b'
-            if re.search(pattern, full_text):
-                found_celebrities.append(celebrity_name)
-
-        return found_celebrities
+        full_text = f"{title} {content}"
+        return self.celebrity_matcher.names_found(full_text)
 
     def extract_celebrity_mentions(self, title, content, source_weight=1):
-        text = f"{title} {content}".lower()
+        text = f"{title} {content}"
         mentions = {}
 
-        for celebrity_key, celebrity_data in self.celebrities.items():
-            if celebrity_data.get('memorial', False):
-                continue
-
-            main_name = celebrity_key.replace('_', ' ')
-            name_variations = [main_name] + self.get_name_variations(celebrity_key, main_name)
-
-            total_matches = 0
-            for name in name_variations:
-                if len(name) < 4:
-                    continue
-                pattern = r'\b' + re.escape(name.lower()) + r'\b'
-                matches = len(re.findall(pattern, text))
-                total_matches += matches
-
-            if total_matches > 0:
-                weighted_mentions = total_matches * source_weight
-                mentions[celebrity_key] = weighted_mentions
-                self.celebrity_mentions[celebrity_key] += weighted_mentions
+        for celebrity_key, total_matches in self.celebrity_matcher.mentions(text).items():
+            weighted_mentions = total_matches * source_weight
+            mentions[celebrity_key] = weighted_mentions
+            self.celebrity_mentions[celebrity_key] += weighted_mentions
 
         return mentions
 
@@ -373,7 +332,8 @@ class GossipScraper:
     def create_blog_post(self, title, content, link, mentions, source):
         """🎯 FIXED: Create Jekyll blog post with clean filenames and entity-free content"""
         # Generate filename with clean slug (no length limit)
-        date_str = datetime.now().strftime('%Y-%m-%d')
+        post_time = datetime.now()
+        date_str = post_time.strftime('%Y-%m-%d')
         slug = self.create_clean_slug(title)
         filename = f"{date_str}-{slug}.md"
 
@@ -414,7 +374,7 @@ class GossipScraper:
         post_content = f"""---
 layout: post
 title: "{escaped_title}"
-date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} +0000
+date: {post_time.strftime('%Y-%m-%d %H:%M:%S')} +0000
 categories: gossip
 tags: {tags}
 drama_score: {total_drama_score}
@@ -441,94 +401,212 @@ mentions: {dict(mentions)}
             'content': post_content,
             'drama_score': total_drama_score,
             'mentions': mentions,
-            'title': title  # Add for deduplication
+            'title': title,  # Add for deduplication
+            'date': post_time
         }
 
-    def scrape_feed(self, feed_name, feed_info):
-        try:
-            logger.info(f"Scraping {feed_name}...")
+    def wait_for_host(self, url):
+        """Sleep until the politeness delay for this feed's host has passed"""
+        host = urlparse(url).netloc
+        with self.host_lock:
+            now = time.monotonic()
+            ready_at = max(now, self.host_next_request.get(host, 0))
+            self.host_next_request[host] = ready_at + self.host_delay
 
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (compatible; GossipRoomBot/1.0)'
-            }
+        if ready_at > now:
+            time.sleep(ready_at - now)
 
-            response = requests.get(feed_info['url'], headers=headers, timeout=30)
-            response.raise_for_status()
+    def fetch_feed(self, feed_name, feed_info):
+        """Download a feed and return its raw body (safe to run in a worker thread)
 
-            feed = feedparser.parse(response.content)
+        Returns None when the feed is unchanged since the last run, either
+        because the server answered 304 or because the body hash matches.
+        """
+        self.wait_for_host(feed_info['url'])
 
-            articles_processed = 0
-            articles_rejected = 0
-            all_articles_info = []
+        headers = {
+            'User-Agent': 'Mozilla/5.0 (compatible; GossipRoomBot/1.0)'
+        }
 
-            for entry in feed.entries[:20]:
-                if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                    pub_date = datetime(*entry.published_parsed[:6])
-                    if datetime.now() - pub_date > timedelta(hours=48):
-                        continue
+        cached = self.feed_cache.get(feed_name, {})
+        if cached.get('url') == feed_info['url']:
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
+        else:
+            cached = {}
 
-                title = self.clean_text(entry.get('title', ''))
-                content = self.clean_text(entry.get('summary', '') or entry.get('description', ''))
-                link = entry.get('link', '')
+        start_time = time.time()
+        response = requests.get(feed_info['url'], headers=headers, timeout=30)
+        self.feed_timings[feed_name] = time.time() - start_time
 
-                normalized_title = self.normalize_title(title)
-                article_id = hashlib.md5(f"{normalized_title}{feed_name}".encode()).hexdigest()
+        if response.status_code == 304:
+            self.bytes_saved[feed_name] = cached.get('bytes', 0)
+            return None
 
-                article_info = {
-                    'title': title,
-                    'link': link,
-                    'accepted': False,
-                    'rejection_reason': None,
-                    'celebrities': []
-                }
+        response.raise_for_status()
 
-                rejection_reason = self.get_rejection_reason(title, content, link, article_id)
+        body = response.content
+        body_hash = hashlib.sha256(body).hexdigest()
+        unchanged = cached.get('body_hash') == body_hash
 
-                if rejection_reason != "Unknown rejection reason":
-                    article_info['rejection_reason'] = rejection_reason
-                    articles_rejected += 1
-                    all_articles_info.append(article_info)
+        self.pending_feed_cache[feed_name] = {
+            'url': feed_info['url'],
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'body_hash': body_hash,
+            'bytes': len(body),
+            'last_changed': cached.get('last_changed') if unchanged else datetime.now().isoformat()
+        }
+
+        if unchanged:
+            # Server ignored the conditional headers, but we can still skip parsing
+            self.bytes_saved[feed_name] = 0
+            return None
+
+        return body
+
+    def commit_feed_cache(self, feed_name):
+        """Remember a feed's validators only once its articles have been handled"""
+        if feed_name in self.pending_feed_cache:
+            self.feed_cache[feed_name] = self.pending_feed_cache.pop(feed_name)
+
+    def log_unchanged_feed(self, feed_name):
+        fetch_time = self.feed_timings.get(feed_name, 0)
+        saved = self.bytes_saved.get(feed_name, 0)
+        logger.info(f"⚪ {feed_name}: unchanged since last run, skipped parsing "
+                    f"({saved / 1024:.1f} KB saved, {fetch_time:.1f}s fetch)")
+        debug_logger.info(f"⚪ {feed_name}: unchanged ({saved} bytes saved)")
+        self.commit_feed_cache(feed_name)
+
+    def process_feed(self, feed_name, feed_info, feed_content):
+        """Parse a downloaded feed and turn matching articles into posts"""
+        feed = feedparser.parse(feed_content)
+
+        articles_processed = 0
+        articles_rejected = 0
+        all_articles_info = []
+
+        for entry in feed.entries[:20]:
+            if hasattr(entry, 'published_parsed') and entry.published_parsed:
+                pub_date = datetime(*entry.published_parsed[:6])
+                if datetime.now() - pub_date > timedelta(hours=48):
                     continue
 
-                found_celebrities = self.contains_celebrity(title, content)
+            title = self.clean_text(entry.get('title', ''))
+            content = self.clean_text(entry.get('summary', '') or entry.get('description', ''))
+            link = entry.get('link', '')
+
+            normalized_title = self.normalize_title(title)
+            article_id = hashlib.md5(f"{normalized_title}{feed_name}".encode()).hexdigest()
+
+            article_info = {
+                'title': title,
+                'link': link,
+                'accepted': False,
+                'rejection_reason': None,
+                'celebrities': []
+            }
+
+            rejection_reason = self.get_rejection_reason(title, content, link, article_id)
+
+            if rejection_reason != "Unknown rejection reason":
+                article_info['rejection_reason'] = rejection_reason
+                articles_rejected += 1
+                all_articles_info.append(article_info)
+                continue
+
+            found_celebrities = self.contains_celebrity(title, content)
+
+            if not found_celebrities:
+                article_info['rejection_reason'] = "No celebrity matches found"
+                articles_rejected += 1
+                all_articles_info.append(article_info)
+                continue
+
+            duplicate = self.find_recent_duplicate(title, content)
+            if duplicate:
+                match, similarity = duplicate
+                article_info['rejection_reason'] = (f"Near-duplicate ({similarity:.2f}) of {match['match']}: "
+                                                    f"{match['title'][:60]}")
+                debug_logger.info(f"🔁 {feed_name}: '{title[:60]}' repeats '{match['title'][:60]}' "
+                                  f"({match['match']}, similarity {similarity:.2f})")
+                self.cross_run_duplicates += 1
+                articles_rejected += 1
+                all_articles_info.append(article_info)
+                continue
+
+            mentions = self.extract_celebrity_mentions(title, content, feed_info['weight'])
+            self.detect_potential_celebrities(title, content)
 
-                if not found_celebrities:
-                    article_info['rejection_reason'] = "No celebrity matches found"
-                    articles_rejected += 1
+            if mentions:
+                # 🎯 FIXED: Create blog post with clean filename and entity-free content
+                post_data = self.create_blog_post(title, content, link, mentions, feed_name)
+                if post_data:
+                    article_info['accepted'] = True
+                    article_info['celebrities'] = found_celebrities
                     all_articles_info.append(article_info)
-                    continue
 
-                mentions = self.extract_celebrity_mentions(title, content, feed_info['weight'])
-                self.detect_potential_celebrities(title, content)
-
-                if mentions:
-                    # 🎯 FIXED: Create blog post with clean filename and entity-free content
-                    post_data = self.create_blog_post(title, content, link, mentions, feed_name)
-                    if post_data:
-                        article_info['accepted'] = True
-                        article_info['celebrities'] = found_celebrities
-                        all_articles_info.append(article_info)
-
-                        self.new_posts.append(post_data)
-                        self.processed_articles[article_id] = {
-                            'title': title,
-                            'normalized_title': normalized_title,
-                            'link': link,
-                            'processed_date': datetime.now().isoformat()
-                        }
-                        articles_processed += 1
-
-            self.log_feed_results(feed_name, all_articles_info, 
-                                [a for a in all_articles_info if a['accepted']], 
-                                articles_rejected)
-
-            logger.info(f"✅ {feed_name}: {articles_processed} posts, {articles_rejected} rejected")
+                    self.new_posts.append(post_data)
+                    self.processed_articles[article_id] = {
+                        'title': title,
+                        'normalized_title': normalized_title,
+                        'link': link,
+                        'excerpt': content[:200],
+                        'processed_date': datetime.now().isoformat()
+                    }
+                    articles_processed += 1
+
+        self.log_feed_results(feed_name, all_articles_info, 
+                            [a for a in all_articles_info if a['accepted']], 
+                            articles_rejected)
+
+        fetch_time = self.feed_timings.get(feed_name, 0)
+        logger.info(f"✅ {feed_name}: {articles_processed} posts, {articles_rejected} rejected ({fetch_time:.1f}s fetch)")
+        debug_logger.info(f"⏱️ {feed_name}: fetched in {fetch_time:.2f}s")
+        self.commit_feed_cache(feed_name)
+
+    def scrape_feed(self, feed_name, feed_info):
+        """Serial mode: fetch and process one feed, then pause before the next"""
+        try:
+            logger.info(f"Scraping {feed_name}...")
+
+            feed_content = self.fetch_feed(feed_name, feed_info)
+            if feed_content is None:
+                self.log_unchanged_feed(feed_name)
+            else:
+                self.process_feed(feed_name, feed_info, feed_content)
+
             time.sleep(0.5)
 
         except Exception as e:
             logger.error(f"❌ Error scraping {feed_name}: {e}")
             debug_logger.error(f"❌ Error scraping {feed_name}: {e}")
 
+    def scrape_feeds_concurrently(self):
+        """Fetch all feeds in a thread pool and process each one as it arrives"""
+        logger.info(f"Scraping {len(self.rss_feeds)} feeds with {self.max_workers} workers...")
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                executor.submit(self.fetch_feed, feed_name, feed_info): feed_name
+                for feed_name, feed_info in self.rss_feeds.items()
+            }
+
+            # Parsing and matching stay on the main thread, so shared state needs no locking
+            for future in as_completed(futures):
+                feed_name = futures[future]
+                try:
+                    feed_content = future.result()
+                    if feed_content is None:
+                        self.log_unchanged_feed(feed_name)
+                    else:
+                        self.process_feed(feed_name, self.rss_feeds[feed_name], feed_content)
+                except Exception as e:
+                    logger.error(f"❌ Error scraping {feed_name}: {e}")
+                    debug_logger.error(f"❌ Error scraping {feed_name}: {e}")
+
     def update_celebrity_scores(self):
         for celebrity_key, mentions in self.celebrity_mentions.items():
             if celebrity_key in self.celebrities:
@@ -573,6 +651,17 @@ mentions: {dict(mentions)}
 
         return new_celebrities
 
+    def bluesky_payload(self, post):
+        """Ready-made Bluesky share for a post being written, queued alongside it"""
+        try:
+            front_matter, _ = parse_front_matter(post['content'])
+        except Exception as e:
+            logger.warning(f"⚠️ No Bluesky payload for {post['filename']}: {e}")
+            return None
+        payload = build_payload(post['filename'], front_matter)
+        payload['sha1'] = content_sha1(post['content'].encode('utf-8'))
+        return payload
+
     def save_data(self):
         self.ensure_data_directory()
 
@@ -590,17 +679,24 @@ mentions: {dict(mentions)}
         posts_dir.mkdir(exist_ok=True)
 
         created_posts = 0
+        candidate_queue = CandidateQueue(Path('data'))
         for post in final_posts:
             post_path = posts_dir / post['filename']
             # Check if file already exists
             if not post_path.exists():
                 with open(post_path, 'w', encoding='utf-8') as f:
                     f.write(post['content'])
+                candidate_queue.push(post['filename'], post['drama_score'], post['date'],
+                                     self.bluesky_payload(post))
                 created_posts += 1
                 logger.info(f"✅ Created: {post['filename']}")
 
         logger.info(f"📝 Created {created_posts} new Jekyll posts")
 
+        # Hand the new posts to the Bluesky poster (which seeds the queue itself on its first run)
+        if created_posts and candidate_queue.exists():
+            candidate_queue.save()
+
         # Save JSON data for debugging
         gossip_data = {
             'entries': final_posts,
@@ -621,13 +717,15 @@ mentions: {dict(mentions)}
             json.dump(gossip_data, f, default=str, indent=2)
 
         try:
-            with open(self.base_path / '_data' / 'celebrities.yml', 'w') as f:
-                yaml.dump(self.celebrities, f, default_flow_style=False, sort_keys=True)
-            logger.info("✅ Updated celebrities.yml")
+            # self.celebrities is people only; the store merges just the changed entries
+            # back, so brands and temperature metadata are left as they are
+            updated = self.celebrity_store.save()
+            logger.info(f"✅ Updated {updated} entries in celebrities.yml")
         except Exception as e:
             logger.error(f"❌ Error saving celebrities.yml: {e}")
 
         self.save_processed_articles()
+        self.save_feed_cache()
         logger.info(f"💾 Final output: {len(final_posts)} unique posts")
 
     def run(self):
@@ -638,14 +736,31 @@ mentions: {dict(mentions)}
         logger.info("🎭 Starting Enhanced Gossip Room scraper with HTML entity protection...")
         logger.info(f"📋 Loaded {len(self.celebrities)} celebrities")
 
-        for feed_name, feed_info in self.rss_feeds.items():
-            self.scrape_feed(feed_name, feed_info)
+        fetch_start = time.time()
+        if self.serial:
+            for feed_name, feed_info in self.rss_feeds.items():
+                self.scrape_feed(feed_name, feed_info)
+        else:
+            self.scrape_feeds_concurrently()
+
+        fetch_elapsed = time.time() - fetch_start
+        mode = "serial" if self.serial else f"{self.max_workers} workers"
+        logger.info(f"⏱️ Scraped {len(self.rss_feeds)} feeds in {fetch_elapsed:.1f}s ({mode})")
+        debug_logger.info(f"⏱️ Total feed wall time: {fetch_elapsed:.2f}s ({mode})")
+
+        if self.cross_run_duplicates:
+            logger.info(f"🔁 Rejected {self.cross_run_duplicates} stories already published in the last {self.dedup_days} days")
+
+        if self.bytes_saved:
+            total_saved = sum(self.bytes_saved.values())
+            logger.info(f"📦 {len(self.bytes_saved)} feeds unchanged, {total_saved / 1024:.1f} KB not downloaded")
 
         self.update_celebrity_scores()
 
         new_celebrities = self.check_auto_discovery()
         if new_celebrities:
             self.celebrities.update(new_celebrities)
+            self.celebrity_store.celebrities.update(new_celebrities)
             logger.info(f"🆕 Added {len(new_celebrities)} new celebrities")
 
         self.save_data()
@@ -660,5 +775,23 @@ mentions: {dict(mentions)}
                 logger.info(f"   {celebrity.replace('_', ' ').title()}: {count}")
 
 if __name__ == "__main__":
-    scraper = GossipScraper()
+    parser = argparse.ArgumentParser(description='Enhanced Gossip Room RSS Scraper')
+    parser.add_argument('--serial', action='store_true',
+                       help='Fetch feeds one at a time (original behaviour)')
+    parser.add_argument('--max-workers', type=int, default=6,
+                       help='Maximum number of feeds fetched concurrently')
+    parser.add_argument('--host-delay', type=float, default=0.5,
+                       help='Minimum seconds between requests to the same host')
+    parser.add_argument('--no-feed-cache', action='store_true',
+                       help='Ignore data/feed_cache.json and download every feed in full')
+    parser.add_argument('--dedup-days', type=int, default=2,
+                       help='Reject stories similar to ones published in the last N days (0 disables)')
+    parser.add_argument('--dedup-threshold', type=float, default=0.8,
+                       help='Title similarity at which a story counts as already published')
+
+    args = parser.parse_args()
+
+    scraper = GossipScraper(max_workers=args.max_workers, host_delay=args.host_delay,
+                            serial=args.serial, use_feed_cache=not args.no_feed_cache,
+                            dedup_days=args.dedup_days, dedup_threshold=args.dedup_threshold)
     scraper.run()
@@ -3,13 +3,18 @@ import re
 import yaml
 from pathlib import Path
 import logging
+import argparse
+
+from changed_posts import add_selection_arguments, select_posts
+from post_pool import post_result, process_posts, summarize, write_summary
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 logger = logging.getLogger(__name__)
 
-def fix_yaml_frontmatter(content):
-    """Fix all YAML front matter issues"""
+def fix_yaml_frontmatter(content, fixes=None):
+    """Fix all YAML front matter issues, noting each fix in `fixes` if given"""
+    fixes = [] if fixes is None else fixes
     lines = content.split('\n')
 
     # Find front matter boundaries
@@ -25,13 +30,13 @@ def fix_yaml_frontmatter(content):
                 break
 
     if start_idx is None:
-        logger.warning("No front matter start found")
+        fixes.append("No front matter start found")
         return content
 
     # Extract front matter and content
     if end_idx is None:
         # Missing closing ---
-        logger.info("Missing closing --- delimiter")
+        fixes.append("Missing closing --- delimiter")
         yaml_lines = lines[start_idx + 1:]
         post_content = ""
 
@@ -57,7 +62,7 @@ def fix_yaml_frontmatter(content):
         post_content = '\n'.join(lines[end_idx + 1:])
 
     # Fix YAML content
-    fixed_yaml = fix_yaml_content(yaml_content)
+    fixed_yaml = fix_yaml_content(yaml_content, fixes)
 
     # Reconstruct file
     result = "---\n" + fixed_yaml + "\n---\n"
@@ -66,8 +71,9 @@ def fix_yaml_frontmatter(content):
 
     return result
 
-def fix_yaml_content(yaml_content):
+def fix_yaml_content(yaml_content, fixes=None):
     """Fix YAML syntax issues"""
+    fixes = [] if fixes is None else fixes
     lines = yaml_content.split('\n')
     fixed_lines = []
 
@@ -105,11 +111,11 @@ def fix_yaml_content(yaml_content):
 
         # Remove any content that leaked into YAML
         elif is_content_not_yaml(line):
-            logger.info(f"Removing content from YAML: {line[:50]}...")
+            fixes.append(f"Removing content from YAML: {line[:50]}...")
             continue
 
         if line != original_line:
-            logger.info(f"Fixed: {original_line.strip()} -> {line.strip()}")
+            fixes.append(f"Fixed: {original_line.strip()} -> {line.strip()}")
 
         fixed_lines.append(line)
 
@@ -263,51 +269,71 @@ def is_content_not_yaml(line):
     return False
 
 def process_markdown_file(file_path):
-    """Process a single markdown file"""
+    """Process a single markdown file and return its result record"""
+    fixes = []
     try:
         with open(file_path, 'r', encoding='utf-8') as f:
             content = f.read()
 
         original_content = content
-        fixed_content = fix_yaml_frontmatter(content)
+        fixed_content = fix_yaml_frontmatter(content, fixes)
 
         if fixed_content != original_content:
             with open(file_path, 'w', encoding='utf-8') as f:
                 f.write(fixed_content)
-            logger.info(f"✅ Fixed: {file_path.name}")
-            return True
-        else:
-            logger.info(f"⚪ No changes needed: {file_path.name}")
-            return False
+            return post_result(file_path, changed=True, fixes=fixes)
+        return post_result(file_path, fixes=fixes)
 
     except Exception as e:
-        logger.error(f"❌ Error processing {file_path}: {e}")
-        return False
+        return post_result(file_path, fixes=fixes, error=str(e))
+
+def log_result(result):
+    """Log one worker's record from the main process, so output never interleaves"""
+    for fix in result['fixes']:
+        logger.info(fix)
 
-def main():
-    """Main function to process all markdown files"""
+    if result['error']:
+        logger.error(f"❌ Error processing {result['file']}: {result['error']}")
+    elif result['changed']:
+        logger.info(f"✅ Fixed: {result['file']}")
+    else:
+        logger.info(f"⚪ No changes needed: {result['file']}")
+
+def main(workers=1, chunk_size=None, summary_file=None, since=None, files=None):
+    """Main function to process all markdown files (or just the changed ones)"""
     posts_dir = Path('_posts')
 
     if not posts_dir.exists():
         logger.error("❌ _posts directory not found!")
         return
 
-    markdown_files = list(posts_dir.glob('*.md'))
+    try:
+        markdown_files = select_posts(posts_dir, since, files)
+    except ValueError as e:
+        logger.error(f"❌ {e}")
+        return
 
     if not markdown_files:
         logger.warning("⚠️ No markdown files found in _posts directory")
         return
 
-    logger.info(f"🔧 Processing {len(markdown_files)} markdown files...")
+    logger.info(f"🔧 Processing {len(markdown_files)} markdown files with {workers or 'all'} workers...")
+
+    results = []
+    for result in process_posts(process_markdown_file, markdown_files, workers, chunk_size):
+        log_result(result)
+        results.append(result)
 
-    fixed_count = 0
-    total_count = len(markdown_files)
+    totals = summarize(results)
+    fixed_count = totals['changed']
+    total_count = totals['total']
 
-    for file_path in markdown_files:
-        if process_markdown_file(file_path):
-            fixed_count += 1
+    logger.info(f"🎉 COMPLETE! Fixed {fixed_count}/{total_count} files "
+                f"({totals['fixes']} fixes, {totals['errors']} errors)")
 
-    logger.info(f"🎉 COMPLETE! Fixed {fixed_count}/{total_count} files")
+    if summary_file:
+        write_summary(results, summary_file, "YAML Front Matter Fix Summary")
+        logger.info(f"📝 Summary written to {summary_file}")
 
     if fixed_count > 0:
         logger.info("✅ All YAML front matter issues should now be resolved!")
@@ -321,4 +347,15 @@ def main():
         logger.info("⚪ No files needed fixing - all good!")
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description='Fix YAML front matter in every post')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Worker processes (0 = one per CPU core)')
+    parser.add_argument('--chunk-size', type=int, default=None,
+                        help='Posts handed to a worker at a time (default: spread evenly)')
+    parser.add_argument('--summary', default=None,
+                        help='Also write a per-file report here, e.g. yaml_fix_summary.txt')
+    add_selection_arguments(parser)
+    args = parser.parse_args()
+
+    main(workers=args.workers, chunk_size=args.chunk_size, summary_file=args.summary,
+         since=args.since, files=args.files)
@@ -4,11 +4,12 @@ Memorial Cleanup System
 Automatically manages memorial status and 18-month removal
 """
 
-import yaml
 from pathlib import Path
 from datetime import datetime, timedelta
 import argparse
 
+from celebrity_store import CelebrityStore
+
 class MemorialCleanup:
     def __init__(self):
         self.base_path = Path.cwd()
@@ -17,12 +18,8 @@ class MemorialCleanup:
 
     def load_celebrities(self):
         """Load celebrity data"""
-        celebrities_file = self.data_dir / 'celebrities.yml'
-        if celebrities_file.exists():
-            with open(celebrities_file, 'r') as f:
-                self.celebrities = yaml.safe_load(f) or {}
-        else:
-            self.celebrities = {}
+        self.store = CelebrityStore(self.data_dir)
+        self.celebrities = self.store.celebrities
 
     def cleanup_expired_memorials(self):
         """Remove celebrities who have been in memorial for 18+ months"""
@@ -123,10 +120,10 @@ class MemorialCleanup:
 
     def save_celebrities(self):
         """Save updated celebrity data"""
-        with open(self.data_dir / 'celebrities.yml', 'w') as f:
-            f.write("# Celebrity Drama Tracking Database\n")
-            f.write("# Auto-updated by discovery scripts and manual additions\n\n")
-            yaml.dump(self.celebrities, f, default_flow_style=False)
+        self.store.save(self.celebrities, header=(
+            "# Celebrity Drama Tracking Database\n"
+            "# Auto-updated by discovery scripts and manual additions\n\n"
+        ))
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description='Memorial Cleanup System')
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Celebrity Mention Buckets
+Persistent per-celebrity daily mention counts, updated incrementally from the
+post index so a temperature run only scans posts added or edited since the last one
+"""
+
+import hashlib
+import json
+import sqlite3
+from datetime import date, datetime
+from pathlib import Path
+
+# Bump whenever the schema changes; the buckets are rebuilt from scratch
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS counted_posts (
+    filename TEXT PRIMARY KEY,
+    day TEXT,
+    sha1 TEXT
+);
+CREATE TABLE IF NOT EXISTS post_mentions (
+    filename TEXT,
+    celebrity_id TEXT,
+    mentions INTEGER,
+    hits INTEGER,
+    PRIMARY KEY (filename, celebrity_id)
+);
+CREATE TABLE IF NOT EXISTS mention_buckets (
+    celebrity_id TEXT,
+    day TEXT,
+    mentions INTEGER,
+    hits INTEGER,
+    PRIMARY KEY (celebrity_id, day)
+);
+CREATE TABLE IF NOT EXISTS bucket_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_counted_posts_day ON counted_posts (day);
+CREATE INDEX IF NOT EXISTS idx_mention_buckets_day ON mention_buckets (day);
+"""
+
+def matcher_signature(matcher):
+    """Hash of the names a matcher searches for and who they credit"""
+    patterns = sorted((name, sorted(keys)) for name, keys in matcher.owners.items())
+    return hashlib.sha1(json.dumps(patterns).encode('utf-8')).hexdigest()
+
+def day_string(value):
+    if isinstance(value, (datetime, date)):
+        return value.strftime('%Y-%m-%d')
+    return str(value)
+
+def count_mentions(matcher, content):
+    """{celebrity_id: (mentions, hits)} for one post
+
+    A hit is one matched name crediting the celebrity, so a post naming
+    someone both as "taylor swift" and "taylor_swift" scores two hits, the
+    same way the temperature scores have always counted it.
+    """
+    counts = {}
+    for name, mention_count in matcher.scan(content).items():
+        for celebrity_id in matcher.owners[name]:
+            mentions, hits = counts.get(celebrity_id, (0, 0))
+            counts[celebrity_id] = (mentions + mention_count, hits + 1)
+    return counts
+
+class MentionBuckets:
+    """SQLite store of (celebrity, day) -> mention and hit counts
+
+    Every counted post keeps its own per-celebrity contribution, so an edited
+    or deleted post can be backed out of its bucket without rescanning the rest
+    of the day. Posts older than the lookback window are expired on refresh,
+    and a change to the matcher's names rebuilds the buckets from scratch.
+    """
+
+    def __init__(self, base_path=None, db_path=None):
+        self.base_path = Path(base_path) if base_path else Path.cwd()
+        self.posts_dir = self.base_path / '_posts'
+        self.db_path = Path(db_path) if db_path else self.base_path / 'data' / 'mention_buckets.sqlite3'
+        self.db_path.parent.mkdir(exist_ok=True)
+
+        self.conn = sqlite3.connect(str(self.db_path))
+        self.conn.row_factory = sqlite3.Row
+        self.ensure_schema()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.conn.close()
+
+    def ensure_schema(self):
+        version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != SCHEMA_VERSION:
+            self.conn.executescript(
+                "DROP TABLE IF EXISTS counted_posts; DROP TABLE IF EXISTS post_mentions; "
+                "DROP TABLE IF EXISTS mention_buckets; DROP TABLE IF EXISTS bucket_meta;")
+        self.conn.executescript(SCHEMA)
+        self.conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self.conn.commit()
+
+    def clear(self):
+        self.conn.executescript(
+            "DELETE FROM counted_posts; DELETE FROM post_mentions; DELETE FROM mention_buckets;")
+
+    def refresh(self, post_index, matcher, since):
+        """Count new or edited posts dated on or after `since` and expire older ones
+
+        `post_index` must already be refreshed. Returns a stats dict.
+        """
+        since = day_string(since)
+        stats = {'scanned': 0, 'removed': 0, 'expired': 0, 'rebuilt': False}
+
+        signature = matcher_signature(matcher)
+        row = self.conn.execute("SELECT value FROM bucket_meta WHERE key = 'matcher'").fetchone()
+        if row is None or row['value'] != signature:
+            self.clear()
+            self.conn.execute("INSERT OR REPLACE INTO bucket_meta (key, value) VALUES ('matcher', ?)",
+                              (signature,))
+            stats['rebuilt'] = True
+
+        stats['expired'] = self.expire(since)
+
+        current = post_index.content_hashes_since(since)
+        counted = {
+            row['filename']: row['sha1']
+            for row in self.conn.execute("SELECT filename, sha1 FROM counted_posts")
+        }
+
+        for filename, sha1 in counted.items():
+            if current.get(filename, (None, None))[1] != sha1:
+                self.remove_post(filename)
+                stats['removed'] += 1
+
+        for filename, (day, sha1) in current.items():
+            if counted.get(filename) == sha1:
+                continue
+            try:
+                datetime.strptime(day, '%Y-%m-%d')
+                with open(self.posts_dir / filename, 'r', encoding='utf-8') as f:
+                    content = f.read()
+            except (ValueError, TypeError, OSError):
+                continue
+
+            self.add_post(filename, day, sha1, count_mentions(matcher, content))
+            stats['scanned'] += 1
+
+        self.conn.commit()
+        return stats
+
+    def add_post(self, filename, day, sha1, mentions):
+        self.conn.execute("INSERT INTO counted_posts (filename, day, sha1) VALUES (?, ?, ?)",
+                          (filename, day, sha1))
+        for celebrity_id, (count, hits) in mentions.items():
+            self.conn.execute(
+                "INSERT INTO post_mentions (filename, celebrity_id, mentions, hits) VALUES (?, ?, ?, ?)",
+                (filename, celebrity_id, count, hits))
+            self.conn.execute(
+                """INSERT INTO mention_buckets (celebrity_id, day, mentions, hits) VALUES (?, ?, ?, ?)
+                   ON CONFLICT (celebrity_id, day)
+                   DO UPDATE SET mentions = mentions + excluded.mentions, hits = hits + excluded.hits""",
+                (celebrity_id, day, count, hits))
+
+    def remove_post(self, filename):
+        row = self.conn.execute("SELECT day FROM counted_posts WHERE filename = ?", (filename,)).fetchone()
+        if row is None:
+            return
+
+        for mention in self.conn.execute(
+                "SELECT celebrity_id, mentions, hits FROM post_mentions WHERE filename = ?",
+                (filename,)).fetchall():
+            self.conn.execute(
+                """UPDATE mention_buckets SET mentions = mentions - ?, hits = hits - ?
+                   WHERE celebrity_id = ? AND day = ?""",
+                (mention['mentions'], mention['hits'], mention['celebrity_id'], row['day']))
+
+        self.conn.execute("DELETE FROM mention_buckets WHERE hits <= 0")
+        self.conn.execute("DELETE FROM post_mentions WHERE filename = ?", (filename,))
+        self.conn.execute("DELETE FROM counted_posts WHERE filename = ?", (filename,))
+
+    def expire(self, since):
+        """Drop every bucket and counted post dated before `since`"""
+        expired = self.conn.execute("SELECT COUNT(*) FROM counted_posts WHERE day < ?", (since,)).fetchone()[0]
+        self.conn.execute(
+            "DELETE FROM post_mentions WHERE filename IN (SELECT filename FROM counted_posts WHERE day < ?)",
+            (since,))
+        self.conn.execute("DELETE FROM counted_posts WHERE day < ?", (since,))
+        self.conn.execute("DELETE FROM mention_buckets WHERE day < ?", (since,))
+        return expired
+
+    def buckets_since(self, since):
+        """{celebrity_id: [{'date', 'mentions', 'hits'}, ...]} for days on or after `since`"""
+        buckets = {}
+        for row in self.conn.execute(
+                "SELECT celebrity_id, day, mentions, hits FROM mention_buckets WHERE day >= ? "
+                "ORDER BY celebrity_id, day", (day_string(since),)):
+            buckets.setdefault(row['celebrity_id'], []).append({
+                'date': datetime.strptime(row['day'], '%Y-%m-%d'),
+                'mentions': row['mentions'],
+                'hits': row['hits'],
+            })
+        return buckets
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Near-Duplicate Title Index
+MinHash/LSH candidate index so only titles that share a bucket get the exact
+SequenceMatcher check used by the scraper's deduplication
+"""
+
+import random
+import re
+import zlib
+from difflib import SequenceMatcher
+from functools import lru_cache
+
+FILLER_WORDS = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by'}
+
+# 2**61 - 1, a Mersenne prime comfortably above the 32-bit shingle hashes
+HASH_PRIME = (1 << 61) - 1
+
+@lru_cache(maxsize=8192)
+def normalize_title(title):
+    """Normalize title for similarity comparison"""
+    title = re.sub(r'[!?.:;,\'""]', '', title.lower())
+    title = re.sub(r'\s+', ' ', title).strip()
+
+    return ' '.join(w for w in title.split() if w not in FILLER_WORDS)
+
+def similarity_above(norm1, norm2, threshold=0.8):
+    """SequenceMatcher(None, norm1, norm2).ratio() if it reaches threshold, else None"""
+    matcher = SequenceMatcher(None, norm1, norm2)
+
+    # Both quick ratios are upper bounds on ratio(), so failing either is final
+    if matcher.real_quick_ratio() < threshold or matcher.quick_ratio() < threshold:
+        return None
+
+    ratio = matcher.ratio()
+    return ratio if ratio >= threshold else None
+
+def shingles(text, size=3):
+    """Character shingles; texts shorter than one shingle are their own shingle"""
+    if len(text) <= size:
+        return {text}
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+class NearDuplicateIndex:
+    """LSH index over title (and optionally excerpt) shingles
+
+    The default 50 bands of 2 rows make any pair with shingle Jaccard
+    similarity of 0.35 or more a candidate with probability above 99.8%.
+    Titles at a 0.8 SequenceMatcher ratio sit well above that, so results
+    match the exhaustive pairwise comparison while most pairs are never
+    compared at all.
+    """
+
+    def __init__(self, threshold=0.8, bands=50, rows=2, shingle_size=3, seed=1337):
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = rows
+        self.shingle_size = shingle_size
+
+        rng = random.Random(seed)
+        self.permutations = [
+            (rng.randrange(1, HASH_PRIME), rng.randrange(0, HASH_PRIME))
+            for _ in range(bands * rows)
+        ]
+
+        self.entries = []  # (key, normalized title)
+        self.title_buckets = {}
+        self.excerpt_buckets = {}
+        self.band_cache = {}
+        self.comparisons = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def signature(self, text):
+        hashes = [zlib.crc32(shingle.encode('utf-8')) for shingle in shingles(text, self.shingle_size)]
+        return [min((a * h + b) % HASH_PRIME for h in hashes) for a, b in self.permutations]
+
+    def band_keys(self, text):
+        """LSH bucket keys for a normalized text (cached, since lookups are usually followed by an add)"""
+        band_keys = self.band_cache.get(text)
+        if band_keys is None:
+            signature = self.signature(text)
+            rows = self.rows
+            band_keys = [(band, tuple(signature[band * rows:(band + 1) * rows])) for band in range(self.bands)]
+            self.band_cache[text] = band_keys
+        return band_keys
+
+    def add(self, key, title, excerpt=None):
+        """Index a title under `key`; returns its entry id"""
+        normalized = normalize_title(title)
+        entry_id = len(self.entries)
+        self.entries.append((key, normalized))
+
+        for band_key in self.band_keys(normalized):
+            self.title_buckets.setdefault(band_key, []).append(entry_id)
+
+        if excerpt:
+            for band_key in self.band_keys(normalize_title(excerpt)):
+                self.excerpt_buckets.setdefault(band_key, []).append(entry_id)
+
+        return entry_id
+
+    def candidates(self, title, excerpt=None):
+        """Entry ids sharing at least one bucket, in insertion order"""
+        found = set()
+        for band_key in self.band_keys(normalize_title(title)):
+            found.update(self.title_buckets.get(band_key, ()))
+
+        # Excerpt buckets only widen the candidate set; the exact check stays on titles
+        if excerpt and self.excerpt_buckets:
+            for band_key in self.band_keys(normalize_title(excerpt)):
+                found.update(self.excerpt_buckets.get(band_key, ()))
+
+        return sorted(found)
+
+    def find_similar(self, title, excerpt=None):
+        """(key, similarity) of the earliest indexed title similar to `title`, or None"""
+        normalized = normalize_title(title)
+
+        for entry_id in self.candidates(title, excerpt):
+            key, other = self.entries[entry_id]
+            self.comparisons += 1
+            similarity = similarity_above(normalized, other, self.threshold)
+            if similarity is not None:
+                return key, similarity
+
+        return None
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Post Corpus
+The lookback window of posts, loaded once and shared by every temperature model
+"""
+
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from mention_buckets import MentionBuckets, matcher_signature
+from post_index import open_post_index
+
+class PostCorpus:
+    """Recent posts and celebrity mention buckets for one scoring run
+
+    The post index is refreshed once when the corpus opens; front matter and
+    mention buckets are loaded on first use and cached for later scorers.
+    """
+
+    def __init__(self, base_path=None, lookback_days=30):
+        self.base_path = Path(base_path) if base_path else Path.cwd()
+        self.lookback_days = lookback_days
+        self.cutoff_date = datetime.now() - timedelta(days=lookback_days)
+
+        self.post_index = open_post_index(self.base_path)
+        self.recent = None
+        self.mentions = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.post_index.close()
+
+    def recent_posts(self):
+        """Parsed posts dated inside the window, by filename date"""
+        if self.recent is None:
+            self.recent = self.post_index.posts_since(self.cutoff_date)
+        return self.recent
+
+    def celebrity_mentions(self, matcher):
+        """Each celebrity's daily mention buckets inside the window
+
+        Only posts added or edited since the previous run are scanned; the
+        rest of the window comes from the persisted buckets.
+        """
+        signature = matcher_signature(matcher)
+        if signature in self.mentions:
+            return self.mentions[signature]
+
+        with MentionBuckets(self.base_path) as buckets:
+            stats = buckets.refresh(self.post_index, matcher, self.cutoff_date)
+            celebrity_mentions = buckets.buckets_since(self.cutoff_date)
+
+        print(f"📊 Scanned {stats['scanned']} new or edited posts "
+              f"({stats['expired']} expired from the {self.lookback_days}-day window)")
+
+        # Buckets are whole days; keep the ones whose midnight falls inside the window
+        recent_mentions = {}
+        for celebrity_id, days_buckets in celebrity_mentions.items():
+            days_buckets = [bucket for bucket in days_buckets if bucket['date'] >= self.cutoff_date]
+            if days_buckets:
+                recent_mentions[celebrity_id] = days_buckets
+
+        self.mentions[signature] = recent_mentions
+        return recent_mentions
@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+"""
+Post Metadata Index
+Incremental SQLite index of Jekyll post front matter, shared by every script
+that used to glob and YAML-parse all of _posts on each run
+"""
+
+import hashlib
+import json
+import sqlite3
+from collections import Counter
+from datetime import date, datetime
+from pathlib import Path
+
+from bluesky_payload import build_payload
+import yaml_io
+
+# Bump whenever the schema changes; the index is rebuilt from scratch
+SCHEMA_VERSION = 3
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS posts (
+    filename TEXT PRIMARY KEY,
+    post_date TEXT,
+    date TEXT,
+    title TEXT,
+    drama_score REAL,
+    primary_celebrity TEXT,
+    source TEXT,
+    source_url TEXT,
+    tags TEXT,
+    mentions TEXT,
+    front_matter TEXT,
+    bluesky_payload TEXT,
+    parse_error TEXT,
+    mtime REAL,
+    size INTEGER,
+    sha1 TEXT
+);
+CREATE TABLE IF NOT EXISTS post_tags (
+    filename TEXT,
+    position INTEGER,
+    tag TEXT,
+    PRIMARY KEY (filename, position)
+);
+CREATE INDEX IF NOT EXISTS idx_posts_post_date ON posts (post_date);
+CREATE INDEX IF NOT EXISTS idx_posts_drama ON posts (drama_score DESC, date DESC);
+CREATE INDEX IF NOT EXISTS idx_post_tags_tag ON post_tags (tag);
+"""
+
+def json_default(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value)
+
+def normalize_date(value):
+    """Store front matter dates as text, the way scripts compare them"""
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value.isoformat(sep=' ')
+    return str(value)
+
+def parse_front_matter(content):
+    """Split a post into (front_matter dict, body) using the scripts' `---` convention"""
+    if not content.startswith('---'):
+        raise ValueError("No front matter")
+
+    parts = content.split('---', 2)
+    if len(parts) < 3:
+        raise ValueError("Unterminated front matter")
+
+    front_matter = yaml_io.load(parts[1])
+    if not isinstance(front_matter, dict):
+        raise ValueError("Front matter is not a mapping")
+
+    return front_matter, parts[2]
+
+class PostIndex:
+    """SQLite-backed front matter index for _posts/*.md
+
+    Only files whose mtime or size changed since the last refresh are read,
+    and only files whose content hash changed are re-parsed.
+    """
+
+    def __init__(self, base_path=None, db_path=None):
+        self.base_path = Path(base_path) if base_path else Path.cwd()
+        self.posts_dir = self.base_path / '_posts'
+        self.db_path = Path(db_path) if db_path else self.base_path / 'data' / 'post_index.sqlite3'
+        self.db_path.parent.mkdir(exist_ok=True)
+
+        self.conn = sqlite3.connect(str(self.db_path))
+        self.conn.row_factory = sqlite3.Row
+        self.ensure_schema()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.conn.close()
+
+    def ensure_schema(self):
+        version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != SCHEMA_VERSION:
+            self.conn.executescript("DROP TABLE IF EXISTS posts; DROP TABLE IF EXISTS post_tags;")
+        self.conn.executescript(SCHEMA)
+        self.conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self.conn.commit()
+
+    def refresh(self):
+        """Bring the index in line with _posts; returns a stats dict"""
+        stats = {'scanned': 0, 'parsed': 0, 'touched': 0, 'removed': 0}
+
+        known = {
+            row['filename']: (row['mtime'], row['size'], row['sha1'])
+            for row in self.conn.execute("SELECT filename, mtime, size, sha1 FROM posts")
+        }
+
+        seen = set()
+        if self.posts_dir.exists():
+            for post_file in self.posts_dir.glob('*.md'):
+                stats['scanned'] += 1
+                seen.add(post_file.name)
+
+                outcome = self.refresh_file(post_file, known.get(post_file.name))
+                if outcome:
+                    stats[outcome] += 1
+
+        for filename in set(known) - seen:
+            self.remove_post(filename)
+            stats['removed'] += 1
+
+        self.conn.commit()
+        return stats
+
+    def refresh_file(self, post_file, previous):
+        """Re-index one post if it changed; returns 'parsed', 'touched' or None
+
+        `previous` is the file's (mtime, size, sha1) row, or None if unindexed.
+        """
+        stat = post_file.stat()
+        if previous and previous[0] == stat.st_mtime and previous[1] == stat.st_size:
+            return None
+
+        raw = post_file.read_bytes()
+        sha1 = hashlib.sha1(raw).hexdigest()
+
+        # Same content, new mtime (e.g. a fresh checkout): no need to re-parse
+        if previous and previous[2] == sha1:
+            self.conn.execute("UPDATE posts SET mtime = ?, size = ? WHERE filename = ?",
+                              (stat.st_mtime, stat.st_size, post_file.name))
+            return 'touched'
+
+        self.index_post(post_file.name, raw, stat, sha1)
+        return 'parsed'
+
+    def post(self, filename):
+        """One post, re-indexed first if its file changed; None if missing or unparseable
+
+        Checks only this file, so callers that need a single post skip the
+        full refresh.
+        """
+        post_file = self.posts_dir / filename
+        row = self.conn.execute("SELECT mtime, size, sha1 FROM posts WHERE filename = ?",
+                                (filename,)).fetchone()
+
+        if not post_file.exists():
+            if row:
+                self.remove_post(filename)
+                self.conn.commit()
+            return None
+
+        if self.refresh_file(post_file, tuple(row) if row else None):
+            self.conn.commit()
+
+        results = self.query("SELECT * FROM posts WHERE filename = ? AND parse_error IS NULL",
+                             (filename,))
+        return results[0] if results else None
+
+    def index_post(self, filename, raw, stat, sha1):
+        front_matter = {}
+        parse_error = None
+        try:
+            front_matter, _ = parse_front_matter(raw.decode('utf-8'))
+        except Exception as e:
+            parse_error = str(e) or e.__class__.__name__
+
+        tags = front_matter.get('tags') or []
+        if not isinstance(tags, list):
+            tags = [tags]
+
+        drama_score = front_matter.get('drama_score', 0)
+        if not isinstance(drama_score, (int, float)):
+            drama_score = 0
+
+        # Built once per content change, so the poster never formats posts itself
+        payload = build_payload(filename, front_matter) if parse_error is None else None
+
+        self.remove_post(filename)
+        self.conn.execute(
+            """INSERT INTO posts (filename, post_date, date, title, drama_score, primary_celebrity,
+                                  source, source_url, tags, mentions, front_matter, bluesky_payload,
+                                  parse_error, mtime, size, sha1)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            (
+                filename,
+                filename[:10],
+                normalize_date(front_matter.get('date')),
+                front_matter.get('title'),
+                drama_score,
+                front_matter.get('primary_celebrity'),
+                front_matter.get('source'),
+                front_matter.get('source_url'),
+                json.dumps(tags, default=json_default),
+                json.dumps(front_matter.get('mentions'), default=json_default),
+                json.dumps(front_matter, default=json_default),
+                json.dumps(payload, ensure_ascii=False) if payload else None,
+                parse_error,
+                stat.st_mtime,
+                stat.st_size,
+                sha1,
+            )
+        )
+        self.conn.executemany(
+            "INSERT INTO post_tags (filename, position, tag) VALUES (?, ?, ?)",
+            [(filename, i, str(tag)) for i, tag in enumerate(tags)]
+        )
+
+    def remove_post(self, filename):
+        self.conn.execute("DELETE FROM posts WHERE filename = ?", (filename,))
+        self.conn.execute("DELETE FROM post_tags WHERE filename = ?", (filename,))
+
+    def row_to_post(self, row):
+        post = dict(row)
+        post['tags'] = json.loads(post['tags'] or '[]')
+        post['mentions'] = json.loads(post['mentions'] or 'null')
+        post['front_matter'] = json.loads(post['front_matter'] or '{}')
+        post['bluesky_payload'] = json.loads(post['bluesky_payload'] or 'null')
+        post['path'] = self.posts_dir / post['filename']
+        return post
+
+    def query(self, sql, params=()):
+        return [self.row_to_post(row) for row in self.conn.execute(sql, params)]
+
+    # ----- Query helpers -----
+
+    def all_posts(self, include_errors=False):
+        where = "" if include_errors else "WHERE parse_error IS NULL"
+        return self.query(f"SELECT * FROM posts {where} ORDER BY filename")
+
+    def posts_since(self, since, use_front_matter_date=False, include_errors=False):
+        """Posts dated on or after the day of `since` (a date, datetime or YYYY-MM-DD string)
+
+        By default the date comes from the filename prefix; pass
+        use_front_matter_date=True to compare the front matter `date` instead.
+        """
+        if isinstance(since, (datetime, date)):
+            since = since.strftime('%Y-%m-%d')
+        column = 'substr(date, 1, 10)' if use_front_matter_date else 'post_date'
+        errors = "" if include_errors else "parse_error IS NULL AND"
+        return self.query(
+            f"SELECT * FROM posts WHERE {errors} {column} >= ? ORDER BY filename",
+            (since,)
+        )
+
+    def content_hashes_since(self, since):
+        """{filename: (post_date, sha1)} for posts dated on or after `since`, parse errors included
+
+        Reads only the bookkeeping columns, so callers can spot new or edited
+        posts without decoding any front matter.
+        """
+        if isinstance(since, (datetime, date)):
+            since = since.strftime('%Y-%m-%d')
+        return {
+            row['filename']: (row['post_date'], row['sha1'])
+            for row in self.conn.execute(
+                "SELECT filename, post_date, sha1 FROM posts WHERE post_date >= ?", (since,))
+        }
+
+    def posts_with_tag(self, tag):
+        return self.query(
+            """SELECT * FROM posts WHERE parse_error IS NULL AND filename IN
+               (SELECT filename FROM post_tags WHERE tag = ?) ORDER BY filename""",
+            (str(tag),)
+        )
+
+    def posts_with_any_tag(self, tags):
+        tags = [str(tag) for tag in tags]
+        if not tags:
+            return []
+        placeholders = ', '.join('?' for _ in tags)
+        return self.query(
+            f"""SELECT * FROM posts WHERE parse_error IS NULL AND filename IN
+                (SELECT filename FROM post_tags WHERE tag IN ({placeholders})) ORDER BY filename""",
+            tags
+        )
+
+    def top_unposted(self, posted, min_score=0, since=None, limit=None):
+        """Unposted posts ordered by drama score, then date (both descending)"""
+        posted = set(posted)
+        sql = "SELECT * FROM posts WHERE parse_error IS NULL AND drama_score >= ?"
+        params = [min_score]
+        if since:
+            if isinstance(since, (datetime, date)):
+                since = since.strftime('%Y-%m-%d')
+            sql += " AND post_date >= ?"
+            params.append(since)
+        sql += " ORDER BY drama_score DESC, date DESC, filename"
+
+        results = []
+        for row in self.conn.execute(sql, params):
+            if row['filename'] in posted:
+                continue
+            results.append(self.row_to_post(row))
+            if limit and len(results) >= limit:
+                break
+        return results
+
+    def tag_counts(self):
+        """Number of posts using each tag"""
+        return Counter({
+            row['tag']: row['uses']
+            for row in self.conn.execute(
+                "SELECT tag, COUNT(DISTINCT filename) AS uses FROM post_tags GROUP BY tag")
+        })
+
+    def tag_lists(self):
+        """(filename, tags) for every parsed post"""
+        return [(row['filename'], json.loads(row['tags'] or '[]'))
+                for row in self.conn.execute(
+                    "SELECT filename, tags FROM posts WHERE parse_error IS NULL ORDER BY filename")]
+
+def open_post_index(base_path=None):
+    """Open the shared post index and bring it up to date"""
+    index = PostIndex(base_path)
+    index.refresh()
+    return index
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Parallel Post Processing
+Runs a per-file repair function over many posts in a process pool, handing
+each worker a chunk of files at a time, and merges the result records it
+returns into one summary
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+# Chunks per worker: enough to even out slow files without paying task
+# overhead per post
+CHUNKS_PER_WORKER = 4
+
+def post_result(path, changed=False, fixes=None, error=None):
+    """Result record a per-file worker returns
+
+    Plain dicts so they pickle cheaply back from the pool.
+    """
+    return {
+        'file': os.path.basename(str(path)),
+        'changed': changed,
+        'fixes': fixes or [],
+        'error': error,
+    }
+
+def default_workers():
+    return os.cpu_count() or 1
+
+def process_posts(process_file, paths, workers=None, chunk_size=None):
+    """Yield process_file(path) for every path, in input order
+
+    `process_file` must be a module-level function returning a post_result
+    record. With one worker (or one file) everything runs in this process.
+    """
+    paths = list(paths)
+    workers = max(1, workers or default_workers())
+
+    if workers == 1 or len(paths) < 2:
+        for path in paths:
+            yield process_file(path)
+        return
+
+    workers = min(workers, len(paths))
+    chunk_size = chunk_size or max(1, len(paths) // (workers * CHUNKS_PER_WORKER))
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(process_file, paths, chunksize=chunk_size)
+
+def summarize(results):
+    """Totals over a list of result records"""
+    return {
+        'total': len(results),
+        'changed': sum(1 for r in results if r['changed']),
+        'fixes': sum(len(r['fixes']) for r in results),
+        'errors': sum(1 for r in results if r['error']),
+    }
+
+def write_summary(results, summary_file, title):
+    """Plain-text report: totals, then every changed or failed file with its fixes"""
+    totals = summarize(results)
+
+    with open(summary_file, 'w', encoding='utf-8') as f:
+        f.write(f"{title}\n")
+        f.write(f"Generated: {datetime.now().isoformat()}\n\n")
+        f.write(f"Files processed: {totals['total']}\n")
+        f.write(f"Files changed: {totals['changed']}\n")
+        f.write(f"Fixes applied: {totals['fixes']}\n")
+        f.write(f"Errors: {totals['errors']}\n")
+
+        for result in results:
+            if not result['changed'] and not result['error']:
+                continue
+            f.write(f"\n{result['file']}\n")
+            for fix in result['fixes']:
+                f.write(f"  - {fix}\n")
+            if result['error']:
+                f.write(f"  ! {result['error']}\n")
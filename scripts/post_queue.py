@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Bluesky Candidate Queue
+Persistent max-heap of posts waiting to be shared, keyed by (drama score,
+date). The scraper pushes each post it writes and the poster pops the best
+one, so choosing what to post never scans _posts. Entries can carry the
+post's ready-made Bluesky payload, which is committed along with the queue.
+"""
+
+import heapq
+import json
+import os
+import tempfile
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+QUEUE_FILENAME = 'bluesky_queue.json'
+WINDOW_HOURS = 72
+
+def post_timestamp(value, filename=''):
+    """Epoch seconds for a front matter date ('2025-08-02 11:14:59 +0000', a date or datetime)
+
+    Falls back to the YYYY-MM-DD prefix of the filename, then to now.
+    """
+    if isinstance(value, datetime):
+        return value.timestamp()
+    if isinstance(value, date):
+        return datetime(value.year, value.month, value.day).timestamp()
+
+    for text, length, fmt in [(value, 19, '%Y-%m-%d %H:%M:%S'), (value, 10, '%Y-%m-%d'),
+                              (filename, 10, '%Y-%m-%d')]:
+        try:
+            return datetime.strptime(str(text)[:length], fmt).timestamp()
+        except (TypeError, ValueError):
+            continue
+    return datetime.now().timestamp()
+
+class CandidateQueue:
+    """Unposted posts, hottest then newest first
+
+    Heap items are (-drama_score, -timestamp, filename). Entries older than
+    the window are dropped lazily as they reach the top, and all at once on
+    save, so the file only ever holds the window's posts.
+    """
+
+    def __init__(self, data_dir=None, window_hours=WINDOW_HOURS):
+        self.data_dir = Path(data_dir) if data_dir else Path('data')
+        self.path = self.data_dir / QUEUE_FILENAME
+        self.window_hours = window_hours
+        self.heap = []
+        self.payloads = {}  # filename -> payload pushed with it
+        self.load()
+
+    def __len__(self):
+        return len(self.heap)
+
+    def exists(self):
+        return self.path.exists()
+
+    def cutoff(self):
+        return (datetime.now() - timedelta(hours=self.window_hours)).timestamp()
+
+    def load(self):
+        self.heap = []
+        self.payloads = {}
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self.heap = [(score, stamp, filename) for score, stamp, filename in data.get('heap', [])]
+            self.payloads = dict(data.get('payloads') or {})
+        except (OSError, ValueError, TypeError) as e:
+            print(f"⚠️ Could not read {self.path.name}, starting empty: {e}")
+            self.heap = []
+            self.payloads = {}
+            return
+        # Cheap no-op when the file was written by save()
+        heapq.heapify(self.heap)
+
+    def save(self):
+        """Drop expired entries and atomically rewrite the queue file"""
+        cutoff = self.cutoff()
+        self.heap = [item for item in self.heap if -item[1] >= cutoff]
+        heapq.heapify(self.heap)
+        queued = {item[2] for item in self.heap}
+        self.payloads = {filename: payload for filename, payload in self.payloads.items()
+                         if filename in queued}
+
+        self.data_dir.mkdir(exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.data_dir, prefix=QUEUE_FILENAME, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump({'window_hours': self.window_hours, 'heap': self.heap,
+                       'payloads': self.payloads}, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+    def push(self, filename, drama_score, post_date=None, payload=None):
+        """Queue a post (ignored if it is already older than the window)"""
+        stamp = post_timestamp(post_date, filename)
+        if stamp < self.cutoff():
+            return False
+        heapq.heappush(self.heap, (-(drama_score or 0), -stamp, filename))
+        if payload:
+            self.payloads[filename] = payload
+        return True
+
+    def pop(self, min_score=0):
+        """Remove and return the best live entry, or None
+
+        Returns {'file', 'drama_score', 'post_date', 'payload'} (payload may
+        be None). Expired entries met on the way are discarded; an entry below
+        min_score is left in place.
+        """
+        cutoff = self.cutoff()
+        while self.heap:
+            neg_score, neg_stamp, filename = self.heap[0]
+            if -neg_stamp < cutoff:
+                heapq.heappop(self.heap)
+                continue
+            if -neg_score < min_score:
+                return None
+            heapq.heappop(self.heap)
+            return {
+                'file': filename,
+                'drama_score': -neg_score,
+                'post_date': datetime.fromtimestamp(-neg_stamp),
+                'payload': self.payloads.pop(filename, None),
+            }
+        return None
+
+    def seed(self, post_index, posted=(), min_score=0):
+        """Fill an empty queue from the post index (first run, or a lost queue file)"""
+        since = datetime.now() - timedelta(hours=self.window_hours)
+        added = 0
+        for post in post_index.top_unposted(posted, min_score=min_score, since=since):
+            front_matter = post['front_matter']
+            payload = post.get('bluesky_payload')
+            if payload:
+                payload = dict(payload, sha1=post['sha1'])
+            if self.push(post['filename'], front_matter.get('drama_score', 0), front_matter.get('date'),
+                         payload):
+                added += 1
+        return added
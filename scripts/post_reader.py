@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Streaming Post Reader
+Reads a post's front matter line by line, stopping at the closing `---`, and
+only loads the body when a caller asks for it
+"""
+
+import yaml_io
+
+DELIMITER = '---'
+
+class PostFile:
+    """One post's parsed front matter, with the body loaded on first access
+
+    Splits exactly like the scripts' `content.split('---', 2)`: the front
+    matter is everything between the opening `---` and the next `---`,
+    wherever it falls on its line.
+    """
+
+    def __init__(self, path, raw_front_matter, front_matter, body_head, body_position):
+        self.path = path
+        self.raw_front_matter = raw_front_matter
+        self.front_matter = front_matter
+        self.body_head = body_head
+        self.body_position = body_position
+        self.loaded_body = None
+
+    @property
+    def body(self):
+        """Everything after the closing delimiter (read from disk on first use)"""
+        if self.loaded_body is None:
+            if self.body_position is None:
+                self.loaded_body = self.body_head
+            else:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    f.seek(self.body_position)
+                    self.loaded_body = self.body_head + f.read()
+        return self.loaded_body
+
+    def release_body(self):
+        """Drop a loaded body; it is re-read if needed again"""
+        self.loaded_body = None
+
+    def render(self, front_matter=None):
+        """Full post text with re-dumped front matter, in the scraper's layout"""
+        front_matter = self.front_matter if front_matter is None else front_matter
+        # Keep the opening line's own newline and any blank line the scraper left after it
+        newlines = len(self.raw_front_matter) - len(self.raw_front_matter.lstrip('\n'))
+        opening = '\n' * max(newlines, 1)
+        return f"---{opening}{yaml_io.dump_front_matter(front_matter)}---{self.body}"
+
+    def write(self, front_matter=None):
+        """Rewrite the post with (possibly updated) front matter"""
+        content = self.render(front_matter)
+        with open(self.path, 'w', encoding='utf-8') as f:
+            f.write(content)
+
+def scan_front_matter(f):
+    """Consume an open post up to its closing delimiter
+
+    Returns (raw front matter, rest of the closing line). Raises ValueError
+    when the file has no complete front matter block.
+    """
+    line = f.readline()
+    if not line.startswith(DELIMITER):
+        raise ValueError("No front matter")
+
+    pending = line[len(DELIMITER):]
+    lines = []
+    while True:
+        end = pending.find(DELIMITER)
+        if end != -1:
+            lines.append(pending[:end])
+            return ''.join(lines), pending[end + len(DELIMITER):]
+        lines.append(pending)
+
+        pending = f.readline()
+        if not pending:
+            raise ValueError("Unterminated front matter")
+
+def read_post(path, with_body=False):
+    """Parse a post's front matter without reading past its closing delimiter
+
+    Raises ValueError when the file has no complete front matter block or the
+    block is not a YAML mapping; yaml.YAMLError propagates for broken YAML.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        raw_front_matter, body_head = scan_front_matter(f)
+
+        # tell() is only valid between readline() calls, which is exactly where we are
+        body_position = f.tell()
+        body = body_head + f.read() if with_body else None
+
+    front_matter = yaml_io.load(raw_front_matter)
+    if not isinstance(front_matter, dict):
+        raise ValueError("Front matter is not a mapping")
+
+    post = PostFile(path, raw_front_matter, front_matter, body_head, body_position)
+    post.loaded_body = body
+    return post
+
+def read_front_matter(path):
+    """Just the front matter mapping of a post"""
+    return read_post(path).front_matter
+
+def read_body(path):
+    """Just the body of a post, skipping its front matter without parsing it"""
+    with open(path, 'r', encoding='utf-8') as f:
+        _, body_head = scan_front_matter(f)
+        return body_head + f.read()
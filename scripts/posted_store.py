@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Bluesky Posted Store
+Append-only JSON-lines log of the posts already shared on Bluesky, loaded
+into a set-like view, replacing the _data/bluesky_posted.yml list that was
+re-dumped in full after every post
+"""
+
+import json
+import os
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import yaml_io
+
+STORE_FILENAME = 'bluesky_posted.jsonl'
+
+# Both spellings have existed under _data; the hyphenated one was never read
+LEGACY_FILENAMES = ('bluesky_posted.yml', 'bluesky-posted.yml')
+
+class PostedStore:
+    """Recently posted filenames, oldest first
+
+    Works as a ring buffer bounded two ways: records older than `ttl_days`
+    are dropped on load, and once there are more than `max_entries` the
+    oldest are evicted. add() appends a single line; the log is compacted
+    once dead lines (expired, evicted or re-posted) outnumber live ones.
+    """
+
+    def __init__(self, data_dir=None, legacy_dir=None, ttl_days=14, max_entries=1000,
+                 min_compact_lines=100):
+        self.data_dir = Path(data_dir) if data_dir else Path('data')
+        self.legacy_dir = Path(legacy_dir) if legacy_dir else Path('_data')
+        self.path = self.data_dir / STORE_FILENAME
+        self.ttl_days = ttl_days
+        self.max_entries = max_entries
+        self.min_compact_lines = min_compact_lines
+
+        # filename -> posted_date, in posting order
+        self.entries = {}
+        self.file_lines = 0
+
+        self.data_dir.mkdir(exist_ok=True)
+        self.load()
+
+    def __contains__(self, filename):
+        return filename in self.entries
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    # ----- Persistence -----
+
+    def cutoff(self):
+        return (datetime.now() - timedelta(days=self.ttl_days)).isoformat()
+
+    def evict(self):
+        """Drop expired entries and anything beyond max_entries, oldest first"""
+        cutoff = self.cutoff()
+        while self.entries:
+            oldest = next(iter(self.entries))
+            if len(self.entries) <= self.max_entries and self.entries[oldest] > cutoff:
+                break
+            del self.entries[oldest]
+
+    def load(self):
+        legacy_paths = [self.legacy_dir / name for name in LEGACY_FILENAMES]
+        if not self.path.exists() and any(p.exists() for p in legacy_paths):
+            self.migrate_legacy_files(legacy_paths)
+            return
+
+        self.entries = {}
+        self.file_lines = 0
+
+        if self.path.exists():
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    self.file_lines += 1
+                    try:
+                        record = json.loads(line)
+                        filename, posted_date = record['file'], record['posted_date']
+                    except (ValueError, KeyError, TypeError):
+                        continue  # A torn last line from an interrupted append
+                    # Re-posting moves a file to the newest position
+                    self.entries.pop(filename, None)
+                    self.entries[filename] = posted_date
+
+        self.evict()
+
+    def migrate_legacy_files(self, legacy_paths):
+        """One-time import of the old YAML lists into the log
+
+        The lists carry no dates, so every name counts as posted now and
+        ages out one TTL from the migration.
+        """
+        now = datetime.now().isoformat()
+        self.entries = {}
+
+        for legacy_path in legacy_paths:
+            if not legacy_path.exists():
+                continue
+            try:
+                with open(legacy_path, 'r', encoding='utf-8') as f:
+                    names = yaml_io.load(f) or []
+            except Exception as e:
+                print(f"⚠️ Could not migrate {legacy_path}: {e}")
+                continue
+
+            for name in names if isinstance(names, list) else []:
+                self.entries.pop(str(name), None)
+                self.entries[str(name)] = now
+
+        self.compact()
+
+        for legacy_path in legacy_paths:
+            try:
+                legacy_path.unlink()
+            except OSError:
+                pass
+        print(f"📦 Migrated {len(self.entries)} posted items to {self.path}")
+
+    def add(self, filename, posted_date=None):
+        """Record a post as shared (one appended line)"""
+        posted_date = (posted_date or datetime.now()).isoformat()
+        self.entries.pop(filename, None)
+        self.entries[filename] = posted_date
+        self.evict()
+
+        dead_lines = self.file_lines + 1 - len(self.entries)
+        if dead_lines > max(self.min_compact_lines, len(self.entries)):
+            self.compact()
+            return
+
+        # One write per record, synced, so a batch interrupted mid-run keeps every post it made
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps({'file': filename, 'posted_date': posted_date}, ensure_ascii=False) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+        self.file_lines += 1
+
+    def compact(self):
+        """Rewrite the log with only live entries (atomic replace)"""
+        self.evict()
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=self.path.name, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                for filename, posted_date in self.entries.items():
+                    f.write(json.dumps({'file': filename, 'posted_date': posted_date}, ensure_ascii=False) + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+        self.file_lines = len(self.entries)
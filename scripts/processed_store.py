@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Processed Article Store
+Append-only JSON-lines log of processed article IDs with a TTL, replacing the
+processed_articles.json file that was rewritten in full on every run
+"""
+
+import json
+import os
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+STORE_FILENAME = 'processed_articles.jsonl'
+LEGACY_FILENAME = 'processed_articles.json'
+
+class ProcessedArticleStore:
+    """Dict-like view of recently processed articles, keyed by article ID
+
+    Entries older than `ttl_days` (by processed_date) are dropped on load.
+    New entries are appended to the log on flush(); the log is compacted
+    once dead lines (expired or superseded) outnumber the live entries.
+    """
+
+    def __init__(self, data_dir=None, ttl_days=7, min_compact_lines=100):
+        self.data_dir = Path(data_dir) if data_dir else Path('data')
+        self.path = self.data_dir / STORE_FILENAME
+        self.legacy_path = self.data_dir / LEGACY_FILENAME
+        self.ttl_days = ttl_days
+        self.min_compact_lines = min_compact_lines
+
+        self.entries = {}
+        self.pending = {}
+        self.file_lines = 0
+
+        self.data_dir.mkdir(exist_ok=True)
+        self.load()
+
+    # ----- Mapping interface used by the scraper -----
+
+    def __contains__(self, article_id):
+        return article_id in self.entries
+
+    def __getitem__(self, article_id):
+        return self.entries[article_id]
+
+    def __setitem__(self, article_id, entry):
+        self.entries[article_id] = entry
+        self.pending[article_id] = entry
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    def get(self, article_id, default=None):
+        return self.entries.get(article_id, default)
+
+    def items(self):
+        return self.entries.items()
+
+    def values(self):
+        return self.entries.values()
+
+    # ----- Persistence -----
+
+    def cutoff(self):
+        return (datetime.now() - timedelta(days=self.ttl_days)).isoformat()
+
+    def is_live(self, entry, cutoff):
+        # Entries without a date never expire (same rule as the old JSON loader)
+        return entry.get('processed_date', '9999') > cutoff
+
+    def load(self):
+        if not self.path.exists() and self.legacy_path.exists():
+            self.migrate_legacy_file()
+            return
+
+        cutoff = self.cutoff()
+        entries = {}
+        self.file_lines = 0
+
+        if self.path.exists():
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    self.file_lines += 1
+                    try:
+                        record = json.loads(line)
+                        article_id = record.pop('id')
+                    except (ValueError, KeyError, AttributeError):
+                        continue  # A torn last line from an interrupted append
+                    entries[article_id] = record
+
+        self.entries = {k: v for k, v in entries.items() if self.is_live(v, cutoff)}
+
+    def migrate_legacy_file(self):
+        """One-time import of processed_articles.json into the log"""
+        try:
+            with open(self.legacy_path, 'r') as f:
+                legacy = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Could not migrate {self.legacy_path}: {e}")
+            legacy = {}
+
+        cutoff = self.cutoff()
+        self.entries = {k: v for k, v in legacy.items() if isinstance(v, dict) and self.is_live(v, cutoff)}
+        self.compact()
+
+        try:
+            self.legacy_path.unlink()
+        except OSError:
+            pass
+        print(f"📦 Migrated {len(self.entries)} processed articles to {self.path}")
+
+    def flush(self):
+        """Append new entries, compacting first if the log is mostly dead lines"""
+        dead_lines = self.file_lines - (len(self.entries) - len(self.pending))
+        if dead_lines > max(self.min_compact_lines, len(self.entries)):
+            self.compact()
+            return
+
+        if not self.pending:
+            return
+
+        with open(self.path, 'a', encoding='utf-8') as f:
+            for article_id, entry in self.pending.items():
+                f.write(json.dumps(dict(entry, id=article_id), ensure_ascii=False) + '\n')
+
+        self.file_lines += len(self.pending)
+        self.pending = {}
+
+    def compact(self):
+        """Rewrite the log with only live entries (atomic replace)"""
+        cutoff = self.cutoff()
+        self.entries = {k: v for k, v in self.entries.items() if self.is_live(v, cutoff)}
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=self.path.name, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                for article_id, entry in self.entries.items():
+                    f.write(json.dumps(dict(entry, id=article_id), ensure_ascii=False) + '\n')
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+        self.file_lines = len(self.entries)
+        self.pending = {}
@@ -55,16 +55,9 @@ class GossipBlogOrchestrator:
                 'frequency': 'daily'
             },
             {
-                'name': 'Drama Temperature Calculator',
-                'script': 'drama_temperature_calculator.py',
-                'description': 'Calculate celebrity drama temperatures (legacy)',
-                'required': False,
-                'frequency': 'daily'
-            },
-            {
-                'name': 'Temperature Calculator',
-                'script': 'temperature_calculator.py',
-                'description': 'Calculate celebrity drama temperatures (new)',
+                'name': 'Temperature Engine',
+                'script': 'temperature_engine.py',
+                'description': 'Calculate celebrity drama temperatures',
                 'required': False,
                 'frequency': 'daily'
             },
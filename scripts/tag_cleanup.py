@@ -4,19 +4,29 @@ Advanced Tag Cleanup System
 Automatically cleans, merges, and manages tags across all posts
 """
 
-import yaml
 import re
+import time
 from pathlib import Path
 from datetime import datetime, timedelta
 from collections import Counter
 import argparse
 
+from celebrity_index import load_celebrities
+from changed_posts import add_selection_arguments, select_posts
+from post_index import open_post_index
+from post_reader import read_post
+import yaml_io
+
 class TagCleanup:
-    def __init__(self):
+    def __init__(self, post_files=None):
         self.base_path = Path.cwd()
         self.posts_dir = self.base_path / '_posts'
         self.data_dir = self.base_path / '_data'
 
+        # Posts a scoped run may rewrite (None = all); tag counts still cover every post
+        self.post_files = post_files
+        self.selected = None if post_files is None else {Path(p).name for p in post_files}
+
         self.load_tag_management()
         self.load_celebrities()
 
@@ -25,31 +35,230 @@ class TagCleanup:
         tag_file = self.data_dir / 'tag_management.yml'
         if tag_file.exists():
             with open(tag_file, 'r') as f:
-                self.tag_config = yaml.safe_load(f) or {}
+                self.tag_config = yaml_io.load(f) or {}
         else:
             self.tag_config = {'whitelist': [], 'blacklist': [], 'replacements': {}}
 
     def load_celebrities(self):
         """Load celebrity data for validation"""
-        celebrities_file = self.data_dir / 'celebrities.yml'
-        if celebrities_file.exists():
-            with open(celebrities_file, 'r') as f:
-                self.celebrities = yaml.safe_load(f) or {}
-        else:
-            self.celebrities = {}
+        self.celebrities = load_celebrities(self.data_dir)
+
+    def indexed_front_matter(self):
+        """(path, front matter) for every post, from the post index"""
+        with open_post_index(self.base_path) as post_index:
+            return [(post['path'], post['front_matter']) for post in post_index.all_posts()]
+
+    def candidate_posts(self, needs_update):
+        """Posts whose indexed front matter says they may need rewriting
+
+        Posts the check can't handle are returned too, so the caller reports them.
+        """
+        candidates = []
+        for post_file, front_matter in self.indexed_front_matter():
+            if self.selected is not None and post_file.name not in self.selected:
+                continue
+            try:
+                if needs_update(front_matter):
+                    candidates.append(post_file)
+            except Exception:
+                candidates.append(post_file)
+        return candidates
 
-    def cleanup_tags(self):
+    def cleanup_tags(self, sequential=False):
         """Main tag cleanup function"""
         print("🧹 Starting comprehensive tag cleanup...")
 
-        self.remove_blacklisted_tags()
-        self.merge_similar_tags()
-        self.fix_tag_formatting()
-        self.remove_orphaned_tags()
-        self.validate_celebrity_tags()
+        if sequential:
+            self.remove_blacklisted_tags()
+            self.merge_similar_tags()
+            self.fix_tag_formatting()
+            self.remove_orphaned_tags()
+            self.validate_celebrity_tags()
+        else:
+            self.run_pipeline()
 
         print("✅ Tag cleanup completed!")
 
+    def run_pipeline(self):
+        """Apply every cleanup stage in one pass: each post is parsed once and written at most once"""
+        blacklist = self.tag_config.get('blacklist', [])
+        replacements = self.tag_config.get('replacements', {})
+        celebrity_names = set(self.celebrities.keys())
+
+        stage_times = Counter()
+        stage_counts = Counter()
+        files_read = 0
+        files_written = 0
+
+        stages = [
+            ('blacklist', blacklist, lambda fm: self.strip_tags(fm, blacklist)),
+            ('merge', replacements, lambda fm: self.replace_tags(fm, replacements)),
+            ('format', True, self.reformat_tags),
+        ]
+
+        # Pass 1: read and parse every post once, applying the per-post stages
+        posts = []
+        tag_counts = Counter()
+
+        if self.selected is None:
+            post_files = sorted(self.posts_dir.glob('*.md'))
+        else:
+            # Scoped run: orphans are still judged against every post's cleaned
+            # tags, so the other posts go through the stages in memory only
+            post_files = self.post_files
+            for post_file, front_matter in self.indexed_front_matter():
+                if post_file.name in self.selected:
+                    continue
+                try:
+                    for _, enabled, apply_stage in stages:
+                        if enabled:
+                            apply_stage(front_matter)
+                    for tag in front_matter.get('tags', []):
+                        tag_counts[tag] += 1
+                except Exception:
+                    continue
+
+        for post_file in post_files:
+            start = time.perf_counter()
+            try:
+                # Front matter only; the body is read back just for posts that get rewritten
+                parsed = read_post(post_file)
+                files_read += 1
+
+                front_matter = parsed.front_matter
+                post = {'file': post_file, 'post': parsed, 'front_matter': front_matter, 'changed': False}
+            except Exception as e:
+                print(f"❌ Error processing {post_file}: {e}")
+                continue
+            finally:
+                stage_times['read'] += time.perf_counter() - start
+
+            try:
+                for stage, enabled, apply_stage in stages:
+                    if not enabled:
+                        continue
+                    start = time.perf_counter()
+                    if apply_stage(front_matter):
+                        post['changed'] = True
+                        stage_counts[stage] += 1
+                    stage_times[stage] += time.perf_counter() - start
+
+                # Orphan counts are gathered from the already-cleaned tags
+                for tag in front_matter.get('tags', []):
+                    tag_counts[tag] += 1
+            except Exception as e:
+                print(f"❌ Error processing {post_file}: {e}")
+                continue
+
+            posts.append(post)
+
+        # Pass 2 (in memory): orphaned tags and celebrity validation, then write
+        start = time.perf_counter()
+        orphaned_tags = self.find_orphaned_tags(tag_counts)
+        stage_times['orphans'] += time.perf_counter() - start
+
+        for post in posts:
+            front_matter = post['front_matter']
+            try:
+                if orphaned_tags:
+                    start = time.perf_counter()
+                    if self.strip_tags(front_matter, orphaned_tags):
+                        post['changed'] = True
+                        stage_counts['orphans'] += 1
+                    stage_times['orphans'] += time.perf_counter() - start
+
+                start = time.perf_counter()
+                validated = self.validate_primary_celebrity(front_matter, celebrity_names)
+                if validated:
+                    post['changed'] = True
+                    stage_counts['validate'] += validated
+                stage_times['validate'] += time.perf_counter() - start
+            except Exception as e:
+                print(f"❌ Error processing {post['file']}: {e}")
+                continue
+
+            if not post['changed']:
+                continue
+
+            start = time.perf_counter()
+            try:
+                post['post'].write(front_matter)
+                post['post'].release_body()
+                files_written += 1
+            except Exception as e:
+                print(f"❌ Error writing {post['file']}: {e}")
+            stage_times['write'] += time.perf_counter() - start
+
+        if stage_counts['blacklist']:
+            print(f"🧹 Cleaned blacklisted tags from {stage_counts['blacklist']} posts")
+        if stage_counts['merge']:
+            print(f"🔄 Merged tags in {stage_counts['merge']} posts")
+        if stage_counts['format']:
+            print(f"🔧 Fixed formatting in {stage_counts['format']} posts")
+        if orphaned_tags:
+            print(f"🗑️ Removed {len(orphaned_tags)} orphaned tags from {stage_counts['orphans']} posts")
+        else:
+            print("📊 No orphaned tags found")
+        if stage_counts['validate']:
+            print(f"⭐ Validated {stage_counts['validate']} celebrity references")
+        else:
+            print("📊 All celebrity tags validated")
+
+        print(f"📁 Read {files_read} posts, wrote {files_written}")
+        for stage in ['read', 'blacklist', 'merge', 'format', 'orphans', 'validate', 'write']:
+            if stage in stage_times:
+                print(f"   ⏱️ {stage}: {stage_times[stage] * 1000:.1f} ms")
+
+        return {'read': files_read, 'written': files_written, 'stages': dict(stage_counts)}
+
+    # ----- Per-post stages (modify front matter in place, return whether it changed) -----
+
+    def strip_tags(self, front_matter, unwanted):
+        """Drop the unwanted tags"""
+        original_tags = front_matter.get('tags', [])
+        cleaned_tags = [tag for tag in original_tags if tag not in unwanted]
+
+        if len(cleaned_tags) != len(original_tags):
+            front_matter['tags'] = cleaned_tags
+            return True
+        return False
+
+    def replace_tags(self, front_matter, replacements):
+        """Apply replacement rules, removing duplicates while preserving order"""
+        tags = front_matter.get('tags', [])
+        final_tags = list(dict.fromkeys(replacements.get(tag, tag) for tag in tags))
+
+        if final_tags != tags:
+            front_matter['tags'] = final_tags
+            return True
+        return False
+
+    def reformat_tags(self, front_matter):
+        """Normalize tag formatting"""
+        tags = front_matter.get('tags', [])
+        final_tags = self.format_tags(tags)
+
+        if final_tags != tags:
+            front_matter['tags'] = final_tags
+            return True
+        return False
+
+    def validate_primary_celebrity(self, front_matter, celebrity_names):
+        """Point primary_celebrity at a known celebrity (or drop it); returns references fixed"""
+        primary_celebrity = front_matter.get('primary_celebrity')
+        if not primary_celebrity or primary_celebrity in celebrity_names:
+            return 0
+
+        # Try to find a match in tags
+        for tag in front_matter.get('tags', []):
+            if tag in celebrity_names:
+                front_matter['primary_celebrity'] = tag
+                return 1
+
+        # Remove invalid primary celebrity
+        del front_matter['primary_celebrity']
+        return 1
+
     def remove_blacklisted_tags(self):
         """Remove blacklisted tags from all posts"""
         blacklist = self.tag_config.get('blacklist', [])
@@ -59,29 +268,19 @@ class TagCleanup:
         print(f"🚫 Removing {len(blacklist)} blacklisted tags...")
 
         removed_count = 0
-        for post_file in self.posts_dir.glob('*.md'):
-            try:
-                with open(post_file, 'r') as f:
-                    content = f.read()
-
-                if content.startswith('---'):
-                    parts = content.split('---', 2)
-                    if len(parts) >= 3:
-                        front_matter = yaml.safe_load(parts[1])
-                        post_content = parts[2]
+        candidates = self.candidate_posts(
+            lambda fm: any(tag in blacklist for tag in fm.get('tags', [])))
 
-                        original_tags = front_matter.get('tags', [])
-                        cleaned_tags = [tag for tag in original_tags if tag not in blacklist]
-
-                        if len(cleaned_tags) != len(original_tags):
-                            front_matter['tags'] = cleaned_tags
+        for post_file in candidates:
+            try:
+                post = read_post(post_file)
+                front_matter = post.front_matter
 
-                            # Rebuild file
-                            new_content = f"---\n{yaml.dump(front_matter, default_flow_style=False)}---{post_content}"
-                            with open(post_file, 'w') as f:
-                                f.write(new_content)
+                if self.strip_tags(front_matter, blacklist):
+                    # Rebuild file
+                    post.write()
 
-                            removed_count += 1
+                    removed_count += 1
 
             except Exception as e:
                 print(f"❌ Error processing {post_file}: {e}")
@@ -98,42 +297,20 @@ class TagCleanup:
         print(f"🔄 Merging {len(replacements)} tag replacements...")
 
         merged_count = 0
-        for post_file in self.posts_dir.glob('*.md'):
-            try:
-                with open(post_file, 'r') as f:
-                    content = f.read()
-
-                if content.startswith('---'):
-                    parts = content.split('---', 2)
-                    if len(parts) >= 3:
-                        front_matter = yaml.safe_load(parts[1])
-                        post_content = parts[2]
-
-                        tags = front_matter.get('tags', [])
-                        updated_tags = []
-
-                        for tag in tags:
-                            # Check if tag should be replaced
-                            replacement = replacements.get(tag, tag)
-                            updated_tags.append(replacement)
+        candidates = self.candidate_posts(
+            lambda fm: any(tag in replacements for tag in fm.get('tags', []))
+            or len(set(fm.get('tags', []))) != len(fm.get('tags', [])))
 
-                        # Remove duplicates while preserving order
-                        final_tags = []
-                        seen = set()
-                        for tag in updated_tags:
-                            if tag not in seen:
-                                final_tags.append(tag)
-                                seen.add(tag)
-
-                        if final_tags != tags:
-                            front_matter['tags'] = final_tags
+        for post_file in candidates:
+            try:
+                post = read_post(post_file)
+                front_matter = post.front_matter
 
-                            # Rebuild file
-                            new_content = f"---\n{yaml.dump(front_matter, default_flow_style=False)}---{post_content}"
-                            with open(post_file, 'w') as f:
-                                f.write(new_content)
+                if self.replace_tags(front_matter, replacements):
+                    # Rebuild file
+                    post.write()
 
-                            merged_count += 1
+                    merged_count += 1
 
             except Exception as e:
                 print(f"❌ Error processing {post_file}: {e}")
@@ -146,38 +323,19 @@ class TagCleanup:
         print("🔧 Fixing tag formatting issues...")
 
         fixed_count = 0
-        for post_file in self.posts_dir.glob('*.md'):
-            try:
-                with open(post_file, 'r') as f:
-                    content = f.read()
+        candidates = self.candidate_posts(
+            lambda fm: self.format_tags(fm.get('tags', [])) != fm.get('tags', []))
 
-                if content.startswith('---'):
-                    parts = content.split('---', 2)
-                    if len(parts) >= 3:
-                        front_matter = yaml.safe_load(parts[1])
-                        post_content = parts[2]
-
-                        tags = front_matter.get('tags', [])
-                        cleaned_tags = []
-
-                        for tag in tags:
-                            # Clean tag formatting
-                            clean_tag = self.clean_tag_format(str(tag))
-                            if clean_tag and len(clean_tag) > 1:  # Skip empty or single char tags
-                                cleaned_tags.append(clean_tag)
-
-                        # Remove duplicates
-                        final_tags = list(dict.fromkeys(cleaned_tags))
-
-                        if final_tags != tags:
-                            front_matter['tags'] = final_tags
+        for post_file in candidates:
+            try:
+                post = read_post(post_file)
+                front_matter = post.front_matter
 
-                            # Rebuild file
-                            new_content = f"---\n{yaml.dump(front_matter, default_flow_style=False)}---{post_content}"
-                            with open(post_file, 'w') as f:
-                                f.write(new_content)
+                if self.reformat_tags(front_matter):
+                    # Rebuild file
+                    post.write()
 
-                            fixed_count += 1
+                    fixed_count += 1
 
             except Exception as e:
                 print(f"❌ Error processing {post_file}: {e}")
@@ -185,6 +343,19 @@ class TagCleanup:
         if fixed_count > 0:
             print(f"🔧 Fixed formatting in {fixed_count} posts")
 
+    def format_tags(self, tags):
+        """Cleaned, de-duplicated tag list"""
+        cleaned_tags = []
+
+        for tag in tags:
+            # Clean tag formatting
+            clean_tag = self.clean_tag_format(str(tag))
+            if clean_tag and len(clean_tag) > 1:  # Skip empty or single char tags
+                cleaned_tags.append(clean_tag)
+
+        # Remove duplicates
+        return list(dict.fromkeys(cleaned_tags))
+
     def clean_tag_format(self, tag):
         """Clean individual tag formatting"""
         # Convert to lowercase
@@ -210,36 +381,15 @@ class TagCleanup:
 
         # Count tag usage
         tag_counts = Counter()
-        all_posts = list(self.posts_dir.glob('*.md'))
 
-        for post_file in all_posts:
+        for post_file, front_matter in self.indexed_front_matter():
             try:
-                with open(post_file, 'r') as f:
-                    content = f.read()
-
-                if content.startswith('---'):
-                    parts = content.split('---', 2)
-                    if len(parts) >= 3:
-                        front_matter = yaml.safe_load(parts[1])
-                        tags = front_matter.get('tags', [])
-
-                        for tag in tags:
-                            tag_counts[tag] += 1
-
+                for tag in front_matter.get('tags', []):
+                    tag_counts[tag] += 1
             except Exception as e:
                 continue
 
-        # Find orphaned tags (used in only 1 post and not whitelisted)
-        whitelist = set(self.tag_config.get('whitelist', []))
-        celebrity_names = set(self.celebrities.keys())
-
-        orphaned_tags = set()
-        for tag, count in tag_counts.items():
-            if (count == 1 and 
-                tag not in whitelist and 
-                tag not in celebrity_names and
-                len(tag) < 15):  # Don't remove long descriptive tags
-                orphaned_tags.add(tag)
+        orphaned_tags = self.find_orphaned_tags(tag_counts)
 
         if not orphaned_tags:
             print("📊 No orphaned tags found")
@@ -249,29 +399,19 @@ class TagCleanup:
 
         # Remove orphaned tags
         cleaned_count = 0
-        for post_file in all_posts:
-            try:
-                with open(post_file, 'r') as f:
-                    content = f.read()
+        candidates = self.candidate_posts(
+            lambda fm: any(tag in orphaned_tags for tag in fm.get('tags', [])))
 
-                if content.startswith('---'):
-                    parts = content.split('---', 2)
-                    if len(parts) >= 3:
-                        front_matter = yaml.safe_load(parts[1])
-                        post_content = parts[2]
-
-                        original_tags = front_matter.get('tags', [])
-                        cleaned_tags = [tag for tag in original_tags if tag not in orphaned_tags]
-
-                        if len(cleaned_tags) != len(original_tags):
-                            front_matter['tags'] = cleaned_tags
+        for post_file in candidates:
+            try:
+                post = read_post(post_file)
+                front_matter = post.front_matter
 
-                            # Rebuild file
-                            new_content = f"---\n{yaml.dump(front_matter, default_flow_style=False)}---{post_content}"
-                            with open(post_file, 'w') as f:
-                                f.write(new_content)
+                if self.strip_tags(front_matter, orphaned_tags):
+                    # Rebuild file
+                    post.write()
 
-                            cleaned_count += 1
+                    cleaned_count += 1
 
             except Exception as e:
                 continue
@@ -279,46 +419,41 @@ class TagCleanup:
         if cleaned_count > 0:
             print(f"🗑️ Removed orphaned tags from {cleaned_count} posts")
 
+    def find_orphaned_tags(self, tag_counts):
+        """Tags used in only 1 post and not whitelisted"""
+        whitelist = set(self.tag_config.get('whitelist', []))
+        celebrity_names = set(self.celebrities.keys())
+
+        orphaned_tags = set()
+        for tag, count in tag_counts.items():
+            if (count == 1 and 
+                tag not in whitelist and 
+                tag not in celebrity_names and
+                len(tag) < 15):  # Don't remove long descriptive tags
+                orphaned_tags.add(tag)
+
+        return orphaned_tags
+
     def validate_celebrity_tags(self):
         """Ensure celebrity tags match known celebrities"""
         print("⭐ Validating celebrity tags...")
 
         celebrity_names = set(self.celebrities.keys())
         validated_count = 0
+        candidates = self.candidate_posts(
+            lambda fm: fm.get('primary_celebrity') and fm['primary_celebrity'] not in celebrity_names)
 
-        for post_file in self.posts_dir.glob('*.md'):
+        for post_file in candidates:
             try:
-                with open(post_file, 'r') as f:
-                    content = f.read()
-
-                if content.startswith('---'):
-                    parts = content.split('---', 2)
-                    if len(parts) >= 3:
-                        front_matter = yaml.safe_load(parts[1])
-                        post_content = parts[2]
-
-                        tags = front_matter.get('tags', [])
-                        primary_celebrity = front_matter.get('primary_celebrity')
-
-                        # Validate primary celebrity
-                        if primary_celebrity and primary_celebrity not in celebrity_names:
-                            # Try to find a match in tags
-                            for tag in tags:
-                                if tag in celebrity_names:
-                                    front_matter['primary_celebrity'] = tag
-                                    validated_count += 1
-                                    break
-                            else:
-                                # Remove invalid primary celebrity
-                                if 'primary_celebrity' in front_matter:
-                                    del front_matter['primary_celebrity']
-                                    validated_count += 1
-
-                        # Update file if changed
-                        if validated_count > 0:
-                            new_content = f"---\n{yaml.dump(front_matter, default_flow_style=False)}---{post_content}"
-                            with open(post_file, 'w') as f:
-                                f.write(new_content)
+                post = read_post(post_file)
+                front_matter = post.front_matter
+
+                validated = self.validate_primary_celebrity(front_matter, celebrity_names)
+                validated_count += validated
+
+                # Update file if changed
+                if validated:
+                    post.write()
 
             except Exception as e:
                 continue
@@ -328,11 +463,11 @@ class TagCleanup:
         else:
             print("📊 All celebrity tags validated")
 
-    def deep_clean(self):
+    def deep_clean(self, sequential=False):
         """Perform deep cleaning including advanced analysis"""
         print("🔍 Starting deep tag analysis and cleanup...")
 
-        self.cleanup_tags()
+        self.cleanup_tags(sequential)
         self.analyze_tag_relationships()
         self.suggest_tag_improvements()
 
@@ -346,22 +481,15 @@ class TagCleanup:
         # For now, just report on tag usage patterns
 
         tag_pairs = Counter()
-        for post_file in self.posts_dir.glob('*.md'):
+        for post_file, front_matter in self.indexed_front_matter():
             try:
-                with open(post_file, 'r') as f:
-                    content = f.read()
-
-                if content.startswith('---'):
-                    parts = content.split('---', 2)
-                    if len(parts) >= 3:
-                        front_matter = yaml.safe_load(parts[1])
-                        tags = front_matter.get('tags', [])
+                tags = front_matter.get('tags', [])
 
-                        # Count tag pairs
-                        for i, tag1 in enumerate(tags):
-                            for tag2 in tags[i+1:]:
-                                pair = tuple(sorted([tag1, tag2]))
-                                tag_pairs[pair] += 1
+                # Count tag pairs
+                for i, tag1 in enumerate(tags):
+                    for tag2 in tags[i+1:]:
+                        pair = tuple(sorted([tag1, tag2]))
+                        tag_pairs[pair] += 1
 
             except Exception as e:
                 continue
@@ -384,18 +512,9 @@ class TagCleanup:
 
         # Find tags that might be duplicates
         all_tags = set()
-        for post_file in self.posts_dir.glob('*.md'):
+        for post_file, front_matter in self.indexed_front_matter():
             try:
-                with open(post_file, 'r') as f:
-                    content = f.read()
-
-                if content.startswith('---'):
-                    parts = content.split('---', 2)
-                    if len(parts) >= 3:
-                        front_matter = yaml.safe_load(parts[1])
-                        tags = front_matter.get('tags', [])
-                        all_tags.update(tags)
-
+                all_tags.update(front_matter.get('tags', []))
             except Exception as e:
                 continue
 
@@ -438,12 +557,23 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description='Tag Cleanup System')
     parser.add_argument('action', choices=['cleanup', 'deep-clean'], 
                        help='Action to perform')
+    parser.add_argument('--sequential', action='store_true',
+                       help='Run each cleanup stage as its own pass over the posts')
+    add_selection_arguments(parser)
 
     args = parser.parse_args()
 
-    cleanup = TagCleanup()
+    post_files = None
+    if args.since or args.files is not None:
+        try:
+            post_files = select_posts(Path.cwd() / '_posts', args.since, args.files)
+        except ValueError as e:
+            parser.error(str(e))
+        print(f"🎯 Limiting cleanup to {len(post_files)} changed posts")
+
+    cleanup = TagCleanup(post_files)
 
     if args.action == 'cleanup':
-        cleanup.cleanup_tags()
+        cleanup.cleanup_tags(args.sequential)
     elif args.action == 'deep-clean':
-        cleanup.deep_clean()
+        cleanup.deep_clean(args.sequential)
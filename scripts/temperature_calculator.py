@@ -4,17 +4,23 @@ Celebrity Drama Temperature Calculator
 Calculates relative drama scores based on mention frequency, sentiment, and engagement
 """
 
-import yaml
 import json
-import re
 from pathlib import Path
-from datetime import datetime, timedelta
+from datetime import datetime
 from collections import defaultdict, Counter
 import statistics
 import math
 
+from celebrity_matcher import build_id_matcher, resolve_celebrity_id
+from celebrity_store import CelebrityStore
+from post_corpus import PostCorpus
+from temperature_history import TemperatureHistory, record_run
+from temperature_ranking import percentile_status, rank_statuses
+from temperature_vectorized import HAS_NUMPY, percentile_statuses, score_temperatures
+import yaml_io
+
 class TemperatureCalculator:
-    def __init__(self):
+    def __init__(self, use_numpy=None):
         self.base_path = Path.cwd()
         self.posts_dir = self.base_path / '_posts'
         self.data_dir = self.base_path / '_data'
@@ -44,101 +50,46 @@ class TemperatureCalculator:
         # Lookback period for calculations
         self.lookback_days = 30
 
+        # Score with the NumPy backend whenever it is installed
+        self.use_numpy = HAS_NUMPY if use_numpy is None else use_numpy and HAS_NUMPY
+
+        # Previous runs, for temperature changes and weekly trends
+        self.history = TemperatureHistory(self.base_path / 'data')
+        self.previous_temperatures = self.history.latest_temperatures()
+        self.mention_counts = {}
+
     def load_celebrities(self):
         """Load celebrity database"""
-        celebrities_file = self.data_dir / 'celebrities.yml'
-        if celebrities_file.exists():
-            with open(celebrities_file, 'r') as f:
-                self.celebrities = yaml.safe_load(f) or {}
-        else:
-            self.celebrities = {}
+        self.store = CelebrityStore(self.data_dir)
+        self.celebrity_index = self.store.index
+        self.celebrities = self.store.celebrities
 
     def load_tag_management(self):
         """Load tag management for celebrity detection"""
         tag_file = self.data_dir / 'tag_management.yml'
         if tag_file.exists():
             with open(tag_file, 'r') as f:
-                self.tag_config = yaml.safe_load(f) or {}
+                self.tag_config = yaml_io.load(f) or {}
         else:
             self.tag_config = {'add_to_whitelist': []}
 
-    def get_recent_posts(self, days=None):
-        """Get posts from the last N days"""
-        if days is None:
-            days = self.lookback_days
-
-        cutoff_date = datetime.now() - timedelta(days=days)
-        recent_posts = []
-
-        for post_file in self.posts_dir.glob('*.md'):
-            try:
-                # Extract date from filename (YYYY-MM-DD format)
-                date_str = post_file.stem[:10]
-                post_date = datetime.strptime(date_str, '%Y-%m-%d')
-
-                if post_date >= cutoff_date:
-                    with open(post_file, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                        recent_posts.append({
-                            'file': post_file,
-                            'date': post_date,
-                            'content': content
-                        })
-            except (ValueError, IndexError):
-                continue
-
-        return recent_posts
-
-    def extract_celebrity_mentions(self, posts):
-        """Extract celebrity mentions from posts"""
-        celebrity_mentions = defaultdict(list)
-
-        # Get all celebrity names and aliases
-        celebrity_names = set()
-        for celebrity_id, data in self.celebrities.items():
-            # Add the ID as a searchable name
-            celebrity_names.add(celebrity_id.replace('_', ' '))
-            celebrity_names.add(celebrity_id)
-
-        # Add whitelist names
-        if 'add_to_whitelist' in self.tag_config:
-            celebrity_names.update(self.tag_config['add_to_whitelist'])
-
-        for post in posts:
-            content_lower = post['content'].lower()
-
-            for name in celebrity_names:
-                name_lower = name.lower()
-                # Count mentions (case-insensitive)
-                mention_count = len(re.findall(r'\b' + re.escape(name_lower) + r'\b', content_lower))
-
-                if mention_count > 0:
-                    # Find corresponding celebrity ID
-                    celebrity_id = self.find_celebrity_id(name)
-                    if celebrity_id:
-                        celebrity_mentions[celebrity_id].append({
-                            'post': post,
-                            'mentions': mention_count,
-                            'date': post['date']
-                        })
-
-        return celebrity_mentions
+    def build_mention_matcher(self):
+        """Get a single-pass matcher over every celebrity name and alias"""
+        whitelist_names = self.tag_config.get('add_to_whitelist') or []
 
-    def find_celebrity_id(self, name):
-        """Find celebrity ID from name"""
-        name_lower = name.lower()
+        # The index prebuilds the matcher for the plain celebrity IDs
+        if not whitelist_names:
+            return self.celebrity_index.id_matcher
 
-        # Direct ID match
-        if name_lower.replace(' ', '_') in self.celebrities:
-            return name_lower.replace(' ', '_')
+        return build_id_matcher(self.celebrities, whitelist_names)
 
-        # Search through existing celebrities
-        for celebrity_id in self.celebrities:
-            if celebrity_id.replace('_', ' ').lower() == name_lower:
-                return celebrity_id
+    def get_celebrity_mentions(self, corpus):
+        """Get each celebrity's daily mention buckets from the shared corpus"""
+        return corpus.celebrity_mentions(self.build_mention_matcher())
 
-        # Create new ID from name
-        return name_lower.replace(' ', '_')
+    def find_celebrity_id(self, name):
+        """Find celebrity ID from name"""
+        return resolve_celebrity_id(name, self.celebrities)
 
     def calculate_mention_frequency(self, mentions):
         """Calculate mention frequency score"""
@@ -146,7 +97,7 @@ class TemperatureCalculator:
             return 0
 
         total_mentions = sum(m['mentions'] for m in mentions)
-        unique_posts = len(mentions)
+        unique_posts = sum(m['hits'] for m in mentions)
 
         # Frequency score based on total mentions and post spread
         frequency_score = (total_mentions * 10) + (unique_posts * 5)
@@ -174,7 +125,7 @@ class TemperatureCalculator:
             return 0
 
         # Simple heuristic: more posts mentioning = higher engagement
-        unique_posts = len(mentions)
+        unique_posts = sum(m['hits'] for m in mentions)
         avg_mentions_per_post = sum(m['mentions'] for m in mentions) / unique_posts
 
         engagement_score = (unique_posts * 8) + (avg_mentions_per_post * 3)
@@ -218,53 +169,62 @@ class TemperatureCalculator:
             return 'mild'
 
         percentile = (sum(1 for t in all_temperatures if t < temperature) / len(all_temperatures)) * 100
+        return percentile_status(percentile, self.temperature_thresholds)
 
-        if percentile >= self.temperature_thresholds['explosive']:
-            return 'explosive'
-        elif percentile >= self.temperature_thresholds['hot']:
-            return 'hot'
-        elif percentile >= self.temperature_thresholds['rising']:
-            return 'rising'
-        elif percentile >= self.temperature_thresholds['mild']:
-            return 'mild'
-        elif percentile >= self.temperature_thresholds['cooling']:
-            return 'cooling'
-        else:
-            return 'freezing'
+    def calculate_all_temperatures(self, celebrity_mentions):
+        """Calculate temperatures for every celebrity with mentions"""
+        if self.use_numpy:
+            return score_temperatures(celebrity_mentions, self.weights)
+
+        return {
+            celebrity_id: self.calculate_temperature(celebrity_id, mentions)
+            for celebrity_id, mentions in celebrity_mentions.items()
+        }
+
+    def get_temperature_statuses(self, temperatures):
+        """Get the percentile status of each temperature in the list (one sort, not one scan each)"""
+        if self.use_numpy:
+            return percentile_statuses(temperatures, self.temperature_thresholds)
+
+        return rank_statuses(temperatures, self.temperature_thresholds)
 
     def calculate_temperature_change(self, celebrity_id, current_temp):
         """Calculate temperature change from previous calculation"""
-        if celebrity_id not in self.celebrities:
+        if celebrity_id in self.previous_temperatures:
+            previous_temp = self.previous_temperatures[celebrity_id]
+        elif celebrity_id not in self.celebrities:
             return current_temp  # New celebrity
+        else:
+            previous_temp = self.celebrities[celebrity_id].get('drama_score', 0)
 
-        previous_temp = self.celebrities[celebrity_id].get('drama_score', 0)
         return round(current_temp - previous_temp, 1)
 
-    def update_celebrity_temperatures(self):
-        """Main function to update all celebrity temperatures"""
-        print("🌡️  Calculating celebrity drama temperatures...")
-
-        # Get recent posts
-        recent_posts = self.get_recent_posts()
-        print(f"📊 Analyzing {len(recent_posts)} recent posts...")
-
-        # Extract mentions
-        celebrity_mentions = self.extract_celebrity_mentions(recent_posts)
+    def score(self, corpus):
+        """Score every celebrity from the shared post corpus"""
+        # Daily mention buckets for the lookback window
+        celebrity_mentions = self.get_celebrity_mentions(corpus)
         print(f"🎭 Found mentions for {len(celebrity_mentions)} celebrities")
 
+        self.mention_counts = {
+            celebrity_id: sum(bucket['mentions'] for bucket in buckets)
+            for celebrity_id, buckets in celebrity_mentions.items()
+        }
+
         # Calculate temperatures
-        new_temperatures = {}
-        for celebrity_id, mentions in celebrity_mentions.items():
-            temperature = self.calculate_temperature(celebrity_id, mentions)
-            new_temperatures[celebrity_id] = temperature
+        new_temperatures = self.calculate_all_temperatures(celebrity_mentions)
 
         # Add existing celebrities with 0 mentions
         for celebrity_id in self.celebrities:
             if celebrity_id not in new_temperatures:
                 new_temperatures[celebrity_id] = 0
 
+        return new_temperatures
+
+    def apply_temperatures(self, new_temperatures):
+        """Write temperatures, statuses and metadata into the celebrity database"""
         # Get all temperature values for percentile calculation
         all_temps = list(new_temperatures.values())
+        statuses = dict(zip(new_temperatures, self.get_temperature_statuses(all_temps)))
 
         # Update celebrity database
         now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -274,7 +234,7 @@ class TemperatureCalculator:
             temp_change = self.calculate_temperature_change(celebrity_id, temperature)
 
             # Get temperature status
-            status = self.get_temperature_status(temperature, all_temps)
+            status = statuses[celebrity_id]
 
             # Initialize celebrity if new
             if celebrity_id not in self.celebrities:
@@ -309,8 +269,18 @@ class TemperatureCalculator:
             'biggest_temperature_changes': self.get_biggest_changes(new_temperatures)
         }
 
-        # Save updated database
+    def update_celebrity_temperatures(self):
+        """Main function to update all celebrity temperatures"""
+        print("🌡️  Calculating celebrity drama temperatures...")
+
+        with PostCorpus(self.base_path, self.lookback_days) as corpus:
+            new_temperatures = self.score(corpus)
+
+        self.apply_temperatures(new_temperatures)
+
+        # Save updated database and history
         self.save_celebrities()
+        self.record_history(new_temperatures)
 
         print(f"✅ Updated temperatures for {len(new_temperatures)} celebrities")
         print(f"🔥 Average temperature: {self.celebrities['_temperature_metadata']['average_temperature']}")
@@ -321,8 +291,7 @@ class TemperatureCalculator:
         """Get distribution of temperature statuses"""
         distribution = defaultdict(int)
 
-        for temp in temperatures:
-            status = self.get_temperature_status(temp, temperatures)
+        for status in self.get_temperature_statuses(temperatures):
             distribution[status] += 1
 
         return dict(distribution)
@@ -351,11 +320,13 @@ class TemperatureCalculator:
             'falling': [[name, change] for name, change in falling]
         }
 
+    def record_history(self, temperatures):
+        """Append this run to the temperature history"""
+        record_run(self.data_dir, temperatures, self.mention_counts, self.history)
+
     def save_celebrities(self):
         """Save updated celebrity database"""
-        celebrities_file = self.data_dir / 'celebrities.yml'
-        with open(celebrities_file, 'w') as f:
-            yaml.dump(self.celebrities, f, default_flow_style=False, sort_keys=True)
+        self.store.save(self.celebrities)
 
 def main():
     """Main execution function"""
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Celebrity Temperature Engine
+Loads the post corpus once, runs the temperature models over it as pluggable
+scorers and writes only the selected model's result to celebrities.yml
+"""
+
+import argparse
+import statistics
+from pathlib import Path
+
+from drama_temperature_calculator import DramaTemperatureCalculator
+from post_corpus import PostCorpus
+from temperature_calculator import TemperatureCalculator
+
+# Every scorer provides score(corpus), apply_temperatures(scores), save_celebrities()
+# and record_history(scores)
+SCORERS = {
+    'weighted': TemperatureCalculator,       # Mention frequency, decay, engagement, volatility
+    'legacy': DramaTemperatureCalculator,    # Drama velocity, consistency and percentile scale
+}
+
+DEFAULT_MODEL = 'weighted'
+
+class TemperatureEngine:
+    def __init__(self, model=DEFAULT_MODEL, base_path=None, lookback_days=30):
+        if model not in SCORERS:
+            raise ValueError(f"Unknown temperature model: {model}")
+
+        self.model = model
+        self.base_path = Path(base_path) if base_path else Path.cwd()
+        self.lookback_days = lookback_days
+
+    def run(self, compare=False):
+        """Score with the selected model (and every other one if comparing), then save"""
+        models = list(SCORERS) if compare else [self.model]
+        results = {}
+
+        with PostCorpus(self.base_path, self.lookback_days) as corpus:
+            for model in models:
+                print(f"🌡️ Scoring with the {model} model...")
+                scorer = SCORERS[model]()
+                scorer.lookback_days = self.lookback_days
+                results[model] = (scorer, scorer.score(corpus))
+
+        scorer, temperatures = results[self.model]
+        scorer.apply_temperatures(temperatures)
+        scorer.save_celebrities()
+        scorer.record_history(temperatures)
+        print(f"✅ Saved {self.model} temperatures for {len(temperatures)} celebrities")
+
+        if compare:
+            self.print_comparison({model: scores for model, (_, scores) in results.items()})
+
+        return temperatures
+
+    def print_comparison(self, results):
+        """Side-by-side summary of every model's scores"""
+        print("\n🌡️ MODEL COMPARISON")
+        print("=" * 40)
+
+        for model, scores in results.items():
+            values = [t for c, t in scores.items() if not c.startswith('_')]
+            hottest = sorted(scores.items(), key=lambda x: x[1], reverse=True)[:5]
+            print(f"{model}: {len(values)} celebrities, "
+                  f"mean {statistics.mean(values) if values else 0:.1f}°")
+            for celebrity, temp in hottest:
+                print(f"   {celebrity}: {temp}°")
+
+        models = list(results)
+        for i, first in enumerate(models):
+            for second in models[i + 1:]:
+                shared = set(results[first]) & set(results[second])
+                if not shared:
+                    continue
+                gap = statistics.mean(abs(results[first][c] - results[second][c]) for c in shared)
+                print(f"📏 {first} vs {second}: mean difference {gap:.1f}° over {len(shared)} celebrities")
+        print("=" * 40)
+
+def main():
+    parser = argparse.ArgumentParser(description='Celebrity Temperature Engine')
+    parser.add_argument('--model', choices=sorted(SCORERS), default=DEFAULT_MODEL,
+                        help='Temperature model whose result is saved')
+    parser.add_argument('--compare', action='store_true',
+                        help='Also score with every other model and print a comparison')
+    parser.add_argument('--lookback-days', type=int, default=30, help='Days of posts to analyze')
+    args = parser.parse_args()
+
+    engine = TemperatureEngine(args.model, lookback_days=args.lookback_days)
+    engine.run(compare=args.compare)
+
+if __name__ == '__main__':
+    main()
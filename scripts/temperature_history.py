@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Temperature History
+Append-only columnar store of every temperature run: one typed-array file per
+column under data/temperature_history/, so range queries read only the rows
+they need
+"""
+
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import yaml_io
+
+# Column name -> array typecode. Row columns hold one entry per celebrity per
+# run; run columns hold one entry per run, and a run only counts once its
+# row_end has been appended, so a torn write is trimmed on the next open.
+ROW_COLUMNS = {'celebrity': 'i', 'temperature': 'f', 'mentions': 'f'}
+RUN_COLUMNS = {'run_time': 'q', 'row_end': 'q'}
+
+def read_column(path, typecode, start=0, stop=None):
+    """Items [start:stop) of a little-endian column file"""
+    values = array(typecode)
+    if not path.exists():
+        return values
+
+    with open(path, 'rb') as f:
+        f.seek(start * values.itemsize)
+        data = f.read() if stop is None else f.read((stop - start) * values.itemsize)
+
+    # Drop a trailing partial item from an interrupted append
+    values.frombytes(data[:len(data) - len(data) % values.itemsize])
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values
+
+def append_column(path, values):
+    if sys.byteorder == 'big':
+        values = array(values.typecode, values)
+        values.byteswap()
+    with open(path, 'ab') as f:
+        values.tofile(f)
+
+class TemperatureHistory:
+    """Per-celebrity temperature and mention counts for every run
+
+    Run times and row offsets are kept in memory (one pair per run); row
+    columns are read from disk only for the runs a query asks for.
+    """
+
+    def __init__(self, data_dir=None):
+        data_dir = Path(data_dir) if data_dir else Path('data')
+        self.history_dir = data_dir / 'temperature_history'
+        self.history_dir.mkdir(parents=True, exist_ok=True)
+        self.names_file = self.history_dir / 'celebrities.txt'
+        self.load()
+
+    def column_path(self, name):
+        return self.history_dir / f'{name}.bin'
+
+    def load(self):
+        self.run_times = read_column(self.column_path('run_time'), RUN_COLUMNS['run_time'])
+        self.row_ends = read_column(self.column_path('row_end'), RUN_COLUMNS['row_end'])
+
+        runs = min(len(self.run_times), len(self.row_ends))
+        self.run_times = self.run_times[:runs]
+        self.row_ends = self.row_ends[:runs]
+
+        self.names = []
+        if self.names_file.exists():
+            with open(self.names_file, 'r', encoding='utf-8') as f:
+                self.names = [line.rstrip('\n') for line in f if line.strip()]
+        self.name_ids = {name: i for i, name in enumerate(self.names)}
+
+        self.trim()
+
+    def trim(self):
+        """Cut every column back to the last complete run"""
+        rows = self.row_ends[-1] if self.row_ends else 0
+        for name, typecode in ROW_COLUMNS.items():
+            self.truncate(self.column_path(name), rows * array(typecode).itemsize)
+        for name, typecode in RUN_COLUMNS.items():
+            self.truncate(self.column_path(name), len(self.run_times) * array(typecode).itemsize)
+
+    def truncate(self, path, size):
+        if path.exists() and path.stat().st_size != size:
+            with open(path, 'r+b') as f:
+                f.truncate(size)
+
+    def __len__(self):
+        return len(self.run_times)
+
+    # ----- Writing -----
+
+    def append_run(self, temperatures, mentions=None, run_time=None):
+        """Record one run of {celebrity_id: temperature} (and optional mention counts)"""
+        run_time = run_time or datetime.now()
+        mentions = mentions or {}
+
+        new_names = [c for c in temperatures if c not in self.name_ids]
+        if new_names:
+            with open(self.names_file, 'a', encoding='utf-8') as f:
+                for name in new_names:
+                    self.name_ids[name] = len(self.names)
+                    self.names.append(name)
+                    f.write(name + '\n')
+
+        columns = {name: array(typecode) for name, typecode in ROW_COLUMNS.items()}
+        for celebrity_id, temperature in temperatures.items():
+            columns['celebrity'].append(self.name_ids[celebrity_id])
+            columns['temperature'].append(float(temperature))
+            columns['mentions'].append(float(mentions.get(celebrity_id, 0)))
+
+        for name, values in columns.items():
+            append_column(self.column_path(name), values)
+
+        row_end = (self.row_ends[-1] if self.row_ends else 0) + len(temperatures)
+        epoch = int(run_time.timestamp())
+
+        # The run only becomes visible once row_end lands
+        append_column(self.column_path('run_time'), array('q', [epoch]))
+        append_column(self.column_path('row_end'), array('q', [row_end]))
+        self.run_times.append(epoch)
+        self.row_ends.append(row_end)
+
+    # ----- Queries -----
+
+    def run_range(self, start=None, end=None):
+        """(first, stop) run numbers with start <= run time <= end"""
+        first = bisect_left(self.run_times, int(start.timestamp())) if start else 0
+        stop = bisect_right(self.run_times, int(end.timestamp())) if end else len(self.run_times)
+        return first, max(first, stop)
+
+    def rows(self, first, stop):
+        """Columns for runs [first, stop), plus each row's run number"""
+        if first >= stop:
+            return [], {name: array(typecode) for name, typecode in ROW_COLUMNS.items()}
+
+        row_start = self.row_ends[first - 1] if first else 0
+        row_stop = self.row_ends[stop - 1]
+        columns = {
+            name: read_column(self.column_path(name), typecode, row_start, row_stop)
+            for name, typecode in ROW_COLUMNS.items()
+        }
+
+        run_of_row = []
+        previous_end = row_start
+        for run in range(first, stop):
+            run_of_row.extend([run] * (self.row_ends[run] - previous_end))
+            previous_end = self.row_ends[run]
+        return run_of_row, columns
+
+    def iter_rows(self, start=None, end=None):
+        """(run time, celebrity_id, temperature, mentions) for every row in the range"""
+        run_of_row, columns = self.rows(*self.run_range(start, end))
+        for i, run in enumerate(run_of_row):
+            yield (datetime.fromtimestamp(self.run_times[run]), self.names[columns['celebrity'][i]],
+                   round(columns['temperature'][i], 1), columns['mentions'][i])
+
+    def snapshot(self, at=None):
+        """{celebrity_id: (temperature, mentions)} from the last run at or before `at`"""
+        _, stop = self.run_range(end=at)
+        if not stop:
+            return {}
+        run_of_row, columns = self.rows(stop - 1, stop)
+        return {
+            self.names[columns['celebrity'][i]]: (round(columns['temperature'][i], 1), columns['mentions'][i])
+            for i in range(len(run_of_row))
+        }
+
+    def latest_temperatures(self):
+        return {celebrity_id: temperature for celebrity_id, (temperature, _) in self.snapshot().items()}
+
+    def weekly_trends(self, weeks=4, end=None):
+        """{celebrity_id: {'YYYY-Www': average temperature}} over the last N weeks"""
+        end = end or datetime.now()
+        totals = defaultdict(lambda: defaultdict(lambda: [0.0, 0]))
+
+        for when, celebrity_id, temperature, _ in self.iter_rows(end - timedelta(weeks=weeks), end):
+            year, week, _ = when.isocalendar()
+            bucket = totals[celebrity_id][f'{year}-W{week:02d}']
+            bucket[0] += temperature
+            bucket[1] += 1
+
+        return {
+            celebrity_id: {week: round(total / count, 1) for week, (total, count) in sorted(by_week.items())}
+            for celebrity_id, by_week in totals.items()
+        }
+
+def update_drama_tracking(history, data_dir, weeks=4):
+    """Refresh weekly_trends in _data/drama_tracking.yml from the history"""
+    tracking_file = Path(data_dir) / 'drama_tracking.yml'
+
+    tracking = {}
+    if tracking_file.exists():
+        with open(tracking_file, 'r') as f:
+            tracking = yaml_io.load(f) or {}
+
+    tracking['weekly_trends'] = {
+        celebrity_id: by_week
+        for celebrity_id, by_week in history.weekly_trends(weeks).items()
+        if any(by_week.values())
+    }
+    tracking['last_update'] = datetime.now().isoformat()
+
+    with open(tracking_file, 'w') as f:
+        yaml_io.dump(tracking, f)
+
+def record_run(data_dir, temperatures, mentions=None, history=None):
+    """Append a scorer's published temperatures to the history and refresh the trends"""
+    history = history or TemperatureHistory(Path(data_dir).parent / 'data')
+    history.append_run(
+        {c: t for c, t in temperatures.items() if not c.startswith('_')},
+        mentions
+    )
+    update_drama_tracking(history, data_dir)
+    return history
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Temperature Ranking
+Percentile ranks and statuses for a whole roster from one sort, shared by
+both temperature models
+"""
+
+from bisect import bisect_left
+
+# Checked from hottest to coldest; anything below 'cooling' is freezing
+STATUS_ORDER = ['explosive', 'hot', 'rising', 'mild', 'cooling']
+
+def percentile_ranks(values):
+    """Percentage of values strictly below each value, in input order
+
+    Ties share the rank of their lowest position, exactly like
+    sum(1 for v in values if v < value) / len(values) * 100.
+    """
+    if not values:
+        return []
+
+    ordered = sorted(values)
+    count = len(ordered)
+    return [(bisect_left(ordered, value) / count) * 100 for value in values]
+
+def percentile_status(percentile, thresholds):
+    """Status for a percentile given {status: minimum percentile} thresholds"""
+    for status in STATUS_ORDER:
+        if percentile >= thresholds[status]:
+            return status
+    return 'freezing'
+
+def rank_statuses(values, thresholds):
+    """Percentile status of every value, ranked against the whole list"""
+    return [percentile_status(percentile, thresholds) for percentile in percentile_ranks(values)]
+
+def interpolated_percentile(ordered, percentile):
+    """Value at `percentile` of an already sorted list, interpolating between closest ranks"""
+    if len(ordered) == 1:
+        return ordered[0]
+    index = (percentile / 100) * (len(ordered) - 1)
+    lower_index = int(index)
+    upper_index = min(lower_index + 1, len(ordered) - 1)
+    weight = index - lower_index
+    return ordered[lower_index] * (1 - weight) + ordered[upper_index] * weight
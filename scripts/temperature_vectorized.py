@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Vectorized Temperature Scoring
+Optional NumPy backend that scores every celebrity in a handful of array
+operations instead of one Python loop per celebrity and mention
+"""
+
+from datetime import datetime
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the calculators fall back to pure Python
+    np = None
+
+from temperature_ranking import STATUS_ORDER
+
+HAS_NUMPY = np is not None
+
+class MentionArrays:
+    """Daily mention buckets flattened into parallel arrays
+
+    Row i says celebrity `celebrity_ids[index[i]]` had `mentions[i]` mentions
+    across `hits[i]` name hits on the day `days_ago[i]` days before `now`.
+    """
+
+    def __init__(self, celebrity_mentions, now=None):
+        now = now or datetime.now()
+        self.celebrity_ids = list(celebrity_mentions)
+
+        index, days_ago, mentions, hits = [], [], [], []
+        for i, buckets in enumerate(celebrity_mentions.values()):
+            for bucket in buckets:
+                index.append(i)
+                days_ago.append((now - bucket['date']).days)
+                mentions.append(bucket['mentions'])
+                hits.append(bucket.get('hits', 1))
+
+        self.index = np.array(index, dtype=np.int64)
+        self.days_ago = np.array(days_ago, dtype=np.float64)
+        self.mentions = np.array(mentions, dtype=np.float64)
+        self.hits = np.array(hits, dtype=np.float64)
+
+    def totals(self, values):
+        """Per-celebrity sum of a row array"""
+        return np.bincount(self.index, weights=values, minlength=len(self.celebrity_ids))
+
+def score_temperatures(celebrity_mentions, weights, now=None):
+    """Vectorized TemperatureCalculator.calculate_temperature for every celebrity at once
+
+    Returns {celebrity_id: temperature}; matches the Python scorers up to
+    floating point summation order.
+    """
+    arrays = MentionArrays(celebrity_mentions, now)
+    if not arrays.celebrity_ids:
+        return {}
+
+    total_mentions = arrays.totals(arrays.mentions)
+    unique_posts = arrays.totals(arrays.hits)
+    decayed = arrays.totals(arrays.mentions * np.exp(-arrays.days_ago / 7) * 10)
+
+    mention_freq = np.minimum(total_mentions * 10 + unique_posts * 5, 100)
+    recent_activity = np.minimum(decayed, 100)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        avg_mentions = np.where(unique_posts > 0, total_mentions / unique_posts, 0)
+    engagement = np.minimum(unique_posts * 8 + avg_mentions * 3, 100)
+    volatility = np.minimum(total_mentions * 2, 100)
+
+    temperatures = (
+        mention_freq * weights['mention_frequency'] +
+        recent_activity * weights['recent_activity'] +
+        engagement * weights['engagement_score'] +
+        volatility * weights['sentiment_volatility']
+    )
+    temperatures = np.where(unique_posts > 0, temperatures, 0)
+
+    # Python's round() so ties land on the same tenth as calculate_temperature
+    return {celebrity_id: round(float(t), 1) for celebrity_id, t in zip(arrays.celebrity_ids, temperatures)}
+
+def percentile_statuses(temperatures, thresholds):
+    """Status for every temperature, ranked against the whole list
+
+    Same rule as temperature_ranking.rank_statuses (percentile = share of
+    strictly colder celebrities), as array operations.
+    """
+    if not len(temperatures):
+        return []
+
+    values = np.asarray(temperatures, dtype=np.float64)
+    colder = np.searchsorted(np.sort(values), values, side='left')
+    percentiles = (colder / len(values)) * 100
+
+    conditions = [percentiles >= thresholds[status] for status in STATUS_ORDER]
+    return np.select(conditions, STATUS_ORDER, default='freezing').tolist()
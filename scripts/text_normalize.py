@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Text Normalization
+Single-pass HTML entity cleanup shared by the scraper and fix_html_entities.py
+"""
+
+import html
+import re
+from functools import lru_cache
+
+# Leftover entities after html.unescape, in the order the old re.sub chain applied them.
+# Order matters: '&#38;' and '&amp;' produce a new '&' that later entries can still match.
+ENTITY_REPLACEMENTS = [
+    # Numeric entities
+    ('&#8230;', '...'),
+    ('&#8217;', "'"),
+    ('&#8216;', "'"),
+    ('&#8220;', '"'),
+    ('&#8221;', '"'),
+    ('&#8211;', '–'),
+    ('&#8212;', '—'),
+    ('&#38;', '&'),
+    ('&#39;', "'"),
+    ('&#34;', '"'),
+    ('&#60;', '<'),
+    ('&#62;', '>'),
+    # Named entities
+    ('&hellip;', '...'),
+    ('&rsquo;', "'"),
+    ('&lsquo;', "'"),
+    ('&rdquo;', '"'),
+    ('&ldquo;', '"'),
+    ('&ndash;', '–'),
+    ('&mdash;', '—'),
+    ('&amp;', '&'),
+    ('&quot;', '"'),
+    ('&apos;', "'"),
+    ('&lt;', '<'),
+    ('&gt;', '>'),
+]
+
+# One token per '&': an optional '&#38;' / '&amp;' chain plus the entity-like run after it.
+# Bracketed ellipses are matched first, as they were handled before everything else.
+ENTITY_TOKEN = re.compile(r'\[&#8230;\]|\[&hellip;\]|&(?:#38;)?(?:amp;)?[a-zA-Z0-9#]*;?')
+MALFORMED_ENTITY = re.compile(r'[a-zA-Z0-9#]+;?')
+
+@lru_cache(maxsize=4096)
+def resolve_entity(token):
+    """What the sequential replacement chain turns one entity token into"""
+    if token[0] == '[':
+        return '...'
+
+    tail = token[1:]
+    for entity, replacement in ENTITY_REPLACEMENTS:
+        name = entity[1:]
+        if tail.startswith(name):
+            tail = tail[len(name):]
+            if replacement != '&':
+                return replacement + tail
+            # A fresh '&' can still form an entity with the text after it
+
+    # Any remaining malformed entity becomes a space
+    malformed = MALFORMED_ENTITY.match(tail)
+    if malformed:
+        return ' ' + tail[malformed.end():]
+
+    return '&' + tail
+
+def replace_entity(match):
+    return resolve_entity(match.group())
+
+def decode_entities(text):
+    """html.unescape, then one scan for leftover entities, then collapse whitespace"""
+    text = html.unescape(text)
+
+    if '&' in text:
+        text = ENTITY_TOKEN.sub(replace_entity, text)
+
+    return ' '.join(text.split())
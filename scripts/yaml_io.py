@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Shared YAML I/O
+Uses libyaml's C loader and dumper when PyYAML was built with them, falls
+back to the pure-Python ones otherwise, and serializes post front matter in
+the same layout the scraper writes it
+"""
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as BaseDumper
+    HAS_LIBYAML = True
+except ImportError:
+    from yaml import SafeLoader, SafeDumper as BaseDumper
+    HAS_LIBYAML = False
+
+# Wide enough that neither emitter ever folds a title or URL onto a second line
+LINE_WIDTH = 100000
+
+# Front matter values the scraper always writes double-quoted
+DOUBLE_QUOTED_KEYS = ('title', 'source_url')
+
+class DoubleQuoted(str):
+    pass
+
+class SingleQuoted(str):
+    pass
+
+class FlowList(list):
+    pass
+
+class FlowMap(dict):
+    pass
+
+class SafeDumper(BaseDumper):
+    pass
+
+SafeDumper.add_representer(
+    DoubleQuoted, lambda dumper, data: dumper.represent_scalar('tag:yaml.org,2002:str', str(data), style='"'))
+SafeDumper.add_representer(
+    SingleQuoted, lambda dumper, data: dumper.represent_scalar('tag:yaml.org,2002:str', str(data), style="'"))
+SafeDumper.add_representer(
+    FlowList, lambda dumper, data: dumper.represent_sequence('tag:yaml.org,2002:seq', data, flow_style=True))
+SafeDumper.add_representer(
+    FlowMap, lambda dumper, data: dumper.represent_mapping('tag:yaml.org,2002:map', data.items(), flow_style=True))
+
+def load(stream):
+    """yaml.safe_load, through libyaml when available"""
+    return yaml.load(stream, Loader=SafeLoader)
+
+def dump(data, stream=None, sort_keys=True):
+    """Block-style dump for the _data files (the layout they have always had)"""
+    return yaml.dump(data, stream, Dumper=SafeDumper, default_flow_style=False,
+                     sort_keys=sort_keys, width=LINE_WIDTH)
+
+def quote_front_matter(front_matter):
+    """Mark strings with the quoting the scraper's post template uses"""
+    def quote_leaf(value):
+        return SingleQuoted(value) if isinstance(value, str) else value
+
+    quoted = {}
+    for key, value in front_matter.items():
+        if key in DOUBLE_QUOTED_KEYS and isinstance(value, str):
+            value = DoubleQuoted(value)
+        elif isinstance(value, list):
+            value = FlowList(quote_leaf(item) for item in value)
+        elif isinstance(value, dict):
+            value = FlowMap((quote_leaf(k), quote_leaf(v)) for k, v in value.items())
+        quoted[key] = value
+    return quoted
+
+def dump_front_matter(front_matter):
+    """Front matter text in the scraper's layout
+
+    Keys keep their order, tags and mentions stay on one line as flow
+    collections, titles and URLs stay double-quoted and unicode is written
+    as-is, so rewriting a post only changes the lines that actually changed.
+    """
+    return yaml.dump(quote_front_matter(front_matter), Dumper=SafeDumper, default_flow_style=False,
+                     sort_keys=False, allow_unicode=True, width=LINE_WIDTH)